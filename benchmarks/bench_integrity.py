@@ -0,0 +1,86 @@
+"""Referential integrity check over synthetic datasets at full-crawl scale.
+
+Run from the repository root with ``python -m benchmarks.bench_integrity``.
+Tables are generated with the given sizes, a fraction of the events,
+fights and fighters is then dropped, and check_integrity is timed against
+a row-by-row loop over Python sets.
+"""
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from datasets.integrity import check_integrity
+
+
+def synthetic(events: int, fights: int, fighters: int, drop: float, seed: int = 0) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    event_ids = np.array([f"e{i:07d}" for i in range(events)], dtype=object)
+    fight_ids = np.array([f"f{i:08d}" for i in range(fights)], dtype=object)
+    fighter_ids = np.array([f"p{i:07d}" for i in range(fighters)], dtype=object)
+
+    fight_table = pd.DataFrame({
+        "id": fight_ids,
+        "event": event_ids[np.sort(rng.integers(0, events, fights))],
+        "red_id": fighter_ids[rng.integers(0, fighters, fights)],
+        "blue_id": fighter_ids[rng.integers(0, fighters, fights)],
+    })
+    fighter_fights = pd.DataFrame({
+        "fight": np.repeat(fight_ids, 2),
+        "fighter": np.column_stack([fight_table["red_id"], fight_table["blue_id"]]).ravel(),
+        "opponent": np.column_stack([fight_table["blue_id"], fight_table["red_id"]]).ravel(),
+    })
+
+    def keep(size):
+        return rng.random(size) >= drop
+
+    return {
+        "events": pd.DataFrame({"id": event_ids[keep(events)]}),
+        "fights": fight_table[keep(fights)].reset_index(drop=True),
+        "fighters": pd.DataFrame({"id": fighter_ids[keep(fighters)]}),
+        "fighter_fights": fighter_fights,
+    }
+
+
+def loop_check(tables: dict[str, pd.DataFrame]) -> dict[str, list[str]]:
+    ids = {dataset: set(frame["id"]) for dataset, frame in tables.items() if "id" in frame}
+    missing = {"events": {}, "fights": {}, "fighters": {}}
+    for row in tables["fights"].itertuples(index=False):
+        for key, target in ((row.event, "events"), (row.red_id, "fighters"), (row.blue_id, "fighters")):
+            if key not in ids[target]:
+                missing[target][key] = None
+    for row in tables["fighter_fights"].itertuples(index=False):
+        for key, target in ((row.fight, "fights"), (row.fighter, "fighters"), (row.opponent, "fighters")):
+            if key not in ids[target]:
+                missing[target][key] = None
+    referenced = set(tables["fights"]["event"])
+    for id in tables["events"]["id"]:
+        if id not in referenced:
+            missing["events"][id] = None
+    return {dataset: list(keys) for dataset, keys in missing.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", default=10_000, type=int)
+    parser.add_argument("--fights", default=200_000, type=int)
+    parser.add_argument("--fighters", default=50_000, type=int)
+    parser.add_argument("--drop", default=0.01, type=float, help="fraction of rows removed from each table")
+    args = parser.parse_args()
+
+    tables = synthetic(args.events, args.fights, args.fighters, args.drop)
+    rows = sum(len(frame) for frame in tables.values())
+
+    start = time.perf_counter()
+    missing = check_integrity(tables)
+    vectorized = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = loop_check(tables)
+    loop = time.perf_counter() - start
+
+    assert {dataset: set(ids) for dataset, ids in missing.items()} == {dataset: set(ids) for dataset, ids in expected.items()}
+    print(f"{rows} rows, missing: " + ", ".join(f"{len(ids)} {dataset}" for dataset, ids in missing.items()))
+    print(f"check_integrity {vectorized * 1000:8.1f} ms")
+    print(f"row loop        {loop * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
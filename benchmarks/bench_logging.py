@@ -0,0 +1,86 @@
+"""Parse throughput with DEBUG logging on, synchronous versus queued handlers.
+
+Run from the repository root with ``python -m benchmarks.bench_logging``.
+Console output goes to /dev/null and the log file to a temporary directory,
+so only the cost paid by the scraping thread is measured.
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import Mock, patch
+from logging_config import setup_logging, stop_logging
+from scrapers import UFCStatsScraper
+
+FIGHT_PAGE = """
+<html><body>
+<h2 class="b-content__title"><a class="b-link" href="http://www.ufcstats.com/event-details/754968e325d6f60d">UFC Fight Night</a></h2>
+<div class="b-fight-details__persons">
+  <div class="b-fight-details__person">
+    <i class="b-fight-details__person-status">W</i>
+    <h3 class="b-fight-details__person-name"><a href="http://www.ufcstats.com/fighter-details/c21f26bbde777573">Red Fighter</a></h3>
+  </div>
+  <div class="b-fight-details__person">
+    <i class="b-fight-details__person-status">L</i>
+    <h3 class="b-fight-details__person-name"><a href="http://www.ufcstats.com/fighter-details/8a65fd9ba31fd3f7">Blue Fighter</a></h3>
+  </div>
+</div>
+<div class="b-fight-details__fight">
+  <div class="b-fight-details__fight-head"><i class="b-fight-details__fight-title">Light Heavyweight Bout</i></div>
+  <p class="b-fight-details__text">
+    <i class="b-fight-details__text-item_first"><i class="b-fight-details__label">Method:</i> <i>KO/TKO</i></i>
+    <i class="b-fight-details__text-item"><i class="b-fight-details__label">Round:</i> 2</i>
+    <i class="b-fight-details__text-item"><i class="b-fight-details__label">Time:</i> 2:37</i>
+    <i class="b-fight-details__text-item"><i class="b-fight-details__label">Time format:</i> 5 Rnd (5-5-5-5-5)</i>
+  </p>
+</div>
+</body></html>
+"""
+
+
+def run(scraper: UFCStatsScraper, pages: int, misses: int) -> float:
+    soup = scraper.fetch_soup("http://www.ufcstats.com/fight-details/2eecf0c36192e40c")
+    start = time.perf_counter()
+    for _ in range(pages):
+        scraper.scrape_fight("2eecf0c36192e40c", "754968e325d6f60d")
+        for _ in range(misses):
+            try:
+                scraper.parse_Tag_attribute(soup.h2, "data-link")
+            except ValueError:
+                pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--pages", default=500, type=int, help="fight pages to parse per configuration")
+    parser.add_argument("-m", "--misses", default=5, type=int, help="selector misses logged per page")
+    args = parser.parse_args()
+
+    configurations = [
+        ("synchronous", {"queued": False}),
+        ("queued", {"queued": True}),
+        ("queued, rate limited", {"queued": True, "rate_limit": 10}),
+    ]
+    response = Mock(headers={}, encoding="utf-8")
+    response.iter_content.return_value = [FIGHT_PAGE.encode()]
+    stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as workdir, open(os.devnull, "w") as devnull:
+        scraper = UFCStatsScraper(wait_time=1, ignore_errors=False)
+        with patch.object(scraper.session, "get", return_value=response):
+            for label, options in configurations:
+                sys.stderr = devnull
+                try:
+                    setup_logging(os.path.join(workdir, "bench.log"), level=logging.DEBUG, **options)
+                    elapsed = run(scraper, args.pages, args.misses)
+                    stop_logging()
+                finally:
+                    sys.stderr = stderr
+                print(f"{label:<22} {args.pages / elapsed:8.1f} pages/s")
+        logging.getLogger().handlers.clear()
+
+
+if __name__ == "__main__":
+    main()
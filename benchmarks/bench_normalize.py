@@ -0,0 +1,38 @@
+"""Throughput of the normalization stage over the committed tables.
+
+Run from the repository root with ``python -m benchmarks.bench_normalize``.
+Each table is repeated ``--scale`` times to approximate larger scrapes.
+"""
+import argparse
+import time
+import pandas as pd
+from datasets.normalize import NORMALIZERS
+
+TABLES = {
+    "events": "Events.csv",
+    "fights": "Fights.csv",
+    "fighters": "fighters.csv",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-s", "--scale", default=1, type=int, help="times to repeat each table")
+    parser.add_argument("-r", "--repeat", default=5, type=int, help="timed runs per table")
+    args = parser.parse_args()
+
+    for name, file in TABLES.items():
+        data = pd.read_csv(file)
+        data = pd.concat([data] * args.scale, ignore_index=True)
+        normalizer = NORMALIZERS[name]
+
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            normalizer(data)
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:<9} rows={len(data):>8} best={best * 1000:8.2f} ms rows/s={len(data) / best:12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Lookup latency of DataQuery indexes versus full scans.
+
+Run from the repository root with ``python -m benchmarks.bench_query``.
+The committed tables are copied into a temporary directory and repeated
+``--scale`` times with fresh IDs.
+"""
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from datasets import DataController, DataQuery
+
+TABLES = {
+    "events": "Events.csv",
+    "fights": "Fights.csv",
+    "fighters": "fighters.csv",
+    "fighter_fights": "fighter_fights.csv",
+}
+
+
+def scaled(file: str, scale: int, id_columns: list[str]) -> pd.DataFrame:
+    data = pd.read_csv(file)
+    copies = []
+    for copy in range(scale):
+        copies.append(data.assign(**{column: data[column] + f"-{copy}" for column in id_columns}))
+    return pd.concat(copies, ignore_index=True)
+
+
+def per_call(func, keys) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        func(key)
+    return (time.perf_counter() - start) / len(keys) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-s", "--scale", default=1, type=int, help="times to repeat each table")
+    parser.add_argument("-n", "--lookups", default=1000, type=int, help="lookups per query")
+    args = parser.parse_args()
+
+    root = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        scaled(os.path.join(root, TABLES["events"]), args.scale, ["id"]).to_csv(os.path.join(workdir, "events.csv"), index=False)
+        scaled(os.path.join(root, TABLES["fights"]), args.scale, ["id", "event", "red_id", "blue_id"]).to_csv(os.path.join(workdir, "fights.csv"), index=False)
+        scaled(os.path.join(root, TABLES["fighters"]), args.scale, ["id"]).to_csv(os.path.join(workdir, "fighters.csv"), index=False)
+        scaled(os.path.join(root, TABLES["fighter_fights"]), args.scale, ["fight", "fighter", "opponent"]).to_csv(os.path.join(workdir, "fighter_fights.csv"), index=False)
+        os.chdir(workdir)
+        try:
+            controller = DataController(list(TABLES), update=False, direct=False)
+            start = time.perf_counter()
+            query = DataQuery(controller)
+            print(f"built indexes in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+            fights = controller.table("fights")
+            rng = np.random.default_rng(0)
+            fighter_ids = rng.choice(fights["red_id"].to_numpy(), args.lookups).tolist()
+            event_ids = rng.choice(fights["event"].to_numpy(), args.lookups).tolist()
+            prefixes = ["Mc", "Da", "Jo", "Al"] * (args.lookups // 4)
+
+            def scan_fighter(key):
+                return fights[(fights["red_id"] == key) | (fights["blue_id"] == key)]
+
+            def scan_event(key):
+                return fights[fights["event"] == key]
+
+            fighters = controller.table("fighters")
+
+            def scan_name(prefix):
+                return fighters[fighters["name"].str.contains(rf"\b{prefix}", case=False, regex=True)]
+
+            rows = [
+                ("fights for fighter", query.fights_for_fighter, scan_fighter, fighter_ids),
+                ("fights at event", query.fights_at_event, scan_event, event_ids),
+                ("name prefix", query.fighters_by_name, scan_name, prefixes),
+            ]
+            for label, indexed, scan, keys in rows:
+                print(f"{label:<20} indexed={per_call(indexed, keys):9.1f} us  scan={per_call(scan, keys):9.1f} us")
+        finally:
+            for dataset in controller.datasets.values():
+                dataset.tmp_file.close()
+            os.chdir(root)
+
+
+if __name__ == "__main__":
+    main()
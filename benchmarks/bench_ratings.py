@@ -0,0 +1,41 @@
+"""Full replay time of the rating engine over the committed fights.
+
+Run from the repository root with ``python -m benchmarks.bench_ratings``.
+Fights.csv does not record results yet, so red corner results are drawn at
+random; ``--scale`` repeats the fight history with fresh fight IDs.
+"""
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from datasets.ratings import RatingEngine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-s", "--scale", default=1, type=int, help="times to repeat the fight history")
+    args = parser.parse_args()
+
+    events = pd.read_csv("Events.csv")
+    fights = pd.read_csv("Fights.csv")
+    fights = pd.concat(
+        [fights.assign(id=fights["id"] + f"-{copy}") for copy in range(args.scale)], ignore_index=True
+    )
+    rng = np.random.default_rng(0)
+    fights["red_result"] = rng.choice(["win", "loss", "draw"], size=len(fights), p=[0.6, 0.38, 0.02])
+
+    engine = RatingEngine(file="bench_ratings")
+    start = time.perf_counter()
+    applied = engine.replay(fights, events)
+    elapsed = time.perf_counter() - start
+    print(f"replayed {applied} fights for {len(engine)} fighters in {elapsed * 1000:.1f} ms")
+
+    newest_event = fights["event"] == events["id"].iloc[0]
+    engine.replay(fights[~newest_event], events)
+    start = time.perf_counter()
+    applied = engine.update(fights, events)
+    elapsed = time.perf_counter() - start
+    print(f"applied {applied} new fights incrementally in {elapsed * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Memory and throughput of the record path versus the legacy dict path.
+
+Run from the repository root with ``python -m benchmarks.bench_records``.
+"""
+import argparse
+import time
+import tracemalloc
+import pandas as pd
+from datasets.records import Fight, records_to_columns
+
+
+def build_dicts(count: int) -> list[dict]:
+    rows = []
+    for index in range(count):
+        fight_details = {
+            "id": f"{index:016x}",
+            "event": f"{index // 12:016x}",
+            "title": "Lightweight Bout",
+            "method": "Decision - Unanimous",
+        }
+        fighter_details = {}
+        fighter_details |= {"red_id": f"{index * 2:016x}"}
+        fighter_details |= {"blue_id": f"{index * 2 + 1:016x}"}
+        fight_details |= fighter_details
+        fight_details |= {"round": "3", "time": "5:00"}
+        fight_details["weight"] = "Lightweight"
+        rows.append(fight_details)
+    return rows
+
+
+def build_records(count: int) -> list[Fight]:
+    rows = []
+    for index in range(count):
+        fight = Fight(
+            id=f"{index:016x}",
+            event=f"{index // 12:016x}",
+            title="Lightweight Bout",
+            method="Decision - Unanimous",
+        )
+        fight.red_id = f"{index * 2:016x}"
+        fight.blue_id = f"{index * 2 + 1:016x}"
+        fight.round = "3"
+        fight.time = "5:00"
+        fight.weight = "Lightweight"
+        rows.append(fight)
+    return rows
+
+
+def measure(label: str, build, to_frame, count: int):
+    tracemalloc.start()
+    rows = build(count)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+
+    start = time.perf_counter()
+    rows = build(count)
+    built = time.perf_counter()
+    frame = to_frame(rows)
+    end = time.perf_counter()
+    print(
+        f"{label:<8} rows={len(frame):>7} held={held / 2**20:8.2f} MiB "
+        f"build={built - start:6.3f}s to_frame={end - built:6.3f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--count", default=10_000, type=int, help="number of fights")
+    args = parser.parse_args()
+
+    measure("dicts", build_dicts, pd.DataFrame, args.count)
+    measure("records", build_records, lambda rows: pd.DataFrame(records_to_columns(rows)), args.count)
+
+
+if __name__ == "__main__":
+    main()
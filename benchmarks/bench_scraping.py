@@ -0,0 +1,44 @@
+"""End-to-end scraping throughput of main.main against the local stub server.
+
+Run from the repository root with ``python -m benchmarks.bench_scraping``.
+A full bulk run is made in a temporary directory against a synthetic site;
+``--latency`` and ``--error-rate`` are passed on to the stub.
+"""
+import argparse
+import os
+import tempfile
+import time
+import main as scraper_main
+from benchmarks.ufcstats_stub import SyntheticSite, StubServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", default=100, type=int)
+    parser.add_argument("--fights", default=1_000, type=int)
+    parser.add_argument("--fighters", default=400, type=int)
+    parser.add_argument("--latency", default=0.0, type=float, help="seconds added to every response")
+    parser.add_argument("--error-rate", default=0.0, type=float, help="fraction of requests answered with 503")
+    parser.add_argument("--profile", action="store_true", help="also write per-stage profiles to ./bench_profile")
+    args = parser.parse_args()
+
+    site = SyntheticSite(args.events, args.fights, args.fighters)
+    root = os.getcwd()
+    argv = ["-b", "-i", "-w", "10"]
+    if args.profile:
+        argv += ["--profile", os.path.join(root, "bench_profile")]
+
+    with tempfile.TemporaryDirectory() as workdir, StubServer(site, latency=args.latency, error_rate=args.error_rate) as stub:
+        os.chdir(workdir)
+        try:
+            start = time.perf_counter()
+            scraper_main.main(argv + ["--base-url", stub.url], log=False)
+            elapsed = time.perf_counter() - start
+        finally:
+            os.chdir(root)
+
+    print(f"{args.events} events, {args.fights} fights, {args.fighters} fighters")
+    print(f"{stub.requests} requests ({stub.errors} failed) in {elapsed:.1f} s, {stub.requests / elapsed:.0f} pages/s")
+
+if __name__ == "__main__":
+    main()
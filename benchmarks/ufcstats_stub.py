@@ -0,0 +1,366 @@
+"""Local stand-in for ufcstats.com serving synthetic pages in the site's markup.
+
+Run from the repository root with ``python -m benchmarks.ufcstats_stub`` and
+point the scraper at it with ``python main.py --base-url http://127.0.0.1:8000/``.
+Pages are generated on request from the entity index encoded in each ID, so
+large sites cost little memory. ``--latency`` delays every response and
+``--error-rate`` answers that fraction of requests with a 503. Responses
+are gzipped for clients that accept it.
+"""
+import argparse
+import datetime
+import gzip
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import numpy as np
+
+PAGE_SIZE = 25
+WEIGHTS = ["Flyweight", "Bantamweight", "Featherweight", "Lightweight", "Welterweight", "Middleweight", "Light Heavyweight", "Heavyweight"]
+METHODS = ["KO/TKO", "Submission", "Decision - Unanimous", "Decision - Split"]
+STANCES = ["Orthodox", "Southpaw", "Switch"]
+FIRST_DATE = datetime.date(2025, 8, 23)
+
+LISTING_ROW = """<tr class="b-statistics__table-row">
+<td class="b-statistics__table-col"><i class="b-statistics__table-content"><a class="b-link b-link_style_black" href="{base}{path}{id}">{text}</a></i></td>
+</tr>"""
+
+FIGHTER_LISTING_HEAD = """<tr class="b-statistics__table-row"><td class="b-statistics__table-col_type_clear" colspan="11"></td></tr>"""
+
+FIGHTER_LISTING_ROW = """<tr class="b-statistics__table-row">
+<td class="b-statistics__table-col"><a class="b-link b-link_style_black" href="{base}fighter-details/{id}">{first}</a></td>
+<td class="b-statistics__table-col"><a class="b-link b-link_style_black" href="{base}fighter-details/{id}">{last}</a></td>
+<td class="b-statistics__table-col"><a class="b-link b-link_style_black" href="{base}fighter-details/{id}"></a></td>
+<td class="b-statistics__table-col">5' {inches}"</td>
+<td class="b-statistics__table-col">{pounds} lbs.</td>
+<td class="b-statistics__table-col">{reach}.0"</td>
+<td class="b-statistics__table-col">{stance}</td>
+<td class="b-statistics__table-col">{win}</td>
+<td class="b-statistics__table-col">{loss}</td>
+<td class="b-statistics__table-col">{draw}</td>
+<td class="b-statistics__table-col"></td>
+</tr>"""
+
+EVENT_ROW = """<tr class="b-fight-details__table-row b-fight-details__table-row__hover js-fight-details-click" data-link="{base}fight-details/{id}">
+<td class="b-fight-details__table-col">win</td>
+<td class="b-fight-details__table-col l-page_align_left"><p><a href="{base}fighter-details/{red}">Red</a></p><p><a href="{base}fighter-details/{blue}">Blue</a></p></td>
+<td class="b-fight-details__table-col">0</td><td class="b-fight-details__table-col">0</td>
+<td class="b-fight-details__table-col">0</td><td class="b-fight-details__table-col">0</td>
+<td class="b-fight-details__table-col l-page_align_left"><p class="b-fight-details__table-text">{weight}</p></td>
+<td class="b-fight-details__table-col l-page_align_left"><p class="b-fight-details__table-text">{method}</p></td>
+<td class="b-fight-details__table-col">{round}</td><td class="b-fight-details__table-col">{time}</td>
+</tr>"""
+
+EVENT_PAGE = """<html><body>
+<h2 class="b-content__title"><span class="b-content__title-highlight">{title}</span></h2>
+<ul class="b-list__box-list">
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">Date:</i> {date}</li>
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">Location:</i> Las Vegas, Nevada, USA</li>
+</ul>
+<table class="b-fight-details__table"><tbody class="b-fight-details__table-body">
+{rows}
+</tbody></table>
+</body></html>"""
+
+FIGHT_PERSON = """<div class="b-fight-details__person">
+<i class="b-fight-details__person-status">{status}</i>
+<div class="b-fight-details__person-text"><h3 class="b-fight-details__person-name"><a class="b-link" href="{base}fighter-details/{id}">{name}</a></h3></div>
+</div>"""
+
+FIGHT_PAGE = """<html><body>
+<h2 class="b-content__title"><a class="b-link" href="{base}event-details/{event}">{event_title}</a></h2>
+<div class="b-fight-details__persons">
+{red}
+{blue}
+</div>
+<div class="b-fight-details__fight">
+<div class="b-fight-details__fight-head"><i class="b-fight-details__fight-title">{weight} Bout</i></div>
+<p class="b-fight-details__text">
+<i class="b-fight-details__text-item_first"><i class="b-fight-details__label">Method:</i> <i>{method}</i></i>
+<i class="b-fight-details__text-item"><i class="b-fight-details__label">Round:</i> {round}</i>
+<i class="b-fight-details__text-item"><i class="b-fight-details__label">Time:</i> {time}</i>
+<i class="b-fight-details__text-item"><i class="b-fight-details__label">Time format:</i> 3 Rnd (5-5-5)</i>
+</p>
+</div>
+</body></html>"""
+
+FIGHTER_ROW = """<tr class="b-fight-details__table-row b-fight-details__table-row__hover js-fight-details-click" data-link="{base}fight-details/{fight}">
+<td class="b-fight-details__table-col"><p class="b-fight-details__table-text"><i class="b-flag__text">{result}</i></p></td>
+<td class="b-fight-details__table-col l-page_align_left"><p><a href="{base}fighter-details/{id}">{name}</a></p><p><a href="{base}fighter-details/{opponent}">Opponent</a></p></td>
+</tr>"""
+
+FIGHTER_PAGE = """<html><body>
+<h2 class="b-content__title">
+<span class="b-content__title-highlight">{name}</span>
+<span class="b-content__title-record">Record: {win}-{loss}-{draw}</span>
+</h2>
+<div class="b-list__info-box"><ul class="b-list__box-list">
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">Height:</i> 5' {inches}"</li>
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">Weight:</i> {pounds} lbs.</li>
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">Reach:</i> {reach}"</li>
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">STANCE:</i> {stance}</li>
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">DOB:</i> Jan 01, 1990</li>
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">SLpM:</i> 3.50</li>
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">Str. Acc.:</i> 45%</li>
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">SApM:</i> 2.90</li>
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">Str. Def:</i> 55%</li>
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">TD Avg.:</i> 1.20</li>
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">TD Acc.:</i> 40%</li>
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">TD Def.:</i> 70%</li>
+<li class="b-list__box-list-item"><i class="b-list__box-item-title">Sub. Avg.:</i> 0.5</li>
+</ul></div>
+<table class="b-fight-details__table"><tbody class="b-fight-details__table-body">
+{rows}
+</tbody></table>
+</body></html>"""
+
+PAGE = "<html><body><table><tbody>{rows}</tbody></table></body></html>"
+
+
+class SyntheticSite():
+    """Deterministic events, fights and fighters for the stub to render.
+
+    Fights are spread evenly over the events, newest event first, and each
+    fight pairs two different fighters. IDs carry their entity index so
+    pages can be generated without a lookup table.
+    """
+    PREFIXES = {"events": "e0", "fights": "f0", "fighters": "d0"}
+
+    def __init__(self, events: int, fights: int, fighters: int):
+        if fighters < 2 or events < 1 or fights < events:
+            raise ValueError("need at least one fight per event and two fighters")
+        self.events = events
+        self.fights = fights
+        self.fighters = fighters
+
+        index = np.arange(fights)
+        self.event_of = index * events // fights
+        self.red = (index * 7) % fighters
+        self.blue = (self.red + 1 + index % (fighters - 1)) % fighters
+        # 0: red wins, 1: blue wins, 2: draw
+        self.outcome = np.where(index % 97 == 0, 2, np.where(index % 5 == 4, 1, 0))
+
+        corners = np.concatenate([self.red, self.blue])
+        self.history = np.argsort(corners, kind="stable") % fights
+        self.history_start = np.searchsorted(np.sort(corners, kind="stable"), np.arange(fighters + 1))
+        results = np.concatenate([self.outcome, np.choose(self.outcome, [1, 0, 2])])
+        self.record = np.stack([np.bincount(corners[results == result], minlength=fighters) for result in (0, 1, 2)], axis=1)
+
+    def id(self, kind: str, index: int) -> str:
+        return f"{self.PREFIXES[kind]}{index:014x}"
+
+    def index(self, kind: str, id: str) -> int | None:
+        if not id.startswith(self.PREFIXES[kind]):
+            return None
+        try:
+            index = int(id[2:], 16)
+        except ValueError:
+            return None
+        return index if index < getattr(self, kind) else None
+
+    def ids(self, kind: str) -> list[str]:
+        return [self.id(kind, index) for index in range(getattr(self, kind))]
+
+    def fighter_name(self, index: int) -> tuple[str, str]:
+        return f"Fighter{index}", chr(97 + index % 26).upper() + f"last{index}"
+
+    def fighter_bio(self, index: int) -> dict:
+        return {"inches": index % 12, "pounds": 125 + index % 140, "reach": 64 + index % 16, "stance": STANCES[index % len(STANCES)]}
+
+    def event_title(self, index: int) -> str:
+        return f"UFC Synthetic {self.events - index}"
+
+    def event_date(self, index: int) -> str:
+        return (FIRST_DATE - datetime.timedelta(weeks=index)).strftime("%B %d, %Y")
+
+    def fights_of(self, event: int) -> range:
+        return range(-(-event * self.fights // self.events), -(-(event + 1) * self.fights // self.events))
+
+    def fight_fields(self, fight: int) -> dict:
+        return {
+            "weight": WEIGHTS[fight % len(WEIGHTS)],
+            "method": "Decision - Majority" if self.outcome[fight] == 2 else METHODS[fight % len(METHODS)],
+            "round": 3 if fight % 3 else 1,
+            "time": "5:00" if fight % 3 else f"{1 + fight % 4}:{fight % 60:02d}",
+        }
+
+    # Pages
+
+    def event_listing(self, base: str, page: str) -> str:
+        indices = range(self.events) if page == "all" else range((int(page) - 1) * PAGE_SIZE, min(int(page) * PAGE_SIZE, self.events))
+        rows = "".join(LISTING_ROW.format(base=base, path="event-details/", id=self.id("events", i), text=self.event_title(i)) for i in indices)
+        return PAGE.format(rows=rows)
+
+    def fighter_listing(self, base: str, char: str, page: str) -> str:
+        letter = ord(char.lower()[:1] or "?") - 97
+        if not 0 <= letter < 26:
+            return PAGE.format(rows="")
+        fighters = range(letter, self.fighters, 26)
+        if page != "all":
+            fighters = fighters[(int(page) - 1) * PAGE_SIZE:int(page) * PAGE_SIZE]
+        rows = "".join(
+            FIGHTER_LISTING_ROW.format(
+                base=base, id=self.id("fighters", i), first=self.fighter_name(i)[0], last=self.fighter_name(i)[1],
+                win=self.record[i][0], loss=self.record[i][1], draw=self.record[i][2], **self.fighter_bio(i),
+            )
+            for i in fighters
+        )
+        return PAGE.format(rows=FIGHTER_LISTING_HEAD + rows if rows else "")
+
+    def event_page(self, base: str, event: int) -> str:
+        rows = "".join(
+            EVENT_ROW.format(
+                base=base, id=self.id("fights", fight),
+                red=self.id("fighters", self.red[fight]), blue=self.id("fighters", self.blue[fight]),
+                **self.fight_fields(fight),
+            )
+            for fight in self.fights_of(event)
+        )
+        return EVENT_PAGE.format(title=self.event_title(event), date=self.event_date(event), rows=rows)
+
+    def fight_page(self, base: str, fight: int) -> str:
+        red, blue = ["W", "L", "D"][self.outcome[fight]], ["L", "W", "D"][self.outcome[fight]]
+        event = self.event_of[fight]
+        return FIGHT_PAGE.format(
+            base=base,
+            event=self.id("events", event),
+            event_title=self.event_title(event),
+            red=FIGHT_PERSON.format(base=base, status=red, id=self.id("fighters", self.red[fight]), name=" ".join(self.fighter_name(self.red[fight]))),
+            blue=FIGHT_PERSON.format(base=base, status=blue, id=self.id("fighters", self.blue[fight]), name=" ".join(self.fighter_name(self.blue[fight]))),
+            **self.fight_fields(fight),
+        )
+
+    def fighter_page(self, base: str, fighter: int) -> str:
+        name = " ".join(self.fighter_name(fighter))
+        rows = []
+        for fight in sorted(self.history[self.history_start[fighter]:self.history_start[fighter + 1]]):
+            red = self.red[fight] == fighter
+            outcome = self.outcome[fight]
+            result = "draw" if outcome == 2 else "win" if (outcome == 0) == red else "loss"
+            opponent = self.blue[fight] if red else self.red[fight]
+            rows.append(FIGHTER_ROW.format(base=base, fight=self.id("fights", fight), result=result, id=self.id("fighters", fighter), name=name, opponent=self.id("fighters", opponent)))
+        win, loss, draw = self.record[fighter]
+        return FIGHTER_PAGE.format(name=name, win=win, loss=loss, draw=draw, rows="".join(rows), **self.fighter_bio(fighter))
+
+    def render(self, base: str, url: str) -> str | None:
+        """The page for a request path and query, or None if there is no such page."""
+        parts = urlsplit(url)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        path = parts.path.strip("/")
+        if path == "statistics/events/completed":
+            return self.event_listing(base, query.get("page", "1"))
+        if path == "statistics/fighters":
+            return self.fighter_listing(base, query.get("char", "a"), query.get("page", "1"))
+
+        kind, _, id = path.partition("/")
+        entity = {"event-details": "events", "fight-details": "fights", "fighter-details": "fighters"}.get(kind)
+        index = self.index(entity, id) if entity else None
+        if index is None:
+            return None
+        return {"events": self.event_page, "fights": self.fight_page, "fighters": self.fighter_page}[entity](base, index)
+
+
+class StubServer():
+    """Serves a SyntheticSite over HTTP from a background thread.
+
+    Use as a context manager; ``url`` is the base URL to hand the scraper.
+    """
+    def __init__(self, site: SyntheticSite, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, error_rate: float = 0.0, seed: int = 0):
+        self.site = site
+        self.latency = latency
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self.thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this each keep-alive response waits on a delayed ACK
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                with stub.lock:
+                    stub.requests += 1
+                    failed = stub.random.random() < stub.error_rate
+                    stub.errors += failed
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if failed:
+                    self.respond(503, "<html><body>Service Unavailable</body></html>")
+                    return
+                page = stub.site.render(stub.url, self.path)
+                if page is None:
+                    self.respond(404, "<html><body>Not Found</body></html>")
+                else:
+                    self.respond(200, page)
+
+            def respond(self, status: int, body: str):
+                data = body.encode()
+                gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+                if gzipped:
+                    data = gzip.compress(data, compresslevel=1)
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                if gzipped:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "StubServer":
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", default=10_000, type=int)
+    parser.add_argument("--fights", default=200_000, type=int)
+    parser.add_argument("--fighters", default=50_000, type=int)
+    parser.add_argument("--port", default=8000, type=int)
+    parser.add_argument("--latency", default=0.0, type=float, help="seconds added to every response")
+    parser.add_argument("--error-rate", default=0.0, type=float, help="fraction of requests answered with 503")
+    args = parser.parse_args()
+
+    stub = StubServer(SyntheticSite(args.events, args.fights, args.fighters), port=args.port, latency=args.latency, error_rate=args.error_rate)
+    print(f"serving {args.events} events, {args.fights} fights and {args.fighters} fighters at {stub.url}")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
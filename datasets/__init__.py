@@ -1,2 +1,10 @@
 from .dataset import Dataset
 from .controller import DataController
+from .records import Record, Event, Fight, Fighter, FighterFight, records_to_columns
+from .ratings import RatingEngine, fight_outcomes
+from .query import DataQuery
+from .scheduler import RefreshScheduler
+from .derive import derive_fighter_fights
+from .integrity import check_integrity
+from .changefeed import ChangeFeed
+from .listing import diff_fighter_listing, LISTING_COLUMNS
\ No newline at end of file
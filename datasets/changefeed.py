@@ -0,0 +1,131 @@
+import json
+import logging
+import os
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+INSERT, UPDATE, DELETE = "insert", "update", "delete"
+
+
+class ChangeFeed():
+    """Net row changes of one run, written as a delta file per dataset.
+
+    Changes are tracked by key: a row inserted and then updated in the same
+    run is an insert, and a row inserted and then deleted is dropped from
+    the feed. On save each dataset's changes are written to
+    ``<directory>/<run>/<dataset>.jsonl``, one ``{"op": ..., <row>}``
+    object per line (deletes carry only the key columns), and
+    ``manifest.json`` next to them is rewritten with per-dataset counts.
+    Run IDs default to the start time to the microsecond, and a run whose
+    directory already exists raises FileExistsError rather than mixing its
+    files with another run's.
+
+    Given a snapshot of the data as loaded, updates that leave a row's CSV
+    form unchanged are dropped, so re-scraping an unchanged entity does not
+    show up in the feed.
+    """
+    def __init__(self, directory: str, run: str | None = None):
+        started = pd.Timestamp.now(tz="UTC")
+        self.run = run or started.strftime("%Y%m%dT%H%M%S.%fZ")
+        self.directory = os.path.join(directory, self.run)
+        self.created = False
+        self.changes: dict[str, dict] = {}
+        self.baselines: dict[str, pd.Series] = {}
+        self.manifest = {"run": self.run, "started": started.isoformat(), "finished": None, "datasets": {}}
+
+    @staticmethod
+    def _keys(data: pd.DataFrame, key: list[str]) -> pd.Index:
+        if len(key) > 1:
+            return pd.MultiIndex.from_frame(data[key].astype(object))
+        return pd.Index(data[key[0]].astype(object))
+
+    @staticmethod
+    def _row_hashes(data: pd.DataFrame) -> np.ndarray | None:
+        lines = data.to_csv(index=False, header=False).splitlines()
+        # Quoted newlines would split a row across lines
+        if len(lines) != len(data):
+            return None
+        return pd.util.hash_array(np.array(lines, dtype=object))
+
+    def snapshot(self, dataset: str, data: pd.DataFrame, key: list[str]):
+        """Remember the rows of ``dataset`` as loaded, to tell real updates from rewrites."""
+        if data.empty or not set(key) <= set(data.columns):
+            return
+        hashes = self._row_hashes(data)
+        if hashes is not None:
+            self.baselines[dataset] = pd.Series(hashes, index=self._keys(data, key))
+
+    def record(self, dataset: str, op: str, keys: list):
+        changes = self.changes.setdefault(dataset, {})
+        for key in keys:
+            previous = changes.get(key)
+            if previous == INSERT and op == DELETE:
+                del changes[key]
+            elif previous == INSERT and op == UPDATE:
+                continue
+            elif previous == DELETE and op == INSERT:
+                changes[key] = UPDATE
+            else:
+                changes[key] = op
+
+    def _make_directory(self):
+        if not self.created:
+            os.makedirs(self.directory)
+            self.created = True
+
+    def counts(self, dataset: str) -> dict[str, int]:
+        ops = pd.Series(list(self.changes.get(dataset, {}).values()), dtype=object)
+        return {op: int((ops == op).sum()) for op in (INSERT, UPDATE, DELETE)}
+
+    def write(self, dataset: str, data: pd.DataFrame, key: list[str]):
+        """Write the delta of ``dataset`` using the row values in ``data`` and update the manifest."""
+        changes = self.changes.get(dataset, {})
+        file = None
+        if changes:
+            self._make_directory()
+            keys = list(changes)
+            ops = pd.Series(list(changes.values()), dtype=object)
+            positions = pd.Series(range(len(data)), index=self._keys(data, key))
+            positions = positions[~positions.index.duplicated(keep="last")]
+            wanted = pd.MultiIndex.from_tuples(keys, names=key) if len(key) > 1 else pd.Index(keys, dtype=object)
+            found = positions.reindex(wanted).to_numpy()
+
+            is_delete = (ops == DELETE).to_numpy()
+            present = ~is_delete & pd.notna(found)
+            rows = data.iloc[found[present].astype(int)].reset_index(drop=True)
+            row_ops = ops[present].to_numpy()
+
+            baseline = self.baselines.get(dataset)
+            hashes = self._row_hashes(rows) if baseline is not None else None
+            if hashes is not None:
+                baseline = baseline[~baseline.index.duplicated(keep="last")]
+                before = baseline.reindex(wanted[present], fill_value=0).to_numpy()
+                unchanged = (row_ops == UPDATE) & (before == hashes)
+                present_keys = [keys[i] for i in present.nonzero()[0]]
+                for position in unchanged.nonzero()[0]:
+                    del changes[present_keys[position]]
+                rows, row_ops = rows[~unchanged].reset_index(drop=True), row_ops[~unchanged]
+            rows.insert(0, "op", row_ops)
+            deleted_keys = [keys[i] for i in is_delete.nonzero()[0]]
+            deleted = pd.DataFrame(deleted_keys if len(key) > 1 else {key[0]: deleted_keys}, columns=key)
+            deleted.insert(0, "op", DELETE)
+
+            # Written separately so deletes are not padded with null columns
+            lines = "".join(frame.to_json(orient="records", lines=True) for frame in (rows, deleted) if len(frame))
+            if lines:
+                file = dataset + ".jsonl"
+                with open(os.path.join(self.directory, file), "w") as f:
+                    f.write(lines)
+        # An earlier save of this run may have written changes that turned out to be no-ops
+        stale = os.path.join(self.directory, dataset + ".jsonl")
+        if file is None and os.path.exists(stale):
+            os.remove(stale)
+
+        self.manifest["datasets"][dataset] = {"file": file, "key": key, "rows": len(data), **self.counts(dataset)}
+        self.manifest["finished"] = pd.Timestamp.now(tz="UTC").isoformat()
+        self._make_directory()
+        with open(os.path.join(self.directory, "manifest.json"), "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        logger.debug(f"Wrote {len(changes)} changes of {dataset} to {self.directory}")
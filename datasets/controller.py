@@ -1,21 +1,111 @@
 from .dataset import Dataset
-from typing import Callable
+from .normalize import NORMALIZERS
+from .partition import Partitioning, event_dates, fight_dates
+from .changefeed import ChangeFeed, INSERT, UPDATE, DELETE
+from .records import Record
+from typing import Callable, Iterator
+import os
+import pandas as pd
+
+# Columns identifying a row, where a dataset has no "id" column
+KEYS = {"fighter_fights": ["fight","fighter"]}
 
 class DataController():
-    def __init__(self,datasets:list[str],update:bool,direct:bool):
+    def __init__(self,datasets:list[str],update:bool,direct:bool,partition_dir:str|None=None,changefeed:ChangeFeed|None=None):
         self.datasets = {}
+        partitions = self._partitions(partition_dir) if partition_dir else {}
         for dataset in datasets:
-            self.datasets[dataset] = Dataset(dataset,update)
+            self.datasets[dataset] = Dataset(dataset,update,normalizer=NORMALIZERS.get(dataset),partitioning=partitions.get(dataset))
         self.direct = direct
-    def insert(self,dataset:str,data:dict[str,str]|list[dict[str,str]],prepend:bool=False):
+        self.listeners: list[Callable[[str,slice|None],None]] = []
+        self.changefeed = changefeed
+        if changefeed is not None:
+            for dataset in datasets:
+                # Compare against the loaded rows as they would be saved
+                data = self.datasets[dataset].data
+                normalizer = self.datasets[dataset].normalizer
+                changefeed.snapshot(dataset,normalizer(data) if normalizer is not None else data,self.key(dataset))
+
+    def _partitions(self,partition_dir:str) -> dict[str,Partitioning]:
+        """Events and fights split by event year; fights look their dates up in the events dataset."""
+        return {
+            "events": Partitioning(os.path.join(partition_dir,"events"),event_dates),
+            "fights": Partitioning(os.path.join(partition_dir,"fights"),lambda data: fight_dates(data,self.table("events"))),
+        }
+
+    def add_listener(self,listener:Callable[[str,slice|None],None]):
+        """Register ``listener(dataset, rows)`` to be called after a dataset's rows change.
+
+        ``rows`` is the positional slice of appended rows, or None when existing
+        rows were modified or shifted.
+        """
+        self.listeners.append(listener)
+
+    def _notify(self,dataset:str,rows:slice|None):
+        for listener in self.listeners:
+            listener(dataset,rows)
+
+    def key(self,dataset:str) -> list[str]:
+        return KEYS.get(dataset,["id"])
+
+    def _row_keys(self,dataset:str,rows:slice|pd.DataFrame) -> list:
+        frame = rows if isinstance(rows,pd.DataFrame) else self.datasets[dataset].data.iloc[rows]
+        key = self.key(dataset)
+        if len(key) == 1:
+            return frame[key[0]].tolist()
+        return list(frame[key].itertuples(index=False,name=None))
+
+    def _record(self,dataset:str,op:str,keys:list):
+        if self.changefeed is not None and keys:
+            self.changefeed.record(dataset,op,keys)
+
+    def insert(self,dataset:str,data:dict[str,str]|list[dict[str,str]]|pd.DataFrame,prepend:bool=False):
         if dataset not in self.datasets:
             raise TypeError(f"no dataset {dataset}")
-        if isinstance(data,dict):
-            self.datasets[dataset].add_row(data,prepend)
-        else:
+        if isinstance(data,(list,pd.DataFrame)):
             self.datasets[dataset].add_rows(data,prepend)
+            count = len(data)
+        else:
+            self.datasets[dataset].add_row(data,prepend)
+            count = 1
+        total = len(self.datasets[dataset].data)
+        self._record(dataset,INSERT,self._row_keys(dataset,slice(0,count) if prepend else slice(total-count,total)))
+        self._notify(dataset,None if prepend else slice(total-count,total))
         self.save(dataset,self.direct)
         return True
+
+    def upsert(self,dataset:str,data:list[dict[str,str]],key:str="id") -> int:
+        """Update rows that already exist by ``key`` and append the others; returns the number updated."""
+        if dataset not in self.datasets:
+            raise TypeError(f"no dataset {dataset}")
+        before = len(self.datasets[dataset].data)
+        updated = self.datasets[dataset].upsert_rows(data,key)
+        total = len(self.datasets[dataset].data)
+        if self.changefeed is not None:
+            inserted = self._row_keys(dataset,slice(before,total))
+            new = set(inserted)
+            keys = [row.to_dict()[key] if isinstance(row,Record) else row[key] for row in data]
+            self._record(dataset,UPDATE,[id for id in dict.fromkeys(keys) if id not in new])
+            self._record(dataset,INSERT,inserted)
+        self._notify(dataset,None if updated else slice(before,total))
+        self.save(dataset,self.direct)
+        return updated
+
+    def delete(self,dataset:str,keys:list,key:str="id") -> int:
+        """Remove the rows whose ``key`` is in ``keys``; returns the number removed.
+
+        ``key`` need not be the dataset's own key, e.g. all fighter_fights rows
+        of some fights can be removed by "fight".
+        """
+        if dataset not in self.datasets:
+            raise TypeError(f"no dataset {dataset}")
+        removed = self.datasets[dataset].delete_rows(keys,key)
+        if len(removed):
+            self._record(dataset,DELETE,list(dict.fromkeys(self._row_keys(dataset,removed))))
+            self._notify(dataset,None)
+        self.save(dataset,self.direct)
+        return len(removed)
+
     def drop(self,dataset:str,column:str|list):
         if dataset not in self.datasets:
             raise TypeError(f"no dataset {dataset}")
@@ -35,6 +125,21 @@ class DataController():
             raise TypeError(f"no dataset {dataset}")
         return self.datasets[dataset][key]
 
+    def iter_rows(self,dataset:str,key:str|list[str]|None=None,chunksize:int=1000) -> Iterator[dict]:
+        if dataset not in self.datasets:
+            raise TypeError(f"no dataset {dataset}")
+        return self.datasets[dataset].iter_rows(key,chunksize)
+
+    def iter_chunks(self,dataset:str,key:str|list[str]|None=None,chunksize:int=1000) -> Iterator[pd.DataFrame]:
+        if dataset not in self.datasets:
+            raise TypeError(f"no dataset {dataset}")
+        return self.datasets[dataset].iter_chunks(key,chunksize)
+
+    def table(self,dataset:str)->pd.DataFrame:
+        if dataset not in self.datasets:
+            raise TypeError(f"no dataset {dataset}")
+        return self.datasets[dataset].data
+
     def get_early_stopping(self,dataset:str)->Callable:
         if dataset not in self.datasets:
             raise TypeError(f"no dataset {dataset}")
@@ -44,4 +149,6 @@ class DataController():
         if dataset not in self.datasets:
             raise TypeError(f"no dataset {dataset}")
         
-        self.datasets[dataset].save(direct)
\ No newline at end of file
+        self.datasets[dataset].save(direct)
+        if direct and self.changefeed is not None:
+            self.changefeed.write(dataset,self.datasets[dataset].data,self.key(dataset))
\ No newline at end of file
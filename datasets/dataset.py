@@ -1,15 +1,25 @@
+import numpy as np
 import pandas as pd
 import os
 import logging
 import tempfile
+from typing import Any, Callable, Iterator
+from .records import Record, records_to_columns
+from .partition import Partitioning
 logger = logging.getLogger(__name__)
 class Dataset():
-    def __init__(self, file: str, update:bool, columns: list = ["id"]):
+    def __init__(self, file: str, update:bool, columns: list = ["id"], normalizer:Callable[[pd.DataFrame],pd.DataFrame]|None = None, partitioning:Partitioning|None = None):
         self.file = file
         self.update = update
+        self.normalizer = normalizer
+        self.partitioning = partitioning
 
 
-        if os.path.exists(self.file+".csv"):
+        if self.partitioning is not None and self.partitioning.exists():
+            logger.debug(f"Loading data from partitions in {self.partitioning.directory}")
+            self.data = self.partitioning.read()
+            self.columns = self.data.columns.tolist() or columns
+        elif os.path.exists(self.file+".csv"):
             logger.debug(f"Loading data from {self.file}")
             self.data = pd.read_csv(self.file+".csv")
             self.columns = self.data.columns.tolist()
@@ -31,6 +41,39 @@ class Dataset():
             return self.data[[key]].to_dict("records")
         return self.data[key].to_dict("records")
         
+    def _select(self, columns: str | list | None) -> pd.DataFrame:
+        if columns is None:
+            return self.data
+        return self.data[[columns] if isinstance(columns, str) else columns]
+
+    def iter_chunks(self, columns: str | list | None = None, chunksize: int = 1000) -> Iterator[pd.DataFrame]:
+        """Yield the dataset (or some of its columns) as DataFrame slices of ``chunksize`` rows."""
+        if chunksize < 1:
+            raise ValueError("Chunk size must be positive")
+        data = self._select(columns)
+        for start in range(0, len(data), chunksize):
+            yield data.iloc[start:start + chunksize]
+
+    def iter_rows(self, columns: str | list | None = None, chunksize: int = 1000) -> Iterator[dict[str, Any]]:
+        """Yield rows as dicts, materializing only ``chunksize`` rows at a time."""
+        for chunk in self.iter_chunks(columns, chunksize):
+            yield from chunk.to_dict("records")
+
+    def iter_column(self, column: str, chunksize: int = 1000) -> Iterator[Any]:
+        """Yield the values of one column."""
+        for chunk in self.iter_chunks(column, chunksize):
+            yield from chunk[column].tolist()
+
+    def export_csv(self, path: str, columns: str | list | None = None, chunksize: int = 1000) -> int:
+        """Write the dataset to ``path`` chunk by chunk; returns the number of rows written."""
+        written = 0
+        with open(path, "w", newline="") as f:
+            self._select(columns).iloc[:0].to_csv(f, index=False)
+            for chunk in self.iter_chunks(columns, chunksize):
+                chunk.to_csv(f, index=False, header=False)
+                written += len(chunk)
+        return written
+
     def __contains__(self,key:str):
         return key in self.data
     
@@ -47,11 +90,73 @@ class Dataset():
             return False
         return id in self.data['id'].values
     
-    def add_row(self, row:dict[str,str],prepend:bool=False):
+    def add_row(self, row:dict[str,str]|Record,prepend:bool=False):
         """Add a new row to the dataset."""
-        
-        new_data = pd.DataFrame([row])
+        if isinstance(row,Record):
+            row = row.to_dict()
+
+        self._concat(pd.DataFrame([row]),prepend)
+
+    def add_rows(self,rows:list[dict[str,str]]|list[Record]|pd.DataFrame,prepend:bool=False):
+        """Add several rows to the dataset with a single concatenation."""
+        if isinstance(rows,pd.DataFrame):
+            if not rows.empty:
+                self._concat(rows.reset_index(drop=True),prepend)
+            return
+        if not isinstance(rows,list):
+            raise ValueError("Rows must be a list")
+        if not rows:
+            return
+
+        self._concat(self._frame(rows),prepend)
 
+    def upsert_rows(self,rows:list[dict[str,str]]|list[Record],key:str="id") -> int:
+        """Overwrite rows whose key already exists and append the rest.
+
+        Returns the number of existing rows that were updated.
+        """
+        if not isinstance(rows,list):
+            raise ValueError("Rows must be a list")
+        if not rows:
+            return 0
+
+        new_data = self._frame(rows)
+        if self.data.empty or key not in self.data.columns:
+            self._concat(new_data,False)
+            return 0
+
+        lookup = pd.Series(np.arange(len(self.data)),index=self.data[key].to_numpy())
+        lookup = lookup[~lookup.index.duplicated()]
+        positions = lookup.reindex(new_data[key].to_numpy()).fillna(-1).astype(int).to_numpy()
+        existing = positions >= 0
+
+        if existing.any():
+            updates = new_data[existing]
+            for column in updates.columns:
+                # Scraped values are strings; loaded columns may be typed
+                if column not in self.data.columns or self.data[column].dtype != object:
+                    self.data[column] = self.data.get(column,pd.Series(index=self.data.index)).astype(object)
+                self.data.iloc[positions[existing],self.data.columns.get_loc(column)] = updates[column].to_numpy(dtype=object)
+        if not existing.all():
+            self._concat(new_data[~existing],False)
+        return int(existing.sum())
+
+    def delete_rows(self,keys:list,key:str="id") -> pd.DataFrame:
+        """Remove the rows whose ``key`` is in ``keys``; returns the removed rows."""
+        if self.data.empty or key not in self.data.columns:
+            return self.data.iloc[:0]
+        matches = self.data[key].isin(keys).to_numpy()
+        removed = self.data[matches]
+        if len(removed):
+            self.data = self.data[~matches].reset_index(drop=True)
+        return removed
+
+    def _frame(self,rows:list[dict[str,str]]|list[Record]) -> pd.DataFrame:
+        if isinstance(rows[0],Record):
+            return pd.DataFrame(records_to_columns(rows))
+        return pd.DataFrame(rows)
+
+    def _concat(self,new_data:pd.DataFrame,prepend:bool):
         if self.data.empty:
             self.data = new_data
         elif prepend:
@@ -59,13 +164,6 @@ class Dataset():
         else:
             self.data = pd.concat([self.data, new_data], ignore_index=True)
 
-    def add_rows(self,rows:list[dict[str,str]],prepend:bool=False):
-        if not isinstance(rows,list):
-            raise ValueError("Rows must be a list")
-        
-        for row in rows:
-            self.add_row(row,prepend=prepend)
-
 
     def update_row(self, id: str, row: dict):
         """Update an existing row in the dataset."""
@@ -96,7 +194,7 @@ class Dataset():
             if not self.file:
                 raise ValueError("File path is not set.")
 
-            logger.debug(f"Saving dataset to {self.file}")
+            logger.debug("Saving dataset to %s", self.file)
             if os.path.exists(self.tmp_file.name):
                 try:
                     self.data = pd.read_csv(self.tmp_file.name)
@@ -105,11 +203,17 @@ class Dataset():
                 self.tmp_file.close()
                 os.remove(self.tmp_file.name)
 
-            self.data.to_csv(self.file+".csv", index=False)
+            if self.normalizer is not None:
+                self.data = self.normalizer(self.data)
+            if self.partitioning is not None:
+                written = self.partitioning.write(self.data)
+                logger.debug("Wrote %d changed partitions of %s: %s", len(written), self.file, written)
+            else:
+                self.data.to_csv(self.file+".csv", index=False)
 
         else:
             if not self.tmp_file:
                 raise ValueError("Temporary file is not set.")
 
             self.data.to_csv(self.tmp_file.name, index=False)
-            logger.debug(f"Saving dataset to temporary file {self.tmp_file.name}")
\ No newline at end of file
+            logger.debug("Saving dataset to temporary file %s", self.tmp_file.name)
\ No newline at end of file
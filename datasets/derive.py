@@ -0,0 +1,52 @@
+import logging
+import numpy as np
+import pandas as pd
+from .records import FighterFight
+
+logger = logging.getLogger(__name__)
+
+RESULTS = ("win", "loss", "draw", "nc")
+OPPOSITE = {"win": "loss", "loss": "win", "draw": "draw", "nc": "nc"}
+
+
+def _results(fights: pd.DataFrame, column: str) -> pd.Series:
+    if column not in fights.columns:
+        return pd.Series("", index=fights.index, dtype="string")
+    return fights[column].astype("string").fillna("").str.lower()
+
+def derive_fighter_fights(fights: pd.DataFrame, existing: pd.DataFrame | None = None) -> pd.DataFrame:
+    """Melt each fight into one fighter_fights row per corner.
+
+    Pass only the fights scraped in this run; the cost is proportional to
+    them, not to the stored history. Rows come out in fight order, red
+    corner first. A corner without a recorded result takes the opposite of
+    the other corner's; fights with no result at all (scraped before results
+    were recorded) are skipped. Rows whose (fight, fighter) pair is already
+    in ``existing`` are left out, so re-scraped fights are not duplicated.
+    """
+    if fights.empty or not {"id", "red_id", "blue_id"} <= set(fights.columns):
+        return pd.DataFrame(columns=list(FighterFight.COLUMNS))
+
+    red_result = _results(fights, "red_result")
+    blue_result = _results(fights, "blue_result")
+    red_result = red_result.mask(red_result == "", blue_result.map(OPPOSITE))
+    blue_result = blue_result.mask(blue_result == "", red_result.map(OPPOSITE))
+
+    red = fights["red_id"].to_numpy(dtype=object)
+    blue = fights["blue_id"].to_numpy(dtype=object)
+    derived = pd.DataFrame({
+        "fight": np.repeat(fights["id"].to_numpy(dtype=object), 2),
+        "fighter": np.column_stack([red, blue]).ravel(),
+        "opponent": np.column_stack([blue, red]).ravel(),
+        "result": np.column_stack([red_result.fillna("").to_numpy(dtype=object), blue_result.fillna("").to_numpy(dtype=object)]).ravel(),
+    })
+    derived = derived[derived["result"].isin(RESULTS) & derived["fighter"].notna()]
+
+    if existing is not None and {"fight", "fighter"} <= set(existing.columns):
+        # Only stored rows of these fights can collide
+        existing = existing[existing["fight"].isin(fights["id"])]
+        known = pd.MultiIndex.from_frame(existing[["fight", "fighter"]].astype(object))
+        derived = derived[~pd.MultiIndex.from_frame(derived[["fight", "fighter"]]).isin(known)]
+
+    logger.debug(f"Derived {len(derived)} fighter_fights rows from {len(fights)} fights")
+    return derived.reset_index(drop=True)
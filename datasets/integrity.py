@@ -0,0 +1,62 @@
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# (dataset, referencing columns, referenced dataset); the referenced key is always ``id``
+REFERENCES = (
+    ("fights", ("event",), "events"),
+    ("fights", ("red_id", "blue_id"), "fighters"),
+    ("fighter_fights", ("fight",), "fights"),
+    ("fighter_fights", ("fighter", "opponent"), "fighters"),
+)
+
+
+def _dangling(frame: pd.DataFrame, columns: tuple[str, ...], ids: pd.Series) -> np.ndarray:
+    """Values of ``columns`` that are not in ``ids``, column by column."""
+    dangling = [frame.loc[~frame[column].isin(ids), column].to_numpy(dtype=object) for column in columns if column in frame.columns]
+    if not dangling:
+        return np.empty(0, dtype=object)
+    dangling = np.concatenate(dangling)
+    # Unset references are not dangling; filtering the few misses is cheaper than the whole column
+    return dangling[pd.notna(dangling) & (dangling != "")]
+
+
+def check_integrity(tables: dict[str, pd.DataFrame], empty_events=()) -> dict[str, list[str]]:
+    """Find the IDs referenced across ``tables`` that have no row of their own.
+
+    Every reference column is checked against its target's ``id`` column
+    with one hash-based ``isin`` per column. Events that no fight points
+    to are reported as well, since their fights were never stored, unless
+    they are in ``empty_events``, the events scraped and confirmed to have
+    no fights. Returns
+    the missing IDs per dataset without duplicates, ready to be scraped.
+    """
+    ids = {
+        dataset: frame["id"] if "id" in frame.columns else pd.Series([], dtype=object)
+        for dataset, frame in tables.items()
+    }
+
+    missing: dict[str, list[str]] = {"events": [], "fights": [], "fighters": []}
+    for dataset, columns, target in REFERENCES:
+        if dataset not in tables or target not in tables:
+            continue
+        dangling = _dangling(tables[dataset], columns, ids[target])
+        if len(dangling):
+            logger.warning(f"{len(dangling)} {dataset} references to {target} are dangling")
+        missing[target].extend(dangling.tolist())
+
+    if "events" in tables and "event" in tables.get("fights", {}):
+        events = ids["events"]
+        empty = events[~events.isin(tables["fights"]["event"]) & ~events.isin(list(empty_events))].dropna()
+        if len(empty):
+            logger.warning(f"{len(empty)} events have no fights")
+        missing["events"].extend(empty.tolist())
+
+    missing = {dataset: list(dict.fromkeys(dangling)) for dataset, dangling in missing.items()}
+    logger.info(
+        f"Integrity check: {len(missing['events'])} events, {len(missing['fights'])} fights "
+        f"and {len(missing['fighters'])} fighters missing"
+    )
+    return missing
@@ -0,0 +1,65 @@
+import logging
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+from .normalize import NORMALIZERS
+
+logger = logging.getLogger(__name__)
+
+# Fighter columns shown in the statistics/fighters listing tables
+LISTING_COLUMNS = ("id", "name", "win", "loss", "draw", "height", "weight", "reach", "stance")
+RECORD_COLUMNS = ("win", "loss", "draw")
+# Only on fighter-details pages
+CAREER_COLUMNS = ("slpm", "str. acc.", "sapm", "str. def", "td avg.", "td acc.", "td def.", "sub. avg.")
+
+
+def _same(left: pd.Series, right: pd.Series) -> np.ndarray:
+    if is_numeric_dtype(left) and is_numeric_dtype(right):
+        equal = left.astype("float64").to_numpy() == right.astype("float64").to_numpy()
+        return equal | (left.isna().to_numpy() & right.isna().to_numpy())
+    # Empty cells come back from the CSV as NaN
+    left = left.astype("string").fillna("").str.strip()
+    right = right.astype("string").fillna("").str.strip()
+    return (left == right).to_numpy(dtype=bool)
+
+def diff_fighter_listing(listed: pd.DataFrame, stored: pd.DataFrame) -> dict[str, list[str]]:
+    """Split listed fighters by what a refresh has to fetch for them.
+
+    ``details`` are fighters whose detail page is needed: new ones, ones
+    whose listed W/L/D differs from the stored record (so their career stats
+    and history moved too) and ones stored without career stats. ``listing``
+    are fighters whose other listing columns changed and can be updated from
+    the listing row alone. Fighters in neither are unchanged.
+    """
+    if listed.empty:
+        return {"details": [], "listing": []}
+    normalize = NORMALIZERS["fighters"]
+    listed = normalize(listed.drop_duplicates("id", keep="last")).reset_index(drop=True)
+    ids = listed["id"].astype(object).to_numpy()
+
+    if stored.empty or "id" not in stored.columns:
+        return {"details": ids.tolist(), "listing": []}
+    stored = normalize(stored.drop_duplicates("id", keep="last"))
+    stored = stored.set_index(stored["id"].astype(object)).reindex(ids)
+    stored.index = listed.index
+
+    new = stored["id"].isna().to_numpy()
+    changed_record = np.zeros(len(listed), dtype=bool)
+    changed_listing = np.zeros(len(listed), dtype=bool)
+    for column in LISTING_COLUMNS[1:]:
+        if column not in listed.columns:
+            continue
+        before = stored[column] if column in stored.columns else pd.Series(np.nan, index=listed.index)
+        different = ~_same(listed[column], before)
+        if column in RECORD_COLUMNS:
+            changed_record |= different
+        else:
+            changed_listing |= different
+    no_career = stored.reindex(columns=list(CAREER_COLUMNS)).isna().all(axis=1).to_numpy()
+
+    details = new | changed_record | no_career
+    logger.debug(
+        f"Listing of {len(listed)} fighters: {new.sum()} new, {(changed_record & ~new).sum()} changed records, "
+        f"{(no_career & ~new & ~changed_record).sum()} without career stats, {(changed_listing & ~details).sum()} listing updates"
+    )
+    return {"details": ids[details].tolist(), "listing": ids[changed_listing & ~details].tolist()}
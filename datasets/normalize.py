@@ -0,0 +1,114 @@
+from functools import partial, wraps
+from typing import Callable
+import numpy as np
+import pandas as pd
+
+# Every converter accepts either the raw display strings scraped from
+# ufcstats.com or its own output, so normalizing an already normalized
+# table is a no-op.
+
+def _per_unique(converter: Callable[[pd.Series], pd.Series]) -> Callable[[pd.Series], pd.Series]:
+    """Run ``converter`` once per distinct value and scatter the results back.
+
+    Display columns have few distinct values (round clock times, weights,
+    percentages), so the string parsing cost scales with the vocabulary rather
+    than with the number of rows.
+    """
+    @wraps(converter)
+    def convert(column: pd.Series, **kwargs) -> pd.Series:
+        codes, uniques = pd.factorize(column, use_na_sentinel=False)
+        converted = converter(pd.Series(uniques), **kwargs)
+        result = converted.take(codes)
+        result.index = column.index
+        return result
+    return convert
+
+def _as_text(column: pd.Series) -> pd.Series:
+    return column.astype("string").str.strip()
+
+@_per_unique
+def to_number(column: pd.Series) -> pd.Series:
+    """Leading number of each value: ``155 lbs.`` -> 155.0, ``72"`` -> 72.0, ``--`` -> NaN."""
+    text = _as_text(column)
+    number = text.str.extract(r"^(-?\d+(?:\.\d+)?)", expand=False)
+    return pd.to_numeric(number, errors="coerce").astype(float)
+
+@_per_unique
+def to_count(column: pd.Series) -> pd.Series:
+    """Whole counts such as wins and rounds, as a nullable integer column."""
+    return pd.to_numeric(to_number(column), errors="coerce").round().astype("Int64")
+
+@_per_unique
+def to_inches(column: pd.Series) -> pd.Series:
+    """Heights written as ``5' 11`` -> 71.0."""
+    text = _as_text(column)
+    parts = text.str.extract(r"^(\d+)'\s*(\d+(?:\.\d+)?)?")
+    feet = pd.to_numeric(parts[0], errors="coerce")
+    inches = pd.to_numeric(parts[1], errors="coerce").fillna(0)
+    return (feet * 12 + inches).fillna(to_number(column)).astype(float)
+
+@_per_unique
+def to_fraction(column: pd.Series) -> pd.Series:
+    """Percentages written as ``38%`` -> 0.38."""
+    text = _as_text(column)
+    is_percent = text.str.endswith("%").fillna(False).to_numpy(dtype=bool)
+    value = to_number(column).to_numpy()
+    return pd.Series(np.where(is_percent, value / 100, value), index=column.index, dtype=float)
+
+@_per_unique
+def to_seconds(column: pd.Series) -> pd.Series:
+    """Clock times written as ``2:37`` -> 157.0."""
+    text = _as_text(column)
+    parts = text.str.extract(r"^(\d+):(\d{2})$")
+    seconds = pd.to_numeric(parts[0], errors="coerce") * 60 + pd.to_numeric(parts[1], errors="coerce")
+    return seconds.fillna(to_number(column)).astype(float)
+
+@_per_unique
+def to_date(column: pd.Series, format: str) -> pd.Series:
+    """Dates in the given display format, or already in ISO format, as datetimes."""
+    text = _as_text(column)
+    parsed = pd.to_datetime(text, format=format, errors="coerce")
+    return parsed.fillna(pd.to_datetime(text, format="%Y-%m-%d", errors="coerce"))
+
+
+FIGHTER_COLUMNS: dict[str, Callable[[pd.Series], pd.Series]] = {
+    "win": to_count,
+    "loss": to_count,
+    "draw": to_count,
+    "no contest": to_count,
+    "height": to_inches,
+    "weight": to_number,
+    "reach": to_number,
+    "dob": partial(to_date, format="%b %d, %Y"),
+    "slpm": to_number,
+    "str. acc.": to_fraction,
+    "sapm": to_number,
+    "str. def": to_fraction,
+    "td avg.": to_number,
+    "td acc.": to_fraction,
+    "td def.": to_fraction,
+    "sub. avg.": to_number,
+}
+
+FIGHT_COLUMNS: dict[str, Callable[[pd.Series], pd.Series]] = {
+    "round": to_count,
+    "time": to_seconds,
+}
+
+EVENT_COLUMNS: dict[str, Callable[[pd.Series], pd.Series]] = {
+    "date": partial(to_date, format="%B %d, %Y"),
+}
+
+def normalize_frame(data: pd.DataFrame, converters: dict[str, Callable[[pd.Series], pd.Series]]) -> pd.DataFrame:
+    """Return a copy of ``data`` with each present column passed through its converter."""
+    data = data.copy()
+    for column, converter in converters.items():
+        if column in data.columns:
+            data[column] = converter(data[column])
+    return data
+
+NORMALIZERS: dict[str, Callable[[pd.DataFrame], pd.DataFrame]] = {
+    "fighters": partial(normalize_frame, converters=FIGHTER_COLUMNS),
+    "fights": partial(normalize_frame, converters=FIGHT_COLUMNS),
+    "events": partial(normalize_frame, converters=EVENT_COLUMNS),
+}
@@ -0,0 +1,91 @@
+"""Year-partitioned CSV layout for the events and fights datasets.
+
+Running ``python -m datasets.partition`` seeds ``data/`` from the flat
+``Events.csv`` and ``Fights.csv`` files.
+"""
+import glob
+import logging
+import os
+from typing import Callable
+import pandas as pd
+from .normalize import NORMALIZERS, to_date
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN = "unknown"
+
+
+class Partitioning():
+    """Splits a dataset into one CSV per year under ``directory``.
+
+    ``dates`` gives the date of each row; rows are written newest first, and
+    ties keep their current relative order, so a partition's content only
+    changes when its rows do. Partitions whose serialized content is
+    unchanged are not rewritten.
+    """
+    def __init__(self, directory: str, dates: Callable[[pd.DataFrame], pd.Series]):
+        self.directory = directory
+        self.dates = dates
+
+    def exists(self) -> bool:
+        return os.path.isdir(self.directory)
+
+    def path(self, partition: str) -> str:
+        return os.path.join(self.directory, partition + ".csv")
+
+    def read(self) -> pd.DataFrame:
+        names = [os.path.basename(file)[:-4] for file in glob.glob(os.path.join(self.directory, "*.csv"))]
+        # Newest year first, rows without a date last
+        names.sort(key=lambda name: (name == UNKNOWN, -int(name) if name != UNKNOWN else 0))
+        frames = [pd.read_csv(self.path(name)) for name in names]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def write(self, data: pd.DataFrame) -> list[str]:
+        """Write the partitions whose content changed; returns their names."""
+        os.makedirs(self.directory, exist_ok=True)
+        dates = pd.Series(self.dates(data).to_numpy(), index=data.index)
+        ordered = data.assign(_date=dates).sort_values("_date", ascending=False, kind="stable", na_position="last")
+        partitions = ordered["_date"].dt.year.astype("Int64").astype("string").fillna(UNKNOWN)
+
+        written = []
+        for partition, rows in ordered.drop(columns="_date").groupby(partitions.to_numpy(), sort=False):
+            content = rows.to_csv(index=False)
+            path = self.path(partition)
+            if os.path.exists(path):
+                with open(path) as f:
+                    if f.read() == content:
+                        continue
+            with open(path, "w") as f:
+                f.write(content)
+            written.append(partition)
+
+        stale = set(glob.glob(os.path.join(self.directory, "*.csv"))) - {self.path(p) for p in partitions.unique()}
+        for path in stale:
+            os.remove(path)
+            written.append(os.path.basename(path)[:-4])
+        return written
+
+
+def event_dates(events: pd.DataFrame) -> pd.Series:
+    return to_date(events["date"], format="%B %d, %Y")
+
+def fight_dates(fights: pd.DataFrame, events: pd.DataFrame) -> pd.Series:
+    dates = pd.Series(event_dates(events).to_numpy(), index=events["id"].to_numpy())
+    dates = dates[~dates.index.duplicated()]
+    return pd.Series(dates.reindex(fights["event"].to_numpy()).to_numpy(), index=fights.index)
+
+
+def main():
+    events = NORMALIZERS["events"](pd.read_csv("Events.csv"))
+    fights = NORMALIZERS["fights"](pd.read_csv("Fights.csv"))
+    written = Partitioning(os.path.join("data", "events"), event_dates).write(events)
+    logger.info(f"Wrote {len(written)} event partitions")
+    written = Partitioning(os.path.join("data", "fights"), lambda data: fight_dates(data, events)).write(fights)
+    logger.info(f"Wrote {len(written)} fight partitions")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,145 @@
+import logging
+import numpy as np
+import pandas as pd
+from .controller import DataController
+
+logger = logging.getLogger(__name__)
+
+
+class HashIndex():
+    """Maps each value of one or more key columns to the row positions holding it."""
+    def __init__(self, columns: list[str]):
+        self.columns = columns
+        self.positions: dict[str, np.ndarray] = {}
+
+    def build(self, frame: pd.DataFrame):
+        self.positions = {}
+        self.append(frame, 0)
+
+    def append(self, frame: pd.DataFrame, start: int):
+        """Index ``frame`` as the rows starting at position ``start``."""
+        for column in self.columns:
+            if column not in frame.columns or frame.empty:
+                continue
+            for key, rows in frame.groupby(column, sort=False).indices.items():
+                rows = rows + start
+                existing = self.positions.get(key)
+                self.positions[key] = rows if existing is None else np.union1d(existing, rows)
+
+    def lookup(self, key: str) -> np.ndarray:
+        return self.positions.get(key, np.empty(0, dtype=np.intp))
+
+
+class PrefixIndex():
+    """Case-insensitive sorted index for prefix search over a name column.
+
+    Every word boundary of a name is indexed, so ``"Mc"`` finds
+    ``"Conor McGregor"`` as well as a name starting with it.
+    """
+    def __init__(self, column: str):
+        self.column = column
+        self.keys = np.empty(0, dtype=object)
+        self.positions = np.empty(0, dtype=np.intp)
+
+    def build(self, frame: pd.DataFrame):
+        self.keys = np.empty(0, dtype=object)
+        self.positions = np.empty(0, dtype=np.intp)
+        self.append(frame, 0)
+
+    def append(self, frame: pd.DataFrame, start: int):
+        if self.column not in frame.columns or frame.empty:
+            return
+        words = frame[self.column].astype("string").fillna("").str.lower().str.split().to_numpy()
+        suffixes = pd.Series(
+            [[" ".join(name[i:]) for i in range(len(name))] for name in words],
+            index=np.arange(start, start + len(frame)),
+        ).explode().dropna()
+        keys = suffixes.to_numpy(dtype=object)
+        positions = suffixes.index.to_numpy(dtype=np.intp)
+
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        where = np.searchsorted(self.keys, keys, side="right")
+        self.keys = np.insert(self.keys, where, keys)
+        self.positions = np.insert(self.positions, where, positions[order])
+
+    def lookup(self, prefix: str) -> np.ndarray:
+        prefix = prefix.lower()
+        start = np.searchsorted(self.keys, prefix, side="left")
+        end = np.searchsorted(self.keys, prefix + "\uffff", side="left")
+        return np.unique(self.positions[start:end])
+
+
+class DataQuery():
+    """Secondary indexes over a controller's datasets.
+
+    Indexes are built once and extended as rows are appended through the
+    controller; when existing rows are shifted or modified the affected
+    dataset is re-indexed instead. Lookups return the matching rows as a
+    DataFrame in dataset order.
+    """
+    INDEXES = {
+        "fights": {
+            "fighter": (HashIndex, ["red_id", "blue_id"]),
+            "event": (HashIndex, ["event"]),
+        },
+        "fighter_fights": {
+            "fighter": (HashIndex, ["fighter"]),
+            "fight": (HashIndex, ["fight"]),
+        },
+        "events": {
+            "id": (HashIndex, ["id"]),
+        },
+        "fighters": {
+            "id": (HashIndex, ["id"]),
+            "name": (PrefixIndex, "name"),
+        },
+    }
+
+    def __init__(self, controller: DataController):
+        self.controller = controller
+        self.indexes: dict[str, dict[str, HashIndex|PrefixIndex]] = {}
+        for dataset, indexes in self.INDEXES.items():
+            if dataset not in controller.datasets:
+                continue
+            self.indexes[dataset] = {name: index(columns) for name, (index, columns) in indexes.items()}
+            self.build(dataset)
+        controller.add_listener(self.on_change)
+
+    def build(self, dataset: str):
+        frame = self.controller.table(dataset)
+        for index in self.indexes[dataset].values():
+            index.build(frame)
+        logger.debug(f"Built {len(self.indexes[dataset])} indexes over {len(frame)} {dataset} rows")
+
+    def on_change(self, dataset: str, rows: slice|None):
+        if dataset not in self.indexes:
+            return
+        if rows is None:
+            self.build(dataset)
+            return
+        frame = self.controller.table(dataset)
+        for index in self.indexes[dataset].values():
+            index.append(frame.iloc[rows], rows.start)
+
+    def _rows(self, dataset: str, positions: np.ndarray) -> pd.DataFrame:
+        # Positional selection gathers just the matched rows into a new frame; the table itself is never copied
+        return self.controller.table(dataset).iloc[positions]
+
+    def fights_for_fighter(self, fighter_id: str) -> pd.DataFrame:
+        return self._rows("fights", self.indexes["fights"]["fighter"].lookup(fighter_id))
+
+    def fights_at_event(self, event_id: str) -> pd.DataFrame:
+        return self._rows("fights", self.indexes["fights"]["event"].lookup(event_id))
+
+    def fighter_history(self, fighter_id: str) -> pd.DataFrame:
+        return self._rows("fighter_fights", self.indexes["fighter_fights"]["fighter"].lookup(fighter_id))
+
+    def event(self, event_id: str) -> pd.DataFrame:
+        return self._rows("events", self.indexes["events"]["id"].lookup(event_id))
+
+    def fighter(self, fighter_id: str) -> pd.DataFrame:
+        return self._rows("fighters", self.indexes["fighters"]["id"].lookup(fighter_id))
+
+    def fighters_by_name(self, prefix: str) -> pd.DataFrame:
+        return self._rows("fighters", self.indexes["fighters"]["name"].lookup(prefix))
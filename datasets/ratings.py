@@ -0,0 +1,174 @@
+import logging
+import os
+import numpy as np
+import pandas as pd
+from .normalize import to_date
+
+logger = logging.getLogger(__name__)
+
+SCORES = {"win": 1.0, "loss": 0.0, "draw": 0.5}
+
+def fight_outcomes(fights: pd.DataFrame, events: pd.DataFrame, fighter_fights: pd.DataFrame|None = None) -> pd.DataFrame:
+    """Resolve each fight to its date and the red corner's score.
+
+    The red corner's result is taken from the ``red_result`` column when the
+    fights table has one, falling back to the red fighter's row in
+    ``fighter_fights``. Fights whose result is unknown, or that ended in a no
+    contest, are left out.
+    """
+    dates = pd.Series(to_date(events["date"], format="%B %d, %Y").to_numpy(), index=events["id"].to_numpy())
+    outcomes = pd.DataFrame({
+        "id": fights["id"].to_numpy(),
+        "red_id": fights["red_id"].to_numpy(),
+        "blue_id": fights["blue_id"].to_numpy(),
+        "method": fights["method"].astype("string").fillna("").to_numpy(),
+        "date": dates.reindex(fights["event"].to_numpy()).to_numpy(),
+        # Datasets are stored newest first, card order main event first
+        "order": np.arange(len(fights))[::-1],
+    })
+
+    results = pd.Series(np.nan, index=outcomes.index, dtype=object)
+    if fighter_fights is not None and not fighter_fights.empty:
+        red_rows = fighter_fights.drop_duplicates(["fight", "fighter"]).set_index(["fight", "fighter"])["result"]
+        results[:] = red_rows.reindex(pd.MultiIndex.from_arrays([outcomes["id"], outcomes["red_id"]])).to_numpy()
+    if "red_result" in fights.columns:
+        results = pd.Series(fights["red_result"].to_numpy(), index=outcomes.index, dtype=object).fillna(results)
+
+    outcomes["score"] = results.astype("string").str.lower().map(SCORES).astype(float).to_numpy()
+    outcomes = outcomes.dropna(subset=["score", "date", "red_id", "blue_id"])
+    return outcomes.sort_values(["date", "order"], kind="stable").drop(columns="order").reset_index(drop=True)
+
+
+class RatingEngine():
+    """Elo ratings and career aggregates, kept in arrays indexed by fighter position.
+
+    Fights are applied in event-date order. The state (including which fights
+    have been applied) is persisted to ``<file>.npz`` so a later run only
+    applies fights it has not seen; a fight older than the newest applied one
+    triggers a full replay to keep the ordering exact.
+    """
+    STATS = ("rating", "fights", "wins", "losses", "draws", "finishes", "streak", "best_streak")
+
+    def __init__(self, file: str = "ratings", k_factor: float = 32.0, initial_rating: float = 1500.0):
+        self.file = file
+        self.k_factor = k_factor
+        self.initial_rating = initial_rating
+        self.reset()
+
+        if os.path.exists(self.file + ".npz"):
+            logger.debug(f"Loading rating state from {self.file}")
+            self.load()
+
+    def reset(self):
+        self.ids: list[str] = []
+        self.state = {stat: np.zeros(0) for stat in self.STATS}
+        self.processed: set[str] = set()
+        self.last_date = np.datetime64("NaT", "us")
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _indices(self, fighter_ids: np.ndarray) -> np.ndarray:
+        """Map fighter IDs to state positions, allocating state for unseen fighters."""
+        positions = pd.Index(self.ids, dtype=object).get_indexer(fighter_ids)
+        unseen = pd.unique(fighter_ids[positions < 0])
+        if len(unseen):
+            self.ids.extend(unseen.tolist())
+            for stat, values in self.state.items():
+                fill = self.initial_rating if stat == "rating" else 0.0
+                self.state[stat] = np.concatenate([values, np.full(len(unseen), fill)])
+            positions = pd.Index(self.ids, dtype=object).get_indexer(fighter_ids)
+        return positions
+
+    def apply(self, outcomes: pd.DataFrame) -> int:
+        """Apply already sorted outcomes, as returned by ``fight_outcomes``."""
+        if outcomes.empty:
+            return 0
+
+        red = self._indices(outcomes["red_id"].to_numpy(dtype=object))
+        blue = self._indices(outcomes["blue_id"].to_numpy(dtype=object))
+        scores = outcomes["score"].to_numpy(dtype=float)
+        finished = ~outcomes["method"].str.startswith("Decision").to_numpy(dtype=bool)
+
+        # Plain lists make the per-fight scalar updates several times faster
+        # than indexing numpy arrays element by element.
+        rating, fights, wins, losses, draws, finishes, streak, best_streak = (
+            self.state[stat].tolist() for stat in self.STATS
+        )
+        k_factor = self.k_factor
+
+        for r, b, score, finish in zip(red.tolist(), blue.tolist(), scores.tolist(), finished.tolist()):
+            expected = 1.0 / (1.0 + 10.0 ** ((rating[b] - rating[r]) / 400.0))
+            delta = k_factor * (score - expected)
+            rating[r] += delta
+            rating[b] -= delta
+            fights[r] += 1
+            fights[b] += 1
+
+            if score == 0.5:
+                draws[r] += 1
+                draws[b] += 1
+                streak[r] = streak[b] = 0
+                continue
+
+            winner, loser = (r, b) if score == 1.0 else (b, r)
+            wins[winner] += 1
+            losses[loser] += 1
+            if finish:
+                finishes[winner] += 1
+            streak[winner] = streak[winner] + 1 if streak[winner] > 0 else 1
+            streak[loser] = streak[loser] - 1 if streak[loser] < 0 else -1
+            best_streak[winner] = max(best_streak[winner], streak[winner])
+
+        for stat, values in zip(self.STATS, (rating, fights, wins, losses, draws, finishes, streak, best_streak)):
+            self.state[stat] = np.array(values, dtype=float)
+        self.processed.update(outcomes["id"].tolist())
+        newest = np.datetime64(outcomes["date"].max(), "us")
+        if np.isnat(self.last_date) or newest > self.last_date:
+            self.last_date = newest
+        return len(outcomes)
+
+    def update(self, fights: pd.DataFrame, events: pd.DataFrame, fighter_fights: pd.DataFrame|None = None) -> int:
+        """Apply the fights not yet rated; returns the number of fights applied."""
+        outcomes = fight_outcomes(fights, events, fighter_fights)
+        new = outcomes[~outcomes["id"].isin(self.processed)]
+        if new.empty:
+            return 0
+
+        if not np.isnat(self.last_date) and new["date"].min() < self.last_date:
+            logger.info("Found fights older than the rating state, replaying all fights")
+            return self.replay(fights, events, fighter_fights)
+
+        return self.apply(new)
+
+    def replay(self, fights: pd.DataFrame, events: pd.DataFrame, fighter_fights: pd.DataFrame|None = None) -> int:
+        """Rebuild the state from scratch over every fight."""
+        self.reset()
+        return self.apply(fight_outcomes(fights, events, fighter_fights))
+
+    def to_frame(self) -> pd.DataFrame:
+        frame = pd.DataFrame({"id": self.ids} | {stat: values for stat, values in self.state.items()})
+        for stat in self.STATS[1:]:
+            frame[stat] = frame[stat].astype(int)
+        frame["finish_rate"] = np.divide(
+            frame["finishes"], frame["wins"], out=np.zeros(len(frame)), where=frame["wins"].to_numpy() > 0
+        )
+        return frame.sort_values("rating", ascending=False, kind="stable").reset_index(drop=True)
+
+    def save(self):
+        """Persist the state to ``<file>.npz``."""
+        logger.debug(f"Saving rating state to {self.file}")
+        np.savez(
+            self.file + ".npz",
+            ids=np.array(self.ids, dtype=str),
+            processed=np.array(sorted(self.processed), dtype=str),
+            last_date=np.array([self.last_date], dtype="datetime64[us]"),
+            **self.state,
+        )
+
+    def load(self):
+        with np.load(self.file + ".npz") as state:
+            self.ids = state["ids"].tolist()
+            self.state = {stat: state[stat].astype(float) for stat in self.STATS}
+            self.processed = set(state["processed"].tolist())
+            self.last_date = state["last_date"][0]
@@ -0,0 +1,115 @@
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import ClassVar
+import numpy as np
+
+
+class Record():
+    """Base class for fixed-schema scraped entities.
+
+    Subclasses are slotted dataclasses; ``COLUMNS`` lists the dataset column
+    name of each field, in field order.
+    """
+    __slots__ = ()
+    COLUMNS: ClassVar[tuple[str, ...]] = ()
+
+    def to_dict(self) -> dict:
+        return dict(zip(self.COLUMNS, attrgetter(*self.__slots__)(self)))
+
+
+@dataclass(slots=True)
+class Event(Record):
+    COLUMNS: ClassVar[tuple[str, ...]] = ("id", "title", "date", "location", "fights", "weights")
+
+    id: str
+    title: str = ""
+    date: str = ""
+    location: str = ""
+    fights: list[str] = field(default_factory=list)
+    weights: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Fight(Record):
+    COLUMNS: ClassVar[tuple[str, ...]] = (
+        "id", "event", "title", "method", "red_id", "blue_id", "round", "time", "weight",
+        "red_result", "blue_result",
+    )
+
+    id: str
+    event: str = ""
+    title: str = ""
+    method: str = ""
+    red_id: str = ""
+    blue_id: str = ""
+    round: str = ""
+    time: str = ""
+    weight: str = ""
+    red_result: str = ""
+    blue_result: str = ""
+
+
+@dataclass(slots=True)
+class FighterFight(Record):
+    COLUMNS: ClassVar[tuple[str, ...]] = ("fight", "fighter", "opponent", "result")
+
+    fight: str
+    fighter: str
+    opponent: str
+    result: str
+
+
+@dataclass(slots=True)
+class Fighter(Record):
+    COLUMNS: ClassVar[tuple[str, ...]] = (
+        "id", "name", "win", "loss", "draw", "no contest",
+        "height", "weight", "reach", "stance", "dob",
+        "slpm", "str. acc.", "sapm", "str. def", "td avg.", "td acc.", "td def.", "sub. avg.",
+        "fights",
+    )
+
+    id: str
+    name: str = ""
+    win: str = ""
+    loss: str = ""
+    draw: str = ""
+    no_contest: str = ""
+    height: str = ""
+    weight: str = ""
+    reach: str = ""
+    stance: str = ""
+    dob: str = ""
+    slpm: str = ""
+    str_acc: str = ""
+    sapm: str = ""
+    str_def: str = ""
+    td_avg: str = ""
+    td_acc: str = ""
+    td_def: str = ""
+    sub_avg: str = ""
+    fights: list[FighterFight] = field(default_factory=list)
+
+    @classmethod
+    def from_bio(cls, bio: dict[str, str], **kwargs) -> "Fighter":
+        """Build a fighter from the labelled bio box, ignoring labels outside the schema."""
+        for column, name in zip(cls.COLUMNS, cls.__slots__):
+            if column in bio:
+                kwargs[name] = bio[column]
+        return cls(**kwargs)
+
+
+def records_to_columns(records: list[Record]) -> dict[str, np.ndarray]:
+    """Transpose a homogeneous list of records into one object array per column."""
+    if not records:
+        return {}
+
+    record_type = type(records[0])
+    if any(type(record) is not record_type for record in records):
+        raise TypeError("Records must all be of the same type")
+
+    getter = attrgetter(*record_type.__slots__)
+    count = len(records)
+    return {
+        column: np.fromiter(values, dtype=object, count=count)
+        for column, values in zip(record_type.COLUMNS, zip(*map(getter, records)))
+    }
@@ -0,0 +1,135 @@
+import logging
+import os
+import numpy as np
+import pandas as pd
+from .normalize import to_date
+
+logger = logging.getLogger(__name__)
+
+
+def _with_columns(frame: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
+    """``frame`` with any of ``columns`` it lacks added as empty ones."""
+    missing = [column for column in columns if column not in frame.columns]
+    return frame.assign(**dict.fromkeys(missing, pd.Series(np.nan, index=frame.index, dtype=object))) if missing else frame
+
+
+class RefreshScheduler():
+    """Decides which already scraped events and fighters are worth fetching again.
+
+    Each entity gets a refresh interval from how recently it was active:
+    events from the last ``recent_weeks`` and fighters who fought in the last
+    ``active_months`` are refreshed often, older events never and inactive
+    fighters rarely. An entity's priority is the time since it was last
+    scraped divided by its interval, so anything at or above 1 is due.
+    Last-scraped timestamps are persisted to ``<file>.csv``.
+    """
+    def __init__(
+        self,
+        file: str = "refresh_state",
+        recent_weeks: int = 4,
+        active_months: int = 12,
+        recent_event_interval: pd.Timedelta = pd.Timedelta(days=1),
+        active_fighter_interval: pd.Timedelta = pd.Timedelta(days=7),
+        inactive_fighter_interval: pd.Timedelta = pd.Timedelta(days=365),
+    ):
+        self.file = file
+        self.recent_weeks = recent_weeks
+        self.active_months = active_months
+        self.recent_event_interval = recent_event_interval
+        self.active_fighter_interval = active_fighter_interval
+        self.inactive_fighter_interval = inactive_fighter_interval
+        self.last_scraped: dict[str, dict[str, pd.Timestamp]] = {"events": {}, "fighters": {}}
+
+        if os.path.exists(self.file + ".csv"):
+            logger.debug(f"Loading refresh state from {self.file}")
+            state = pd.read_csv(self.file + ".csv", parse_dates=["last_scraped"])
+            for entity_type, group in state.groupby("type"):
+                self.last_scraped[entity_type] = dict(zip(group["id"], group["last_scraped"]))
+
+    def mark(self, entity_type: str, ids: list[str], when: pd.Timestamp | None = None):
+        """Record that ``ids`` were scraped at ``when`` (default: now)."""
+        when = when if when is not None else pd.Timestamp.now()
+        self.last_scraped.setdefault(entity_type, {}).update(dict.fromkeys(ids, when))
+
+    def _priorities(self, entity_type: str, ids: pd.Series, intervals: pd.Series, activity: pd.Series, now: pd.Timestamp) -> pd.DataFrame:
+        last = pd.Series(self.last_scraped.get(entity_type, {}), dtype="datetime64[us]")
+        last = last.reindex(ids.to_numpy()).to_numpy()
+        age = (now - pd.to_datetime(last)).to_numpy()
+        priority = age / intervals.to_numpy()
+        # Never scraped with a finite interval: due ahead of everything else
+        priority = np.where(pd.isna(last) & intervals.notna().to_numpy(), np.inf, priority)
+        return pd.DataFrame({
+            "type": entity_type,
+            "id": ids.to_numpy(),
+            "priority": pd.to_numeric(pd.Series(priority), errors="coerce").fillna(0.0).to_numpy(),
+            "activity": activity.to_numpy(),
+        })
+
+    def priorities(self, events: pd.DataFrame, fights: pd.DataFrame, fighters: pd.DataFrame, now: pd.Timestamp | None = None) -> pd.DataFrame:
+        """Priority of every event and fighter, most overdue first."""
+        now = now if now is not None else pd.Timestamp.now()
+        # A fresh or empty table lacks the columns; its entities count as never scraped
+        dated = "date" in events.columns
+        events = _with_columns(events, ("id", "date"))
+        fights = _with_columns(fights, ("event", "red_id", "blue_id"))
+        fighters = _with_columns(fighters, ("id",))
+
+        event_dates = to_date(events["date"], format="%B %d, %Y")
+        recent = (event_dates >= now - pd.Timedelta(weeks=self.recent_weeks)).to_numpy(dtype=bool) if dated else np.ones(len(events), dtype=bool)
+        event_intervals = pd.Series(np.where(recent, self.recent_event_interval, pd.NaT), dtype="timedelta64[us]")
+
+        dates = pd.Series(event_dates.to_numpy(), index=events["id"].to_numpy())
+        fight_dates = dates.reindex(fights["event"].to_numpy()).to_numpy()
+        appearances = pd.DataFrame({
+            "fighter": np.concatenate([fights["red_id"].to_numpy(), fights["blue_id"].to_numpy()]),
+            "date": np.concatenate([fight_dates, fight_dates]),
+        })
+        last_fight = appearances.groupby("fighter")["date"].max().reindex(fighters["id"].to_numpy())
+        active = (last_fight >= now - pd.DateOffset(months=self.active_months)).to_numpy(dtype=bool)
+        fighter_intervals = pd.Series(
+            np.where(active, self.active_fighter_interval, self.inactive_fighter_interval), dtype="timedelta64[us]"
+        )
+
+        priorities = pd.concat([
+            self._priorities("events", events["id"], event_intervals, event_dates, now),
+            self._priorities("fighters", fighters["id"], fighter_intervals, last_fight, now),
+        ], ignore_index=True)
+        return priorities.sort_values(["priority", "activity"], ascending=False, kind="stable").reset_index(drop=True)
+
+    def plan(self, events: pd.DataFrame, fights: pd.DataFrame, fighters: pd.DataFrame, budget: int, now: pd.Timestamp | None = None) -> dict[str, list[str]]:
+        """Pick the due entities that fit in ``budget`` requests, in priority order.
+
+        A fighter costs one request; an event costs one plus one per fight on its card.
+        """
+        priorities = self.priorities(events, fights, fighters, now)
+        due = priorities[priorities["priority"] >= 1]
+
+        card_sizes = _with_columns(fights, ("event",)).groupby("event").size()
+        costs = np.where(
+            due["type"] == "events", card_sizes.reindex(due["id"].to_numpy()).fillna(0).to_numpy() + 1, 1
+        )
+
+        selected: dict[str, list[str]] = {"events": [], "fighters": []}
+        remaining = budget
+        for entity_type, id, cost in zip(due["type"].tolist(), due["id"].tolist(), costs.tolist()):
+            if cost > remaining:
+                continue
+            selected[entity_type].append(id)
+            remaining -= cost
+            if remaining == 0:
+                break
+
+        logger.info(
+            f"Refresh plan: {len(selected['events'])} events and {len(selected['fighters'])} fighters "
+            f"out of {len(due)} due, {budget - remaining}/{budget} requests"
+        )
+        return selected
+
+    def save(self):
+        logger.debug(f"Saving refresh state to {self.file}")
+        rows = [
+            (entity_type, id, when)
+            for entity_type, timestamps in self.last_scraped.items()
+            for id, when in timestamps.items()
+        ]
+        pd.DataFrame(rows, columns=["type", "id", "last_scraped"]).sort_values(["type", "id"]).to_csv(self.file + ".csv", index=False)
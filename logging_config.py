@@ -1,4 +1,8 @@
+import atexit
 import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
 
 class AnsiColorFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord):
@@ -20,11 +24,69 @@ class AnsiColorFormatter(logging.Formatter):
         end_style = no_style
         return f'{start_style}{super().format(record)}{end_style}'
 
-def setup_logging(log_file="scraper.log", level=logging.INFO):
-    """Sets up logging for the entire project with color-coded console output."""
+class DeferredQueueHandler(QueueHandler):
+    """Queues records as-is so the listener thread does all formatting.
+
+    The stock QueueHandler formats each record in the calling thread to make
+    it picklable; the queue here never leaves the process, so that cost can
+    move to the background too.
+    """
+    def prepare(self, record: logging.LogRecord):
+        return record
+
+class RateLimitFilter(logging.Filter):
+    """Lets at most ``burst`` records per message template through every ``interval`` seconds.
+
+    Records are keyed by logger, level and the unformatted message, so this
+    works best with lazy ``%``-style arguments. The first record after a
+    window with suppressed records reports how many were dropped.
+    """
+    def __init__(self, burst: int, interval: float = 60.0):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.windows: dict[tuple, list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, record.levelno, record.msg)
+        now = time.monotonic()
+        window = self.windows.get(key)
+        if window is None or now - window[0] >= self.interval:
+            suppressed = window[2] if window else 0
+            self.windows[key] = [now, 1, 0]
+            if suppressed:
+                record.msg = f"{record.msg} (%d similar messages suppressed)"
+                record.args = (record.args if isinstance(record.args, tuple) else ()) + (suppressed,)
+            return True
+        if window[1] < self.burst:
+            window[1] += 1
+            return True
+        window[2] += 1
+        return False
+
+_listener: QueueListener | None = None
+_stop_registered = False
+
+def stop_logging():
+    """Flush and stop the background logging thread, if one is running, and close its handlers."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+def setup_logging(log_file="scraper.log", level=logging.INFO, queued=True, rate_limit=0):
+    """Sets up logging for the entire project with color-coded console output.
+
+    With ``queued`` the file and console handlers run on a background
+    listener thread and callers only enqueue records. ``rate_limit`` caps
+    identical messages per minute (0 disables the cap).
+    """
 
     logger = logging.getLogger()
     logger.setLevel(level)
+    stop_logging()
     logger.handlers.clear()  # Prevent duplicate handlers on reload
 
     # File handler (no color)
@@ -39,5 +101,21 @@ def setup_logging(log_file="scraper.log", level=logging.INFO):
         "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
     ))
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
\ No newline at end of file
+    if queued:
+        global _listener, _stop_registered
+        records = queue.SimpleQueue()
+        handler = DeferredQueueHandler(records)
+        _listener = QueueListener(records, file_handler, console_handler, respect_handler_level=True)
+        _listener.start()
+        if not _stop_registered:
+            atexit.register(stop_logging)
+            _stop_registered = True
+        handlers = [handler]
+    else:
+        handlers = [file_handler, console_handler]
+
+    rate_limit_filter = RateLimitFilter(rate_limit) if rate_limit else None
+    for handler in handlers:
+        if rate_limit_filter is not None:
+            handler.addFilter(rate_limit_filter)
+        logger.addHandler(handler)
\ No newline at end of file
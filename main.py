@@ -1,10 +1,13 @@
 import argparse
 import logging
-from typing import Callable
+import pandas as pd
+from string import ascii_lowercase
+from typing import Callable, Iterable, Iterator
 from exceptions import EntityExistsError
-from scrapers import UFCStatsScraper
-from datasets import Dataset, DataController
+from scrapers import UFCStatsScraper, ContentHashStore, PageCache, TRANSPORTS
+from datasets import Dataset, DataController, Event, RatingEngine, RefreshScheduler, ChangeFeed, derive_fighter_fights, check_integrity, diff_fighter_listing, LISTING_COLUMNS, records_to_columns
 from logging_config import setup_logging
+from profiling import StageProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -16,15 +19,25 @@ def attempt_func(func:Callable, args, ignore_errors: bool):
         return results
     except EntityExistsError as e:
         if ignore_errors:
-            logger.warning(f"Ignored existing entity: {e}")
+            logger.warning("Ignored existing entity: %s", e)
         return results
     except Exception as e:
         if ignore_errors:
-            logger.warning(f"Ignored error: {e}")
+            logger.warning("Ignored error: %s", e)
             return []
         else:
             raise
 
+def record_rows(records:list,exclude:tuple[str,...]) -> list[dict]:
+    return [{key:value for key,value in record.to_dict().items() if key not in exclude} for record in records]
+
+def store(controller:DataController,dataset:str,rows:list,update:bool,prepend:bool):
+    """Upsert rows when updating so re-scraped entities replace their old rows, insert them otherwise."""
+    if update:
+        controller.upsert(dataset,rows)
+    else:
+        controller.insert(dataset,rows,prepend)
+
 ############
 # Fighters #
 ############
@@ -32,18 +45,51 @@ def attempt_func(func:Callable, args, ignore_errors: bool):
 def fighter_listing_scraping(scraper:UFCStatsScraper,char:str,page:int):
     return scraper.run(scraper.scraper_fighter_listing,parameters={"char":char,"page":page})
 
-def fighter_scraping(scraper:UFCStatsScraper,ids:list,early_stopping:Callable):
+def all_fighter_listing_scraping(scraper:UFCStatsScraper,char:str,max_workers:int):
+    return scraper.run(scraper.scrape_all_fighter_ids,parameters={"char":char,"max_workers":max_workers})
+
+def fighter_scraping(scraper:UFCStatsScraper,ids:list,early_stopping:Callable,history:bool=True):
     return scraper.run(
         scraper.scrape_fighters,
-        parameters={"ids":ids,"early_stopping":early_stopping}
+        parameters={"ids":ids,"early_stopping":early_stopping,"history":history}
     )
+
+def all_fighter_rows_scraping(scraper:UFCStatsScraper,char:str,max_workers:int):
+    return scraper.run(scraper.scrape_all_fighter_rows,parameters={"char":char,"max_workers":max_workers})
+
+def listing_refresh_scraping(scraper:UFCStatsScraper,controller:DataController,max_workers:int,history:bool,ignore_errors:bool):
+    """Refresh every fighter from the listing tables, about one request per letter.
+
+    A fighter's own page is only fetched when the listing shows it is new or
+    its record changed, or when its career stats were never scraped; other
+    fighters whose listed height, weight, reach or stance changed are
+    updated from the listing row.
+    """
+    never = lambda id: False
+    for char in ascii_lowercase:
+        listed = attempt_func(all_fighter_rows_scraping,{"scraper":scraper,"char":char,"max_workers":max_workers},ignore_errors)
+        rows = [{column:row[column] for column in LISTING_COLUMNS} for row in (fighter.to_dict() for fighter in listed)]
+        plan = diff_fighter_listing(pd.DataFrame(rows,columns=list(LISTING_COLUMNS)),controller.table("fighters"))
+
+        fighters = attempt_func(fighter_scraping,{"scraper":scraper,"ids":plan["details"],"early_stopping":never,"history":history},ignore_errors)
+        controller.upsert("fighters",fighters)
+        # Pages unchanged since the last run come back empty; their listing row still applies
+        scraped = {fighter.id for fighter in fighters}
+        from_listing = set(plan["listing"]) | (set(plan["details"]) - scraped)
+        controller.upsert("fighters",[row for row in rows if row["id"] in from_listing])
+        logger.info("Listed %d fighters under %s: %d pages fetched, %d updated from the listing", len(rows), char, len(plan["details"]), len(from_listing))
 ##########
 # Fights #
 ##########
 
-def fight_scraping(scraper: UFCStatsScraper, events: list[dict], early_stopping):
+def fight_scraping(scraper: UFCStatsScraper, events: Iterable[dict]|Iterable[Event], early_stopping):
     data_collection = []
     for event in events:
+        if isinstance(event,Event):
+            event = event.to_dict()
+        # Events loaded from disk no longer carry their fight lists
+        if not isinstance(event["fights"],list):
+            continue
         fights = scraper.run(
             scraper.scrape_fights,
             parameters={
@@ -53,11 +99,17 @@ def fight_scraping(scraper: UFCStatsScraper, events: list[dict], early_stopping)
             },
         )
         for fight,weight in zip(fights,event["weights"]):
-            fight["event"] = event["id"]
-            fight["weight"] = weight
+            fight.event = event["id"]
+            fight.weight = weight
         data_collection.extend(fights)
     return data_collection
 
+def standalone_fight_scraping(scraper:UFCStatsScraper,ids:list[str],early_stopping:Callable):
+    return scraper.run(
+        scraper.scrape_fights,
+        parameters={"ids":ids,"event_id":"","early_stopping":early_stopping},
+    )
+
 ##########
 # Events #
 ##########
@@ -71,14 +123,98 @@ def event_scraping(scraper:UFCStatsScraper,ids:list[str],early_stopping:Callable
 def event_listing_scraping(scraper:UFCStatsScraper,page:int):
     return scraper.run(scraper.scrape_event_listing,{"page":page})
 
+def all_event_listing_scraping(scraper:UFCStatsScraper,max_workers:int):
+    return scraper.run(scraper.scrape_all_event_ids,{"max_workers":max_workers})
+
+def event_listing_pages(scraper:UFCStatsScraper,bulk:bool,max_workers:int,ignore_errors:bool,page_size:int=25) -> Iterator[list[str]]:
+    """Yield event IDs a listing page at a time, newest first.
+
+    In bulk mode the whole listing is fetched up front and split into pages
+    of ``page_size`` so early stopping still works per page.
+    """
+    if bulk:
+        event_ids = attempt_func(all_event_listing_scraping,{"scraper":scraper,"max_workers":max_workers},ignore_errors)
+        logger.info("Listed %d events", len(event_ids))
+        for start in range(0,len(event_ids),page_size):
+            yield event_ids[start:start+page_size]
+        return
+
+    page = 1
+    while True:
+        event_ids = attempt_func(event_listing_scraping,{"scraper":scraper,"page":page},ignore_errors)
+        if len(event_ids) == 0:
+            logger.info("No more events found after page %s.", page)
+            return
+        yield event_ids
+        page+=1
+
+###########
+# Refresh #
+###########
+
+def refresh_scraping(scraper:UFCStatsScraper,controller:DataController,scheduler:RefreshScheduler,budget:int,ignore_errors:bool):
+    plan = scheduler.plan(controller.table("events"),controller.table("fights"),controller.table("fighters"),budget)
+    never = lambda id: False
+
+    events = attempt_func(event_scraping,{"scraper":scraper,"ids":plan["events"],"early_stopping":never},ignore_errors)
+    fights = attempt_func(fight_scraping,{"scraper":scraper,"events":events,"early_stopping":never},ignore_errors)
+    controller.upsert("events",record_rows(events,("fights","weights")))
+    controller.upsert("fights",fights)
+    # Results can change after the fact (e.g. overturned to a no contest), so refreshed fights replace their rows
+    derived = derive_fighter_fights(pd.DataFrame(records_to_columns(fights)))
+    controller.delete("fighter_fights",derived["fight"].unique().tolist(),key="fight")
+    controller.insert("fighter_fights",derived)
+    # An event whose fights failed under --ignore stays due
+    scraped = {fight.id for fight in fights}
+    scheduler.mark("events",[event.id for event in events if scraped.issuperset(event.fights)])
+
+    fighters = attempt_func(fighter_scraping,{"scraper":scraper,"ids":plan["fighters"],"early_stopping":never,"history":False},ignore_errors)
+    controller.upsert("fighters",record_rows(fighters,("fights",)))
+    # Unchanged pages were still fetched, so they count as refreshed; failed ones stay due
+    fetched = {fighter.id for fighter in fighters}
+    if scraper.content_hashes is not None:
+        fetched |= scraper.content_hashes.unchanged_keys
+    scheduler.mark("fighters",[id for id in plan["fighters"] if id in fetched])
+    logger.info("Refreshed %d events, %d fights and %d fighters",len(events),len(fights),len(fighters))
+
+##########
+# Repair #
+##########
+
+def repair_scraping(scraper:UFCStatsScraper,controller:DataController,ignore_errors:bool,passes:int=2):
+    """Scrape exactly the entities that other datasets reference but that are missing.
+
+    Repaired fights can point to fighters that are missing as well, so the
+    check runs again after each pass. Events scraped without fights are
+    not fetched again by later passes.
+    """
+    never = lambda id: False
+    empty = set()
+    for _ in range(passes):
+        missing = check_integrity({dataset:controller.table(dataset) for dataset in ("events","fights","fighters","fighter_fights")},empty)
+        if not any(missing.values()):
+            return
+
+        events = attempt_func(event_scraping,{"scraper":scraper,"ids":missing["events"],"early_stopping":never},ignore_errors)
+        empty |= {event.id for event in events if not event.fights}
+        fights = attempt_func(fight_scraping,{"scraper":scraper,"events":events,"early_stopping":never},ignore_errors)
+        scraped = {fight.id for fight in fights}
+        fights += attempt_func(standalone_fight_scraping,{"scraper":scraper,"ids":[id for id in missing["fights"] if id not in scraped],"early_stopping":never},ignore_errors)
+        controller.upsert("events",record_rows(events,("fights","weights")))
+        controller.upsert("fights",fights)
+        controller.insert("fighter_fights",derive_fighter_fights(pd.DataFrame(records_to_columns(fights)),controller.table("fighter_fights")))
+
+        fighters = attempt_func(fighter_scraping,{"scraper":scraper,"ids":missing["fighters"],"early_stopping":never,"history":False},ignore_errors)
+        controller.upsert("fighters",record_rows(fighters,("fights",)))
+        logger.info("Repaired %d events, %d fights and %d fighters",len(events),len(fights),len(fighters))
+
+    check_integrity({dataset:controller.table(dataset) for dataset in ("events","fights","fighters","fighter_fights")},empty)
+
 ########
 # Main #
 ########
 
 def main(cli_args=None, log=True) -> int:
-    if log:
-        setup_logging(level=logging.DEBUG)
-
     parser = argparse.ArgumentParser(description="UFC Stats Scraper")
     parser.add_argument("-i", "--ignore", 
                         action="store_true", 
@@ -105,86 +241,231 @@ def main(cli_args=None, log=True) -> int:
                         default=10,
                         type=int,
                         help="set wait time")
+    parser.add_argument("-P","--partitioned",
+                        nargs="?",
+                        const="data",
+                        default=None,
+                        metavar="DIR",
+                        help="Store events and fights as per-year CSV partitions under DIR (default: data)")
+    parser.add_argument("--changefeed",
+                        default=None,
+                        metavar="DIR",
+                        help="Write this run's inserted, updated and deleted rows per dataset and a manifest under DIR/<run>")
+    parser.add_argument("-R","--refresh",
+                        default=0,
+                        type=int,
+                        metavar="BUDGET",
+                        help="Re-scrape due events and fighters within a budget of requests")
+    parser.add_argument("-L","--listing-refresh",
+                        action="store_true",
+                        help="Refresh fighters from the listing tables, fetching a fighter's page only if it is new, its record changed or its career stats are missing")
+    parser.add_argument("--repair",
+                        action="store_true",
+                        help="Scrape events, fights and fighters that the stored data references but lacks")
+    parser.add_argument("-r","--ratings",
+                        action="store_true",
+                        help="Apply newly scraped fights to the fighter ratings")
+    parser.add_argument("-b","--bulk",
+                        action="store_true",
+                        help="Fetch whole event and fighter listings in one request each")
+    parser.add_argument("--workers",
+                        default=8,
+                        type=int,
+                        help="Concurrent listing requests when a bulk listing is unavailable")
+    parser.add_argument("--base-url",
+                        default="http://www.ufcstats.com/",
+                        help="Site to scrape, e.g. a local stub server for testing")
+    parser.add_argument("--http-client",
+                        default="requests",
+                        choices=sorted(TRANSPORTS),
+                        help="HTTP client to fetch pages with (httpx must be installed separately)")
+    parser.add_argument("--pool-size",
+                        default=None,
+                        type=int,
+                        help="Keep-alive connections to the site (default: --workers)")
+    parser.add_argument("--connect-timeout",
+                        default=None,
+                        type=float,
+                        help="Seconds to wait for a connection (default: --wait)")
+    parser.add_argument("--read-timeout",
+                        default=None,
+                        type=float,
+                        help="Seconds to wait for data from an open connection (default: --wait)")
+    parser.add_argument("--max-page-mb",
+                        default=16,
+                        type=float,
+                        help="Fail pages larger than this once decompressed")
+    parser.add_argument("--cache-mb",
+                        default=256,
+                        type=int,
+                        help="Memory for pages fetched and parsed this run, so each is fetched once (0: no cache)")
+    parser.add_argument("-c","--chunk-size",
+                        default=1000,
+                        type=int,
+                        help="Rows per chunk when reading datasets back between phases")
+    parser.add_argument("--profile",
+                        default=None,
+                        metavar="DIR",
+                        help="Profile each pipeline stage and write the profiles and a summary to DIR")
+    parser.add_argument("--log-rate-limit",
+                        default=0,
+                        type=int,
+                        metavar="N",
+                        help="Log at most N identical messages per minute (0: no limit)")
     args = parser.parse_args(cli_args)
 
-    scraper = UFCStatsScraper(wait_time=args.wait, ignore_errors=args.ignore)
-
-    # Initialize datasets
-    controller = DataController(["events","fights","fighters","fighter_fights"],args.update,args.direct)
-
-    fights_scraping_initializer = []
-    if not args.no_events:
-        page = 1
-        while True:
-            event_ids = attempt_func(event_listing_scraping,{"scraper":scraper,"page":page},args.ignore)
-
-            if len(event_ids) == 0:
-                logger.info(f"No more events found after page {page}.")
-                break
-
-            events_page_data = attempt_func(event_scraping,{"scraper":scraper,"ids":event_ids,"early_stopping":controller.get_early_stopping("events")},args.ignore)
-            controller.insert("events",events_page_data,args.prepend)
-            logger.info(f"Scraped page {page} with {len(events_page_data)} events")
-            page+=1
-
-        fights_scraping_initializer = controller.select("events",["id","fights","weights"])
-        controller.drop("events",["fights","weights"])
-
-    if not args.no_fights:
-        if args.no_events:
-            page = 1
-            fights_scraping_initializer = []
-            while True:
-                event_ids = attempt_func(event_listing_scraping,{"scraper":scraper,"page":page},args.ignore)
-                event_data = attempt_func(event_scraping,{"scraper":scraper,"ids":event_ids,"early_stopping": lambda x: False},args.ignore)
-                fights_scraping_initializer.extend(event_data)
-                if len(event_ids) == 0:
-                    logger.info(f"No more fights found after page {page}.")
-                    break
-                page+=1
-        fights_page_data = attempt_func(fight_scraping,{"scraper":scraper,"events":fights_scraping_initializer,"early_stopping":controller.get_early_stopping("fights")},args.ignore)
-        
-        controller.insert("fights",fights_page_data,args.prepend)
-        
-        logger.info(f"Scraped {len(fights_page_data)} fights")
-
-    if not args.no_fighters:
-        char=97
-        while True:
-            page=1
-            while True:
-                fighter_ids = attempt_func(fighter_listing_scraping, {"scraper":scraper,"char":chr(char),"page":page},args.ignore)
-                fighters_page_data = attempt_func(fighter_scraping,{"scraper":scraper,"ids":fighter_ids,"early_stopping":controller.get_early_stopping("fighters")},args.ignore)
+    if log:
+        setup_logging(level=logging.DEBUG,rate_limit=args.log_rate_limit)
+
+    # Only a full refresh re-fetches pages we already have
+    content_hashes = ContentHashStore() if args.update else None
+    page_cache = PageCache(args.cache_mb * 2**20) if args.cache_mb > 0 else None
+    transport = TRANSPORTS[args.http_client](
+        pool_size=args.pool_size or args.workers,
+        connect_timeout=args.connect_timeout if args.connect_timeout is not None else args.wait,
+        read_timeout=args.read_timeout if args.read_timeout is not None else args.wait,
+        max_bytes=int(args.max_page_mb * 2**20),
+    )
+    scraper = UFCStatsScraper(wait_time=args.wait, ignore_errors=args.ignore, content_hashes=content_hashes, page_cache=page_cache, base_url=args.base_url, transport=transport)
+
+    profiler = StageProfiler(args.profile)
+
+    try:
+        # Initialize datasets
+        changefeed = ChangeFeed(args.changefeed) if args.changefeed else None
+        controller = DataController(["events","fights","fighters","fighter_fights"],args.update,args.direct,args.partitioned,changefeed)
+        if content_hashes is not None:
+            # A matching hash only means "unchanged" while the fighter's row is still stored
+            stored_fighters = controller.table("fighters")
+            content_hashes.retain(stored_fighters["id"] if "id" in stored_fighters.columns else [])
+
+        fights_scraping_initializer = []
+        if not args.no_events:
+            event_pages = profiler.iterate("event listing",event_listing_pages(scraper,args.bulk,args.workers,args.ignore))
+            for page,event_ids in enumerate(event_pages,start=1):
+                with profiler.stage("events"):
+                    events_page_data = attempt_func(event_scraping,{"scraper":scraper,"ids":event_ids,"early_stopping":controller.get_early_stopping("events")},args.ignore)
+                    store(controller,"events",events_page_data,args.update,args.prepend)
+                logger.info("Scraped page %s with %d events", page, len(events_page_data))
+
+            # Only events scraped in this run carry their fight lists
+            if "fights" in controller.datasets["events"]:
+                fights_scraping_initializer = controller.iter_chunks("events",["id","fights","weights"],args.chunk_size)
+
+        if not args.no_fights:
+            if args.no_events:
+                fights_scraping_initializer = []
+                for event_ids in profiler.iterate("event listing",event_listing_pages(scraper,args.bulk,args.workers,args.ignore)):
+                    with profiler.stage("events"):
+                        event_data = attempt_func(event_scraping,{"scraper":scraper,"ids":event_ids,"early_stopping": lambda x: False},args.ignore)
+                    fights_scraping_initializer.extend(event_data)
+                fights_scraping_initializer = [fights_scraping_initializer]
+
+            scraped_fights = []
+            for events_chunk in profiler.iterate("fights",fights_scraping_initializer):
+                with profiler.stage("fights"):
+                    if isinstance(events_chunk,pd.DataFrame):
+                        events_chunk = events_chunk.to_dict("records")
+                    fights_page_data = attempt_func(fight_scraping,{"scraper":scraper,"events":events_chunk,"early_stopping":controller.get_early_stopping("fights")},args.ignore)
+                    store(controller,"fights",fights_page_data,args.update,args.prepend)
+                scraped_fights.extend(fights_page_data)
+
+            logger.info("Scraped %d fights", len(scraped_fights))
+
+            # Both corners' results are on the fight page, so fighter pages are only needed for bios
+            with profiler.stage("fights"):
+                derived = derive_fighter_fights(pd.DataFrame(records_to_columns(scraped_fights)),controller.table("fighter_fights"))
+                controller.insert("fighter_fights",derived,args.prepend)
+            logger.info("Derived %d fighter_fights rows from fights", len(derived))
+
+        if not args.no_events and "fights" in controller.datasets["events"]:
+            controller.drop("events",["fights","weights"])
+
+        with profiler.stage("fighters"):
+            if not args.no_fighters and args.listing_refresh:
+                listing_refresh_scraping(scraper,controller,args.workers,args.no_fights,args.ignore)
+
+            elif not args.no_fighters and args.bulk:
+                for char in ascii_lowercase:
+                    fighter_ids = attempt_func(all_fighter_listing_scraping,{"scraper":scraper,"char":char,"max_workers":args.workers},args.ignore)
+                    fighters_page_data = attempt_func(fighter_scraping,{"scraper":scraper,"ids":fighter_ids,"early_stopping":controller.get_early_stopping("fighters"),"history":args.no_fights},args.ignore)
+                    store(controller,"fighters",fighters_page_data,args.update,args.prepend)
+                    logger.info("Scraped %d of %d fighters listed under %s", len(fighters_page_data), len(fighter_ids), char)
+
+            elif not args.no_fighters:
+                char=97
+                while True:
+                    page=1
+                    while True:
+                        fighter_ids = attempt_func(fighter_listing_scraping, {"scraper":scraper,"char":chr(char),"page":page},args.ignore)
+                        fighters_page_data = attempt_func(fighter_scraping,{"scraper":scraper,"ids":fighter_ids,"early_stopping":controller.get_early_stopping("fighters"),"history":args.no_fights},args.ignore)
                 
-                if len(fighters_page_data) == 0:
-                    logger.info(f"No more fights found.")
-                    break
+                        if len(fighters_page_data) == 0:
+                            logger.info("No more fights found.")
+                            break
                 
-                controller.insert("fighters",fighters_page_data,args.prepend)
-                page+=1
-                break
-            if char == 122:
-                break
-            char+=1
-            break
-        
-        fighters_fights = controller.select("fighters","fights")
-        controller.drop("fighters","fights")
-        fighters_fights_data = []
-        for fighter_fights in fighters_fights:
-            fighters_fights_data.extend(fighter_fights["fights"])
-        controller.insert("fighter_fights",fighters_fights_data,args.prepend)
-
-    # --- Final save to proper CSVs ---
-
-    if not args.no_fights:
-        controller.save("fights",True)
-    if not args.no_events:
-        controller.save("events",direct=True)
-    if not args.no_fighters:
-        controller.save("fighters",True)
-    if not args.no_fighters and not args.no_fights:
-        controller.save("fighter_fights",True)
+                        store(controller,"fighters",fighters_page_data,args.update,args.prepend)
+                        page+=1
+                        break
+                    if char == 122:
+                        break
+                    char+=1
+                    break
+
+            if not args.no_fighters:
+                if "fights" in controller.datasets["fighters"]:
+                    # Histories of re-scraped fighters repeat rows stored by earlier runs
+                    stored = controller.table("fighter_fights")
+                    known = set(zip(stored["fight"],stored["fighter"])) if {"fight","fighter"} <= set(stored.columns) else set()
+                    for fighters_chunk in controller.iter_chunks("fighters","fights",args.chunk_size):
+                        fighters_fights_data = []
+                        for fighter_fights in fighters_chunk["fights"]:
+                            # Only scraped with --no-fights; loaded fighters have none
+                            if isinstance(fighter_fights,list):
+                                fighters_fights_data.extend(row for row in fighter_fights if (row.fight,row.fighter) not in known)
+                        controller.insert("fighter_fights",fighters_fights_data,args.prepend)
+                    controller.drop("fighters","fights")
+
+        if args.refresh:
+            with profiler.stage("refresh"):
+                scheduler = RefreshScheduler()
+                refresh_scraping(scraper,controller,scheduler,args.refresh,args.ignore)
+                scheduler.save()
+
+        if args.repair:
+            with profiler.stage("repair"):
+                repair_scraping(scraper,controller,args.ignore)
+
+        # --- Final save to proper CSVs ---
+
+        with profiler.stage("persistence"):
+            if not args.no_fights or args.refresh or args.repair:
+                controller.save("fights",True)
+            if not args.no_events or args.refresh or args.repair:
+                controller.save("events",direct=True)
+            if not args.no_fighters or args.refresh or args.repair:
+                controller.save("fighters",True)
+            if not args.no_fighters or not args.no_fights or args.refresh or args.repair:
+                controller.save("fighter_fights",True)
+
+            if content_hashes is not None:
+                content_hashes.save()
+                logger.info("Fighter pages: %d changed, %d unchanged",content_hashes.changed,content_hashes.unchanged)
+
+        if args.ratings:
+            with profiler.stage("ratings"):
+                ratings = RatingEngine()
+                applied = ratings.update(controller.table("fights"),controller.table("events"),controller.table("fighter_fights"))
+                ratings.save()
+                ratings.to_frame().to_csv("ratings.csv",index=False)
+            logger.info("Applied %d fights to %d fighter ratings",applied,len(ratings))
+    finally:
+        transport.close()
+        # Stages timed before a failure are still written out
+        profiler.save()
+    logger.info("HTTP: %s", transport.stats)
+    if page_cache is not None:
+        logger.info("Page cache: %s",page_cache.stats())
 
     return 0
 
@@ -0,0 +1,93 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class StageProfiler():
+    """Profiles each pipeline stage separately with cProfile.
+
+    Entering a stage again adds to its existing profile. Besides the
+    function statistics each stage tracks wall time and process CPU time;
+    the difference is time spent waiting, mostly on the network. Only the
+    thread that enters a stage is profiled, but CPU time counts all threads.
+
+    With no ``directory`` every stage is a no-op, so callers can always
+    wrap their stages.
+    """
+    def __init__(self, directory: str | None, top: int = 15):
+        self.directory = directory
+        self.top = top
+        self.profiles: dict[str, cProfile.Profile] = {}
+        self.wall: dict[str, float] = {}
+        self.cpu: dict[str, float] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    @contextmanager
+    def stage(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        profile = self.profiles.setdefault(name, cProfile.Profile())
+        wall, cpu = time.perf_counter(), time.process_time()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self.wall[name] = self.wall.get(name, 0.0) + time.perf_counter() - wall
+            self.cpu[name] = self.cpu.get(name, 0.0) + time.process_time() - cpu
+
+    def iterate(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Yield from ``iterable``, profiling only the work of producing each item."""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                item = next(iterator, StopIteration)
+            if item is StopIteration:
+                return
+            yield item
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, name.replace(" ", "_") + ".prof")
+
+    def summary(self) -> str:
+        lines = [f"{'stage':<16}{'wall':>10}{'cpu':>10}{'io wait':>10}"]
+        for name in self.profiles:
+            wall, cpu = self.wall[name], self.cpu[name]
+            lines.append(f"{name:<16}{wall:>9.2f}s{cpu:>9.2f}s{max(wall - cpu, 0.0):>9.2f}s")
+
+        for name, profile in self.profiles.items():
+            stream = io.StringIO()
+            stats = pstats.Stats(profile, stream=stream)
+            stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+            lines.append("")
+            lines.append(f"=== {name} ===")
+            # Drop the header pstats prints before the table
+            table = stream.getvalue()
+            lines.append(table[table.find("   ncalls"):].rstrip())
+        return "\n".join(lines)
+
+    def save(self):
+        """Write one ``.prof`` file per stage and a ``summary.txt``."""
+        if not self.enabled:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        for name, profile in self.profiles.items():
+            profile.dump_stats(self.path(name))
+        summary = self.summary()
+        with open(os.path.join(self.directory, "summary.txt"), "w") as f:
+            f.write(summary + "\n")
+        logger.info(f"Wrote {len(self.profiles)} stage profiles to {self.directory}")
+        logger.info("Profile summary:\n%s", summary.split("\n\n", 1)[0])
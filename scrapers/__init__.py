@@ -1 +1,4 @@
-from .ufc_stats_scraper import UFCStatsScraper
\ No newline at end of file
+from .ufc_stats_scraper import UFCStatsScraper
+from .content_hash import ContentHashStore
+from .cache import PageCache
+from .transport import Transport, RequestsTransport, HttpxTransport, ResponseTooLargeError, TRANSPORTS
\ No newline at end of file
@@ -4,14 +4,18 @@ from abc import ABC
 from typing import Callable
 import requests
 from bs4 import BeautifulSoup, Tag
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 import re
 
 from exceptions import EntityExistsError
+from .content_hash import ContentHashStore
+from .cache import PageCache
+from .transport import Transport, RequestsTransport
 
 logger = logging.getLogger(__name__)
 
+# Rough memory of a parsed page relative to its HTML, for sizing the page cache
+PARSED_OVERHEAD = 8
+
 class BaseScraper(ABC):
     def __init__(
         self,
@@ -19,47 +23,74 @@ class BaseScraper(ABC):
         wait_time: int,
         ignore_errors: bool,
         events_file: str = "Events.csv",
-        fights_file: str = "Fights.csv"
+        fights_file: str = "Fights.csv",
+        content_hashes: ContentHashStore | None = None,
+        page_cache: PageCache | None = None,
+        transport: Transport | None = None
     ):
         self.base_url = base_url
         self.wait_time = wait_time
         self.ignore_errors = ignore_errors
         self.events_file = events_file
         self.fights_file = fights_file
+        self.content_hashes = content_hashes
+        self.page_cache = page_cache
 
-        self.session = requests.Session()
+        # Without a configured transport --wait is both the connect and the read timeout
+        self.transport = transport if transport is not None else RequestsTransport(connect_timeout=wait_time, read_timeout=wait_time)
+        self.session = self.transport.session
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
             "Accept-Language": "en-US,en;q=0.9",
         }
 
-        retries = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"]
-        )
-        adapter = HTTPAdapter(max_retries=retries)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        logger.debug("Initialized BeautifulSoup scraper with %s", type(self.transport).__name__)
 
-        logger.debug("Initialized BeautifulSoup scraper with retry-enabled requests.Session")
+    def fetch_body(self, url: str) -> str:
+        if self.page_cache is not None:
+            return self.page_cache.get(("body", url), lambda: self._fetch_body(url))
+        return self._fetch_body(url)[0]
 
-    def fetch_soup(self, url: str) -> BeautifulSoup:
+    def _fetch_body(self, url: str) -> tuple[str, int]:
         try:
-            logger.debug(f"Fetching URL: {url}")
-            response = self.session.get(url, headers=self.headers, timeout=self.wait_time)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
+            logger.debug("Fetching URL: %s", url)
+            body = self.transport.get(url, self.headers)
+            return body, len(body)
         except requests.RequestException as e:
-            logger.error(f"Failed to fetch {url}: {e}")
+            logger.error("Failed to fetch %s: %s", url, e)
             raise e
+
+    def fetch_soup(self, url: str) -> BeautifulSoup:
+        return self.parse_body(url, self.fetch_body(url))
+
+    def parse_body(self, url: str, body: str) -> BeautifulSoup:
+        """Parse a page body, at most once per run when a page cache is set."""
+        if self.page_cache is None:
+            return BeautifulSoup(body, "html.parser")
+        return self.page_cache.get(("soup", url), lambda: (BeautifulSoup(body, "html.parser"), PARSED_OVERHEAD * len(body)))
+
+    def fetch_soup_if_changed(self, url: str, key: str) -> tuple[BeautifulSoup | None, str]:
+        """Fetch a page and parse it only if its content hash differs from the stored one.
+
+        Returns ``(None, digest)`` for unchanged pages. Callers record the
+        digest once parsing succeeds.
+        """
+        if self.content_hashes is None:
+            return self.fetch_soup(url), ""
+
+        body = self.fetch_body(url)
+        digest = self.content_hashes.digest(body)
+        if self.content_hashes.is_unchanged(key, digest):
+            logger.debug("Skipping unchanged page %s", url)
+            return None, digest
+        return self.parse_body(url, body), digest
+
     def parse_elements(self,soup: BeautifulSoup, selector: str) -> list:
         """Parse elements from the soup using a CSS selector."""
         elements = soup.select(selector)
         if elements:
             return elements
-        logger.warning(f"No elements found for selector: {selector}")
+        logger.warning("No elements found for selector: %s", selector)
         raise ValueError(f"No elements found for selector: {selector}")
 
     def parse_element(self, element: BeautifulSoup|Tag, selector: str) -> Tag:
@@ -68,7 +99,7 @@ class BaseScraper(ABC):
         if parsed_element:
             return parsed_element
         
-        logger.warning(f"No element found for selector: {selector}")
+        logger.warning("No element found for selector: %s", selector)
         raise ValueError(f"No element found for selector: {selector}")
 
     def parse_Tag_attribute(self,element: Tag, attribute: str) -> str:
@@ -76,16 +107,18 @@ class BaseScraper(ABC):
         if element.has_attr(attribute):
             return str(element.get(attribute))
 
-        logger.warning(f"Attribute '{attribute}' not found in element: {element}")
-        raise ValueError(f"Attribute '{attribute}' not found in element: {element}")
+        # Only the tag name: rendering the whole Tag costs more than the parse
+        logger.warning("Attribute '%s' not found in element: <%s>", attribute, element.name)
+        raise ValueError(f"Attribute '{attribute}' not found in element: <{element.name}>")
     
     def parse_text(self, element: Tag) -> str:
         """Extract and clean text from a BeautifulSoup Tag."""
         if element and element.text:
             return element.text
         
-        logger.warning(f"No text found in element: {element}")
-        raise ValueError(f"No text found in element: {element}")
+        name = element.name if element is not None else None
+        logger.warning("No text found in element: <%s>", name)
+        raise ValueError(f"No text found in element: <{name}>")
 
     def clean_text(self, text: str) -> str:
         """Clean and normalize text, removing excessive whitespace and surrounding quotes."""
@@ -107,7 +140,7 @@ class BaseScraper(ABC):
             else:
                 raise ValueError(f"Could not extract ID from URL: {url}")
         
-        logger.warning(f"Could not extract ID from URL: {url}")
+        logger.warning("Could not extract ID from URL: %s", url)
         raise ValueError(f"Could not extract ID from URL: {url}")
     
     def run(self,func:Callable,parameters:dict) -> list: # type: ignore
@@ -118,7 +151,7 @@ class BaseScraper(ABC):
                 raise ValueError("Improper scrape results")
             else: return result
         except EntityExistsError as e:
-            logger.warning(f"Ignored existing entity: {e}")
+            logger.warning("Ignored existing entity: %s", e)
             return results
         except Exception as e:
             logger.exception("An error occurred during scraping.")
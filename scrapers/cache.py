@@ -0,0 +1,75 @@
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class PageCache():
+    """Per-run memo of fetched and parsed pages.
+
+    Concurrent requests for the same key share a single load; later ones
+    are served from an LRU bounded by ``max_bytes``. Sizes are estimates
+    supplied by the loader. Failed loads are not cached.
+    """
+    def __init__(self, max_bytes: int = 256 * 2**20):
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self.pending: dict[Hashable, Future] = {}
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key: Hashable, load: Callable[[], tuple[Any, int]]) -> Any:
+        """Return the value for ``key``, calling ``load() -> (value, size)`` at most once at a time."""
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key][0]
+            future = self.pending.get(key)
+            owner = future is None
+            if owner:
+                future = self.pending[key] = Future()
+            else:
+                self.coalesced += 1
+        if not owner:
+            return future.result()
+
+        try:
+            value, size = load()
+        except BaseException as e:
+            with self.lock:
+                del self.pending[key]
+            future.set_exception(e)
+            raise
+        with self.lock:
+            del self.pending[key]
+            self.misses += 1
+            self._store(key, value, size)
+        future.set_result(value)
+        return value
+
+    def _store(self, key: Hashable, value: Any, size: int):
+        if size > self.max_bytes:
+            return
+        self.entries[key] = (value, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.size -= evicted
+            self.evictions += 1
+
+    def stats(self) -> str:
+        return (
+            f"{self.misses} loaded, {self.hits} cached, {self.coalesced} coalesced, "
+            f"{self.evictions} evicted, {len(self)} entries in {self.size / 2**20:.1f} MiB"
+        )
@@ -0,0 +1,58 @@
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class ContentHashStore():
+    """Content hashes of previously parsed pages, keyed by entity ID.
+
+    Hashes are taken over the response body with whitespace collapsed, so
+    layout-only reformatting does not count as a change. A hash is only
+    recorded once its page has been parsed successfully.
+    """
+    def __init__(self, file: str = "page_hashes"):
+        self.file = file
+        self.hashes: dict[str, str] = {}
+        self.changed = 0
+        self.unchanged = 0
+        # Keys whose fetched page matched its stored hash this run
+        self.unchanged_keys: set[str] = set()
+
+        if os.path.exists(self.file + ".json"):
+            logger.debug(f"Loading page hashes from {self.file}")
+            with open(self.file + ".json") as f:
+                self.hashes = json.load(f)
+
+    @staticmethod
+    def digest(body: str) -> str:
+        return hashlib.blake2b(" ".join(body.split()).encode(), digest_size=16).hexdigest()
+
+    def is_unchanged(self, key: str, digest: str) -> bool:
+        """Check a freshly fetched page against the stored hash and count the outcome."""
+        if self.hashes.get(key) == digest:
+            self.unchanged += 1
+            self.unchanged_keys.add(key)
+            return True
+        self.changed += 1
+        return False
+
+    def retain(self, keys) -> int:
+        """Forget hashes of keys not in ``keys``, so pages of rows that were lost are parsed again; returns the number forgotten."""
+        keys = set(keys)
+        stale = [key for key in self.hashes if key not in keys]
+        for key in stale:
+            del self.hashes[key]
+        if stale:
+            logger.debug("Forgot %d page hashes without a stored row", len(stale))
+        return len(stale)
+
+    def record(self, key: str, digest: str):
+        self.hashes[key] = digest
+
+    def save(self):
+        logger.debug(f"Saving {len(self.hashes)} page hashes to {self.file}")
+        with open(self.file + ".json", "w") as f:
+            json.dump(self.hashes, f, sort_keys=True, indent=0)
@@ -0,0 +1,189 @@
+import logging
+import threading
+from abc import ABC, abstractmethod
+import time
+import weakref
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Content codings both clients decode without extra packages
+ACCEPT_ENCODING = "gzip, deflate"
+CHUNK_SIZE = 64 * 2**10
+MAX_BYTES = 16 * 2**20
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class ResponseTooLargeError(requests.RequestException):
+    """A response body exceeded the transport's ``max_bytes``."""
+
+
+class TransportStats():
+    """Counters of one transport: pages read, connections opened and bytes on the wire vs. decoded."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pages = 0
+        self.requests = 0
+        self.connections = 0
+        self.wire_bytes = 0
+        self.body_bytes = 0
+
+    def add(self, wire_bytes: int, body_bytes: int):
+        with self.lock:
+            self.pages += 1
+            self.wire_bytes += wire_bytes
+            self.body_bytes += body_bytes
+
+    @property
+    def reused(self) -> int:
+        return max(self.requests - self.connections, 0)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.pages} pages in {self.requests} requests over {self.connections} connections ({self.reused} reused), "
+            f"{self.wire_bytes / 2**20:.1f} MiB transferred for {self.body_bytes / 2**20:.1f} MiB of pages"
+        )
+
+
+class Transport(ABC):
+    """Fetches page bodies as text.
+
+    Bodies are streamed and a response larger than ``max_bytes`` once
+    decoded raises ResponseTooLargeError. Failures are raised as
+    ``requests`` exceptions whichever client is used.
+    """
+    def __init__(self, pool_size: int = 10, connect_timeout: float = 10, read_timeout: float = 10, max_bytes: int = MAX_BYTES):
+        self.pool_size = max(pool_size, 1)
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_bytes = max_bytes
+        self.stats = TransportStats()
+
+    @abstractmethod
+    def get(self, url: str, headers: dict[str, str]) -> str:
+        """The decoded body of ``url``."""
+
+    def close(self):
+        pass
+
+    def _check_length(self, url: str, length: str | None):
+        # Content-Length is the encoded size, a lower bound of the decoded one
+        if length and length.isdigit() and int(length) > self.max_bytes:
+            raise ResponseTooLargeError(f"{url} is {int(length)} bytes, more than {self.max_bytes}")
+
+    def _read(self, url: str, chunks) -> bytes:
+        body = bytearray()
+        for chunk in chunks:
+            body += chunk
+            if len(body) > self.max_bytes:
+                raise ResponseTooLargeError(f"{url} is more than {self.max_bytes} bytes")
+        return bytes(body)
+
+
+class RequestsTransport(Transport):
+    """``requests.Session`` whose connection pool holds ``pool_size`` keep-alive connections per host.
+
+    Status codes in RETRY_STATUSES are retried three times with backoff.
+    """
+    def __init__(self, pool_size: int = 10, connect_timeout: float = 10, read_timeout: float = 10, max_bytes: int = MAX_BYTES):
+        super().__init__(pool_size, connect_timeout, read_timeout, max_bytes)
+        self.session = requests.Session()
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=list(RETRY_STATUSES),
+            allowed_methods=["GET"]
+        )
+        # Connections beyond pool_maxsize are closed after use rather than kept alive
+        self.adapter = HTTPAdapter(pool_maxsize=self.pool_size, max_retries=retries)
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+    def get(self, url: str, headers: dict[str, str]) -> str:
+        response = self.session.get(url, headers=headers, timeout=(self.connect_timeout, self.read_timeout), stream=True)
+        try:
+            response.raise_for_status()
+            self._check_length(url, response.headers.get("Content-Length"))
+            body = self._read(url, response.iter_content(CHUNK_SIZE))
+            # urllib3 counts the bytes read off the socket before decompression
+            wire_bytes = response.raw.tell() if isinstance(response.raw, HTTPResponse) else len(body)
+        finally:
+            response.close()
+        self.stats.add(wire_bytes, len(body))
+        self._count_connections()
+        return body.decode(response.encoding or "utf-8", errors="replace")
+
+    def _count_connections(self):
+        pools = self.adapter.poolmanager.pools
+        counts = [(pool.num_requests, pool.num_connections) for pool in (pools[key] for key in pools.keys())]
+        with self.stats.lock:
+            self.stats.requests = sum(sent for sent, _ in counts)
+            self.stats.connections = sum(opened for _, opened in counts)
+
+    def close(self):
+        self.session.close()
+
+
+class HttpxTransport(Transport):
+    """``httpx.Client`` behind the same interface, for comparison with ``requests``.
+
+    Needs the optional ``httpx`` package.
+    """
+    def __init__(self, pool_size: int = 10, connect_timeout: float = 10, read_timeout: float = 10, max_bytes: int = MAX_BYTES, retries: int = 3, backoff: float = 0.5):
+        super().__init__(pool_size, connect_timeout, read_timeout, max_bytes)
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("the httpx transport needs the httpx package (pip install httpx)") from e
+        self.httpx = httpx
+        self.retries = retries
+        self.backoff = backoff
+        self.session = httpx.Client(
+            headers={"Accept-Encoding": ACCEPT_ENCODING},
+            limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            transport=httpx.HTTPTransport(retries=retries),
+            follow_redirects=True,
+        )
+        self.streams = weakref.WeakSet()
+
+    def get(self, url: str, headers: dict[str, str]) -> str:
+        httpx = self.httpx
+        try:
+            for attempt in range(self.retries + 1):
+                with self.session.stream("GET", url, headers=headers) as response:
+                    self._count_request(response)
+                    if response.status_code in RETRY_STATUSES and attempt < self.retries:
+                        time.sleep(self.backoff * 2**attempt)
+                        continue
+                    response.raise_for_status()
+                    self._check_length(url, response.headers.get("Content-Length"))
+                    body = self._read(url, response.iter_bytes(CHUNK_SIZE))
+                    self.stats.add(response.num_bytes_downloaded, len(body))
+                    return body.decode(response.encoding or "utf-8", errors="replace")
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.HTTPStatusError as e:
+            raise requests.HTTPError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+    def _count_request(self, response):
+        # A connection seen before is a reused keep-alive connection
+        stream = response.extensions.get("network_stream")
+        with self.stats.lock:
+            self.stats.requests += 1
+            if stream is None or stream not in self.streams:
+                self.stats.connections += 1
+                if stream is not None:
+                    self.streams.add(stream)
+
+    def close(self):
+        self.session.close()
+
+
+TRANSPORTS = {"requests": RequestsTransport, "httpx": HttpxTransport}
@@ -1,18 +1,35 @@
 import logging
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
+import requests
 from .base import BaseScraper
+from .content_hash import ContentHashStore
+from .cache import PageCache
+from .transport import Transport
 from exceptions import EntityExistsError
+from datasets.records import Event, Fight, Fighter, FighterFight
 
 logger = logging.getLogger(__name__)
 
+# Rows per paginated listing page on ufcstats.com. A "page=all" response of
+# exactly one full page may just be page 1 with the parameter ignored, so it
+# is not trusted; a shorter one is the whole listing either way.
+LISTING_PAGE_SIZE = 25
+
+# Result badges on fight pages, spelled the way fighter_fights stores them
+RESULTS = {"W": "win", "L": "loss", "D": "draw", "NC": "nc"}
+
 
 class UFCStatsScraper(BaseScraper):
-    def __init__(self, wait_time: int, ignore_errors: bool):
+    def __init__(self, wait_time: int, ignore_errors: bool, content_hashes: ContentHashStore | None = None, page_cache: PageCache | None = None, base_url: str = "http://www.ufcstats.com/", transport: Transport | None = None):
         super().__init__(
-            base_url="http://www.ufcstats.com/",
+            base_url=base_url,
             wait_time=wait_time,
             ignore_errors=ignore_errors,
+            content_hashes=content_hashes,
+            page_cache=page_cache,
+            transport=transport,
         )
 
         self.site_paths = {
@@ -27,22 +44,69 @@ class UFCStatsScraper(BaseScraper):
     # FIGHTERS #
     ############
 
-    def scraper_fighter_listing(self,char:str,page:int):
+    def scraper_fighter_listing(self,char:str,page:int|str):
         url = self.base_url + self.site_paths["fighter listing"] + "char=" + char + "&page=" + str(page)
-        logger.debug(f"Fetching fighter listing character {char} page {page}: {url}")
+        logger.debug("Fetching fighter listing character %s page %s: %s", char, page, url)
         soup = self.fetch_soup(url)
         try:
             link_tags = self.parse_elements(soup,"tr.b-statistics__table-row td.b-statistics__table-col a.b-link")
             ids = list(OrderedDict.fromkeys([self.parse_id_from_url(self.parse_Tag_attribute(link_tag, "href")) for link_tag in link_tags]))
         except:
             # No events on this page → last page reached
-            logger.info(f"No fighter found on character {char} page {page}. Ending pagination.")
+            logger.info("No fighter found on character %s page %s. Ending pagination.", char, page)
             ids = []
         return ids
     
-    def scrape_fighter(self,id:str):
-        url = self.base_url + self.site_paths["fighters"] + id
+    def scrape_all_fighter_ids(self,char:str,max_workers:int=8) -> list[str]:
+        """All fighter IDs for a letter, from the single-page listing when available."""
+        return self._bulk_listing(lambda page: self.scraper_fighter_listing(char,page),max_workers)
+
+    def scrape_fighter_listing_rows(self,char:str,page:int|str) -> list[Fighter]:
+        """Fighters on a listing page with the columns the table shows: name, height, weight, reach, stance and W/L/D.
+
+        Career stats, date of birth, no contests and fight history are only on
+        the fighter's own page and are left empty.
+        """
+        url = self.base_url + self.site_paths["fighter listing"] + "char=" + char + "&page=" + str(page)
+        logger.debug("Fetching fighter listing rows character %s page %s: %s", char, page, url)
         soup = self.fetch_soup(url)
+        fighters = []
+        for row in soup.select("tr.b-statistics__table-row"):
+            cols = row.select("td")
+            link = row.select_one("td a.b-link")
+            # The first row of the table is an empty spacer
+            if link is None or len(cols) < 10:
+                continue
+            text = [self.clean_text(col.get_text()) if col.get_text().strip() else "" for col in cols]
+            fighters.append(Fighter(
+                id=self.parse_id_from_url(self.parse_Tag_attribute(link,"href")),
+                name=" ".join(part for part in text[:2] if part),
+                height=text[3],
+                weight=text[4],
+                reach=text[5],
+                stance=text[6],
+                win=text[7],
+                loss=text[8],
+                draw=text[9],
+            ))
+        if not fighters:
+            logger.info("No fighter rows on character %s page %s. Ending pagination.", char, page)
+        return fighters
+
+    def scrape_all_fighter_rows(self,char:str,max_workers:int=8) -> list[Fighter]:
+        """All listing rows for a letter, from the single-page listing when available."""
+        return self._bulk_listing(lambda page: self.scrape_fighter_listing_rows(char,page),max_workers,key=lambda fighter: fighter.id)
+
+    def scrape_fighter(self,id:str,history:bool=True) -> Fighter | None:
+        """Scrape a fighter page, or return None if its content is unchanged since the last run.
+
+        With ``history`` off the fight history table is not parsed; the same
+        rows can be derived from the fights dataset instead.
+        """
+        url = self.base_url + self.site_paths["fighters"] + id
+        soup, digest = self.fetch_soup_if_changed(url, id)
+        if soup is None:
+            return None
         name = self.clean_text(self.parse_text(self.parse_element(soup,"h2.b-content__title span.b-content__title-highlight")))
         record = self.clean_text(self.parse_text(self.parse_element(soup,"h2.b-content__title span.b-content__title-record")).replace("Record:",""))
         win,loss,draw = record.split("-")
@@ -65,51 +129,60 @@ class UFCStatsScraper(BaseScraper):
                     continue
                 value = self.clean_text(self.parse_text(item).replace(self.clean_text(self.parse_text(label)),""))
                 bio[key.lower()] = value
+        fights = []
         try:
-            fight_rows = self.parse_elements(soup,"table.b-fight-details__table tbody tr.b-fight-details__table-row__hover")
-            fights = []
+            fight_rows = self.parse_elements(soup,"table.b-fight-details__table tbody tr.b-fight-details__table-row__hover") if history else []
             for row in fight_rows:
                 cols = self.parse_elements(row,"td")
                 result = self.clean_text(self.parse_text(cols[0]))
                 opponent = self.parse_id_from_url(self.parse_Tag_attribute(self.parse_elements(cols[1],"a")[1],"href"))
                 fight_id = self.parse_id_from_url(self.parse_Tag_attribute(row,"data-link"))
-                fights.append({
-                    "fight": fight_id,
-                    "fighter":id,
-                    "opponent":opponent,
-                    "result":result,
-                    })
+                fights.append(FighterFight(
+                    fight=fight_id,
+                    fighter=id,
+                    opponent=opponent,
+                    result=result,
+                ))
         except:
             fights = []
 
-        return {
-            "id":id,
-            "name":name,
-            "win":win,
-            "loss":loss,
-            "draw":draw,
-            "no contest": nc,
-            "fights":fights
-        } | bio
-    def scrape_fighters(self,ids,early_stopping:Callable):
+        fighter = Fighter.from_bio(
+            bio,
+            id=id,
+            name=name,
+            win=win,
+            loss=loss,
+            draw=draw,
+            no_contest=nc,
+            fights=fights,
+        )
+        if self.content_hashes is not None:
+            self.content_hashes.record(id, digest)
+        return fighter
+    def scrape_fighters(self,ids,early_stopping:Callable,history:bool=True):
         data_collection = []
         for id in ids:
             if early_stopping(id):
                 return data_collection
-            data = self.scrape_fighter(id)
-            data_collection.append(data)
+            data = self.scrape_fighter(id,history)
+            if data is not None:
+                data_collection.append(data)
         return data_collection
     
     ##########
     # FIGHTS #
     ##########
 
-    def scrape_fight(self, id: str, event_id: str) -> dict:
+    def scrape_fight(self, id: str, event_id: str = "") -> Fight:
 
         url = self.base_url + self.site_paths["fights"] + id
         soup = self.fetch_soup(url)
         fighters = soup.select(".b-fight-details__person")
 
+        # Fights scraped on their own take the event from the page header
+        if not event_id:
+            event_id = self.parse_id_from_url(self.parse_Tag_attribute(self.parse_element(soup, "h2.b-content__title a"), "href"))
+
         fight_title = self.clean_text(
             self.parse_text(self.parse_element(soup, ".b-fight-details__fight-title"))
         )
@@ -118,22 +191,18 @@ class UFCStatsScraper(BaseScraper):
         )
         method = "DRAW" if method == "Other" else method
 
-        fight_details = {
-            "id": id,
-            "event": event_id,
-            "title": fight_title,
-            "method": method,
-        }
+        fight = Fight(id=id, event=event_id, title=fight_title, method=method)
 
-        fighter_details = {}
         for index, fighter in enumerate(fighters):
-            fighter_type = "red" if index == 0 else "blue"
             fighter_id = self.parse_id_from_url(self.parse_Tag_attribute(self.parse_element(fighter, "h3.b-fight-details__person-name a"),"href"))
-            fighter_details |= {
-                f"{fighter_type}_id": fighter_id,
-            }
-
-        fight_details |= fighter_details
+            status = fighter.select_one("i.b-fight-details__person-status")
+            result = RESULTS.get(self.clean_text(status.text), "") if status is not None else ""
+            if index == 0:
+                fight.red_id = fighter_id
+                fight.red_result = result
+            else:
+                fight.blue_id = fighter_id
+                fight.blue_result = result
 
         # Parse round and time
         info_items = self.parse_elements(soup, ".b-fight-details__text-item")
@@ -148,9 +217,10 @@ class UFCStatsScraper(BaseScraper):
             elif label == "Time:":
                 fight_time = text
 
-        fight_details |= {"round": round_, "time": fight_time}
+        fight.round = round_
+        fight.time = fight_time
 
-        return fight_details
+        return fight
 
     def scrape_fights(self, ids: list[str], event_id: str, early_stopping: Callable) -> list:
         data_collection = []
@@ -165,9 +235,9 @@ class UFCStatsScraper(BaseScraper):
     # EVENTS #
     ##########
 
-    def scrape_event_listing(self, page: int):
+    def scrape_event_listing(self, page: int|str):
         url = self.base_url + self.site_paths["event listing"] + str(page)
-        logger.debug(f"Fetching event listing page {page}: {url}")
+        logger.debug("Fetching event listing page %s: %s", page, url)
         soup = self.fetch_soup(url)
 
         try:
@@ -175,12 +245,16 @@ class UFCStatsScraper(BaseScraper):
             ids = [self.parse_id_from_url(self.parse_Tag_attribute(link_tag, "href")) for link_tag in link_tags]
         except ValueError:
             # No events on this page → last page reached
-            logger.info(f"No events found on page {page}. Ending pagination.")
+            logger.info("No events found on page %s. Ending pagination.", page)
             ids = []
 
         return ids
 
-    def scrape_event(self, id: str) -> dict:
+    def scrape_all_event_ids(self, max_workers: int = 8) -> list[str]:
+        """All completed event IDs, newest first, from the single-page listing when available."""
+        return self._bulk_listing(self.scrape_event_listing, max_workers)
+
+    def scrape_event(self, id: str) -> Event:
         url = self.base_url + self.site_paths["events"] + id
         soup = self.fetch_soup(url)
 
@@ -200,16 +274,16 @@ class UFCStatsScraper(BaseScraper):
             fight_ids.append(fight_id)
             weight = self.clean_text(self.parse_text(self.parse_element(row,"td.b-fight-details__table-col.l-page_align_left:nth-of-type(7)")))
             fight_weights.append(weight)
-        return {
-            "id": id,
-            "title": title,
-            "date": date,
-            "location": location,
-            "fights": fight_ids,
-            "weights":fight_weights
-        }
+        return Event(
+            id=id,
+            title=title,
+            date=date,
+            location=location,
+            fights=fight_ids,
+            weights=fight_weights,
+        )
     
-    def scrape_events(self, ids: list[str], early_stopping: Callable) -> list[dict]:
+    def scrape_events(self, ids: list[str], early_stopping: Callable) -> list[Event]:
         data_collection = []
         for id in ids:
             if early_stopping(id):
@@ -217,3 +291,35 @@ class UFCStatsScraper(BaseScraper):
             data = self.scrape_event(id)
             data_collection.append(data)
         return data_collection
+
+    ###########
+    # LISTING #
+    ###########
+
+    def _bulk_listing(self, fetch_page: Callable[[int|str], list], max_workers: int, key: Callable = lambda item: item) -> list:
+        """Fetch a whole listing with ``page=all``, falling back to concurrent pagination.
+
+        Items repeated across pages are dropped by ``key``.
+        """
+        try:
+            ids = fetch_page("all")
+        except requests.RequestException as e:
+            logger.warning("Bulk listing unavailable: %s", e)
+            ids = []
+        if ids and len(ids) != LISTING_PAGE_SIZE:
+            return ids
+
+        logger.info("Bulk listing returned %d IDs, prefetching pages concurrently", len(ids))
+        return self._prefetch_listing(fetch_page, max_workers, key)
+
+    def _prefetch_listing(self, fetch_page: Callable[[int], list], max_workers: int, key: Callable = lambda item: item) -> list:
+        """Fetch listing pages ``max_workers`` at a time, in order, until one comes back empty."""
+        ids = []
+        first = 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                for page_ids in executor.map(fetch_page, range(first, first + max_workers)):
+                    if not page_ids:
+                        return list(OrderedDict((key(item), item) for item in ids).values())
+                    ids.extend(page_ids)
+                first += max_workers
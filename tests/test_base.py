@@ -22,8 +22,8 @@ def scraper():
 
 
 def test_fetch_soup_success(scraper):
-    mock_response = Mock()
-    mock_response.text = "<html><p>hello</p></html>"
+    mock_response = Mock(headers={}, encoding="utf-8")
+    mock_response.iter_content.return_value = [b"<html><p>hello</p></html>"]
     mock_response.raise_for_status = Mock()
 
     with patch.object(scraper.session, "get", return_value=mock_response):
@@ -0,0 +1,78 @@
+import threading
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from scrapers import UFCStatsScraper
+
+ROW = '<tr class="b-statistics__table-row"><td class="b-statistics__table-col"><a class="b-link" href="http://ufcstats.com/event-details/{id}">{id}</a></td></tr>'
+
+
+def listing(ids):
+    response = Mock(headers={}, encoding="utf-8")
+    response.iter_content.return_value = [("<html><body><table>" + "".join(ROW.format(id=id) for id in ids) + "</table></body></html>").encode()]
+    return response
+
+
+def page_of(url):
+    return url.rsplit("page=", 1)[1]
+
+
+@pytest.fixture
+def scraper():
+    return UFCStatsScraper(wait_time=1, ignore_errors=False)
+
+
+def test_single_page_listing(scraper):
+    ids = [f"e{i:03d}" for i in range(60)]
+    with patch.object(scraper.session, "get", return_value=listing(ids)) as get:
+        assert scraper.scrape_all_event_ids() == ids
+    assert get.call_count == 1
+    assert page_of(get.call_args.args[0]) == "all"
+
+
+def paginated(pages, fail_all=False):
+    """A session.get serving ``pages`` as pages 1..n and nothing after."""
+    lock = threading.Lock()
+    requested = []
+
+    def get(url, **kwargs):
+        page = page_of(url)
+        with lock:
+            requested.append(page)
+        if page == "all":
+            if fail_all:
+                raise requests.ConnectionError("refused")
+            return listing(pages[0])
+        page = int(page)
+        return listing(pages[page - 1] if page <= len(pages) else [])
+
+    return get, requested
+
+
+@pytest.mark.parametrize("fail_all", [False, True])
+def test_falls_back_to_concurrent_pages(scraper, fail_all):
+    pages = [[f"e{p}{i:02d}" for i in range(25)] for p in range(5)]
+    # An event shown on two pages is listed once
+    pages[3][0] = pages[2][0]
+    get, requested = paginated(pages, fail_all)
+    with patch.object(scraper.session, "get", side_effect=get):
+        ids = scraper.scrape_all_event_ids(max_workers=3)
+
+    expected = [id for page in pages for id in page]
+    assert ids == list(dict.fromkeys(expected))
+    # Pages are fetched in batches of three until the first empty page
+    assert sorted(page for page in requested if page != "all") == [str(p) for p in range(1, 7)]
+
+
+def test_short_single_page_listing_is_complete(scraper):
+    get, requested = paginated([["a1", "a2"]])
+    with patch.object(scraper.session, "get", side_effect=get):
+        assert scraper.scrape_all_fighter_ids("a") == ["a1", "a2"]
+    assert requested == ["all"]
+
+
+def test_fighter_listing_fallback_uses_letter(scraper):
+    get, requested = paginated([["a1", "a2"]], fail_all=True)
+    with patch.object(scraper.session, "get", side_effect=get) as mock:
+        assert scraper.scrape_all_fighter_ids("a", max_workers=2) == ["a1", "a2"]
+    assert all("char=a&" in call.args[0] for call in mock.call_args_list)
@@ -0,0 +1,70 @@
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from scrapers import UFCStatsScraper, PageCache
+
+
+def test_lru_evicts_by_size():
+    cache = PageCache(max_bytes=10)
+    cache.get("a", lambda: ("A", 4))
+    cache.get("b", lambda: ("B", 4))
+    cache.get("a", lambda: ("stale", 4))
+    cache.get("c", lambda: ("C", 4))
+
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.get("a", lambda: ("stale", 4)) == "A"
+    assert (cache.size, cache.evictions, cache.hits) == (8, 1, 2)
+    # Too large to keep at all
+    cache.get("d", lambda: ("D", 11))
+    assert "d" not in cache.entries
+
+
+def test_concurrent_requests_share_one_load():
+    cache = PageCache()
+    calls = []
+    started = threading.Event()
+
+    def load():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return "page", 4
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("url", load))) for _ in range(8)]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["page"] * 8
+    assert cache.coalesced == 7
+
+
+def test_failed_loads_are_not_cached():
+    cache = PageCache()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        cache.get("url", fail)
+    assert cache.get("url", lambda: ("page", 4)) == "page"
+    assert cache.pending == {}
+
+
+def test_scraper_fetches_and_parses_each_url_once():
+    scraper = UFCStatsScraper(wait_time=1, ignore_errors=False, page_cache=PageCache())
+    response = Mock(headers={}, encoding="utf-8")
+    response.iter_content.return_value = [b"<html><body><p>page</p></body></html>"]
+    with patch.object(scraper.session, "get", return_value=response) as get:
+        first = scraper.fetch_soup("http://www.ufcstats.com/event-details/1")
+        second = scraper.fetch_soup("http://www.ufcstats.com/event-details/1")
+        scraper.fetch_soup("http://www.ufcstats.com/event-details/2")
+
+    assert first is second
+    assert get.call_count == 2
@@ -0,0 +1,80 @@
+import json
+import os
+import pandas as pd
+import pytest
+from datasets import ChangeFeed, DataController
+
+
+def read_delta(feed, dataset):
+    with open(os.path.join(feed.directory, dataset + ".jsonl")) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_net_operations():
+    feed = ChangeFeed("feed", run="r")
+    feed.record("fighters", "insert", ["a", "b", "c"])
+    feed.record("fighters", "update", ["a", "d"])
+    feed.record("fighters", "delete", ["b", "e"])
+    feed.record("fighters", "insert", ["e"])
+    assert feed.changes["fighters"] == {"a": "insert", "c": "insert", "d": "update", "e": "update"}
+    assert feed.counts("fighters") == {"insert": 2, "update": 2, "delete": 0}
+
+
+def test_write_delta_and_manifest(tmp_path):
+    feed = ChangeFeed(str(tmp_path), run="r")
+    data = pd.DataFrame({"fight": ["f1", "f1", "f2"], "fighter": ["a", "b", "a"], "result": ["win", "loss", "draw"]})
+    feed.record("fighter_fights", "insert", [("f1", "a"), ("f2", "a")])
+    feed.record("fighter_fights", "delete", [("f3", "c")])
+    feed.write("fighter_fights", data, ["fight", "fighter"])
+
+    assert read_delta(feed, "fighter_fights") == [
+        {"op": "insert", "fight": "f1", "fighter": "a", "result": "win"},
+        {"op": "insert", "fight": "f2", "fighter": "a", "result": "draw"},
+        {"op": "delete", "fight": "f3", "fighter": "c"},
+    ]
+    with open(tmp_path / "r" / "manifest.json") as f:
+        manifest = json.load(f)
+    assert manifest["datasets"]["fighter_fights"] == {
+        "file": "fighter_fights.jsonl", "key": ["fight", "fighter"], "rows": 3, "insert": 2, "update": 0, "delete": 1,
+    }
+
+
+def test_unchanged_updates_are_dropped(tmp_path):
+    feed = ChangeFeed(str(tmp_path), run="r")
+    loaded = pd.DataFrame({"id": ["a", "b"], "wins": [1, 2]})
+    feed.snapshot("fighters", loaded, ["id"])
+    feed.record("fighters", "update", ["a", "b"])
+    feed.write("fighters", pd.DataFrame({"id": ["a", "b"], "wins": [1, 3]}), ["id"])
+    assert read_delta(feed, "fighters") == [{"op": "update", "id": "b", "wins": 3}]
+
+    # Saving again after b is reverted leaves nothing to report
+    feed.write("fighters", loaded, ["id"])
+    assert not os.path.exists(os.path.join(feed.directory, "fighters.jsonl"))
+    assert feed.manifest["datasets"]["fighters"]["file"] is None
+
+
+def test_controller_records_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame({"id": ["e1", "e2"], "title": ["One", "Two"]}).to_csv("events.csv", index=False)
+    feed = ChangeFeed("feed", run="r")
+    controller = DataController(["events"], True, False, changefeed=feed)
+
+    controller.upsert("events", [{"id": "e1", "title": "One"}, {"id": "e2", "title": "Two (renamed)"}, {"id": "e3", "title": "Three"}])
+    assert controller.delete("events", ["e1", "e9"]) == 1
+    controller.save("events", True)
+
+    assert read_delta(feed, "events") == [
+        {"op": "update", "id": "e2", "title": "Two (renamed)"},
+        {"op": "insert", "id": "e3", "title": "Three"},
+        {"op": "delete", "id": "e1"},
+    ]
+    assert controller.table("events")["id"].tolist() == ["e2", "e3"]
+
+
+def test_runs_never_share_a_directory(tmp_path):
+    data = pd.DataFrame({"id": ["a"]})
+    first, second = ChangeFeed(str(tmp_path), run="r"), ChangeFeed(str(tmp_path), run="r")
+    first.write("fighters", data, ["id"])
+    first.write("events", data, ["id"])
+    with pytest.raises(FileExistsError):
+        second.write("fighters", data, ["id"])
@@ -0,0 +1,89 @@
+import pytest
+from unittest.mock import Mock, patch
+from datasets import Dataset
+from scrapers import UFCStatsScraper, ContentHashStore
+
+FIGHTER_PAGE = """
+<html><body>
+<h2 class="b-content__title">
+  <span class="b-content__title-highlight">Tom Aaron</span>
+  <span class="b-content__title-record">Record: {record}</span>
+</h2>
+<div class="b-list__info-box"><ul class="b-list__box-list">
+  <li class="b-list__box-list-item"><i class="b-list__box-item-title">Height:</i> 5' 11"</li>
+  <li class="b-list__box-list-item"><i class="b-list__box-item-title">STANCE:</i> Orthodox</li>
+</ul></div>
+</body></html>
+"""
+
+
+def test_digest_ignores_whitespace():
+    assert ContentHashStore.digest("<p>a  b</p>\n") == ContentHashStore.digest("<p>a b</p>")
+    assert ContentHashStore.digest("<p>a b</p>") != ContentHashStore.digest("<p>a c</p>")
+
+
+def test_store_round_trip(tmp_path):
+    file = str(tmp_path / "hashes")
+    store = ContentHashStore(file)
+    store.record("a", "123")
+    store.save()
+    assert ContentHashStore(file).hashes == {"a": "123"}
+
+
+def test_retain_forgets_hashes_of_lost_rows(tmp_path):
+    store = ContentHashStore(str(tmp_path / "hashes"))
+    store.record("a", "1")
+    store.record("b", "2")
+    assert store.retain(["a", "c"]) == 1
+    assert store.hashes == {"a": "1"}
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    return UFCStatsScraper(wait_time=1, ignore_errors=False, content_hashes=ContentHashStore(str(tmp_path / "hashes")))
+
+
+def page(record):
+    response = Mock(headers={}, encoding="utf-8")
+    response.iter_content.return_value = [FIGHTER_PAGE.format(record=record).encode()]
+    return response
+
+
+def test_unchanged_fighter_page_is_skipped(scraper):
+    with patch.object(scraper.session, "get", return_value=page("5-3-0")):
+        first = scraper.scrape_fighters(["93fe7332d16c6ad9"], early_stopping=lambda id: False)
+        second = scraper.scrape_fighters(["93fe7332d16c6ad9"], early_stopping=lambda id: False)
+
+    assert [fighter.win for fighter in first] == ["5"]
+    assert first[0].height == "5' 11"
+    assert second == []
+    assert (scraper.content_hashes.changed, scraper.content_hashes.unchanged) == (1, 1)
+    assert scraper.content_hashes.unchanged_keys == {"93fe7332d16c6ad9"}
+
+
+def test_changed_fighter_page_is_parsed(scraper):
+    with patch.object(scraper.session, "get", return_value=page("5-3-0")):
+        scraper.scrape_fighter("93fe7332d16c6ad9")
+    with patch.object(scraper.session, "get", return_value=page("6-3-0")):
+        fighter = scraper.scrape_fighter("93fe7332d16c6ad9")
+
+    assert fighter.win == "6"
+    assert scraper.content_hashes.changed == 2
+
+
+def test_failed_parse_does_not_record_hash(scraper):
+    response = Mock(headers={}, encoding="utf-8")
+    response.iter_content.return_value = [b"<html></html>"]
+    with patch.object(scraper.session, "get", return_value=response):
+        with pytest.raises(ValueError):
+            scraper.scrape_fighter("93fe7332d16c6ad9")
+    assert scraper.content_hashes.hashes == {}
+
+
+def test_dataset_upsert_rows(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dataset = Dataset("fighters", update=True)
+    dataset.add_rows([{"id": "a", "win": 1}, {"id": "b", "win": 2}])
+    assert dataset.upsert_rows([{"id": "b", "win": "3"}, {"id": "c", "win": "4"}]) == 1
+    assert dataset.data["id"].tolist() == ["a", "b", "c"]
+    assert dataset.data["win"].tolist() == [1, "3", "4"]
@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+from datasets import Dataset
+
+
+@pytest.fixture
+def dataset(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dataset = Dataset("fights", update=False)
+    dataset.add_rows([{"id": str(i), "event": f"e{i // 2}", "time": "5:00"} for i in range(5)])
+    return dataset
+
+
+def test_iter_chunks(dataset):
+    chunks = list(dataset.iter_chunks(["id", "event"], chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert list(chunks[0].columns) == ["id", "event"]
+
+
+def test_iter_rows_and_column(dataset):
+    assert next(dataset.iter_rows("id", chunksize=2)) == {"id": "0"}
+    assert list(dataset.iter_column("event", chunksize=3)) == ["e0", "e0", "e1", "e1", "e2"]
+
+
+def test_invalid_chunk_size(dataset):
+    with pytest.raises(ValueError):
+        list(dataset.iter_chunks(chunksize=0))
+
+
+def test_export_csv(dataset, tmp_path):
+    assert dataset.export_csv(str(tmp_path / "export.csv"), chunksize=2) == 5
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "export.csv", dtype=str), dataset.data.astype(str))
+
+
+def test_export_empty_keeps_header(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dataset = Dataset("events", update=False, columns=["id", "date"])
+    assert dataset.export_csv("export.csv") == 0
+    assert (tmp_path / "export.csv").read_text().strip() == "id,date"
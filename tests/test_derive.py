@@ -0,0 +1,69 @@
+import pandas as pd
+from unittest.mock import Mock, patch
+from datasets import Fight, derive_fighter_fights
+from scrapers import UFCStatsScraper
+
+FIGHT_PAGE = """
+<html><body>
+<div class="b-fight-details__person">
+  <i class="b-fight-details__person-status">{red}</i>
+  <h3 class="b-fight-details__person-name"><a href="http://www.ufcstats.com/fighter-details/c21f26bbde777573">Red</a></h3>
+</div>
+<div class="b-fight-details__person">
+  <i class="b-fight-details__person-status">{blue}</i>
+  <h3 class="b-fight-details__person-name"><a href="http://www.ufcstats.com/fighter-details/8a65fd9ba31fd3f7">Blue</a></h3>
+</div>
+<i class="b-fight-details__fight-title">Light Heavyweight Bout</i>
+<i class="b-fight-details__text-item_first"><i class="b-fight-details__label">Method:</i> KO/TKO</i>
+<i class="b-fight-details__text-item"><i class="b-fight-details__label">Round:</i> 2</i>
+<i class="b-fight-details__text-item"><i class="b-fight-details__label">Time:</i> 2:37</i>
+</body></html>
+"""
+
+
+def fights(*rows):
+    return pd.DataFrame([Fight(id, red_id=red, blue_id=blue, red_result=red_result, blue_result=blue_result).to_dict()
+                         for id, red, blue, red_result, blue_result in rows])
+
+
+def test_each_fight_becomes_two_rows():
+    derived = derive_fighter_fights(fights(("f1", "a", "b", "win", "loss"), ("f2", "c", "a", "draw", "draw")))
+    assert derived.values.tolist() == [
+        ["f1", "a", "b", "win"],
+        ["f1", "b", "a", "loss"],
+        ["f2", "c", "a", "draw"],
+        ["f2", "a", "c", "draw"],
+    ]
+
+
+def test_missing_results():
+    data = fights(("f1", "a", "b", "", "win"), ("f2", "c", "d", "", ""))
+    # Fights scraped before results were recorded have no result columns at all
+    old = data.drop(columns=["red_result", "blue_result"])
+
+    assert derive_fighter_fights(data).values.tolist() == [["f1", "a", "b", "loss"], ["f1", "b", "a", "win"]]
+    assert derive_fighter_fights(old).empty
+
+
+def test_only_new_fights_are_derived():
+    existing = derive_fighter_fights(fights(("f1", "a", "b", "win", "loss")))
+    derived = derive_fighter_fights(fights(("f2", "a", "c", "nc", "nc"), ("f1", "a", "b", "win", "loss")), existing)
+    assert derived["fight"].tolist() == ["f2", "f2"]
+    assert derive_fighter_fights(pd.DataFrame(columns=["id"]), existing).empty
+
+
+def test_rescraped_fights_are_not_duplicated():
+    history = derive_fighter_fights(fights(*[(f"f{i}", "a", f"o{i}", "win", "loss") for i in range(100)]))
+    # Only the fights of this run are passed in; one of them was stored before
+    derived = derive_fighter_fights(fights(("f7", "a", "o7", "win", "loss"), ("f100", "a", "b", "loss", "win")), history)
+    assert derived.values.tolist() == [["f100", "a", "b", "loss"], ["f100", "b", "a", "win"]]
+
+
+def test_scrape_fight_records_results():
+    scraper = UFCStatsScraper(wait_time=1, ignore_errors=False)
+    response = Mock(headers={}, encoding="utf-8")
+    response.iter_content.return_value = [FIGHT_PAGE.format(red="L", blue="W").encode()]
+    with patch.object(scraper.session, "get", return_value=response):
+        fight = scraper.scrape_fight("2eecf0c36192e40c", "754968e325d6f60d")
+    assert (fight.red_result, fight.blue_result) == ("loss", "win")
+    assert fight.red_id == "c21f26bbde777573"
@@ -0,0 +1,44 @@
+import pandas as pd
+from datasets import check_integrity
+
+
+def tables():
+    return {
+        "events": pd.DataFrame({"id": ["e1", "e2", "e3"]}),
+        "fights": pd.DataFrame({
+            "id": ["f1", "f2", "f3"],
+            "event": ["e1", "e2", "e4"],
+            "red_id": ["a", "b", "c"],
+            "blue_id": ["b", "x", None],
+        }),
+        "fighters": pd.DataFrame({"id": ["a", "b", "c"]}),
+        "fighter_fights": pd.DataFrame({
+            "fight": ["f1", "f1", "f9"],
+            "fighter": ["a", "b", "y"],
+            "opponent": ["b", "a", "x"],
+        }),
+    }
+
+
+def test_finds_missing_entities():
+    missing = check_integrity(tables())
+    # e3 has no fights stored, e4 is referenced but never scraped
+    assert missing == {"events": ["e4", "e3"], "fights": ["f9"], "fighters": ["x", "y"]}
+
+
+def test_consistent_tables_have_nothing_missing():
+    data = tables()
+    data["events"] = pd.DataFrame({"id": ["e1", "e2", "e4"]})
+    data["fighters"] = pd.DataFrame({"id": ["a", "b", "c", "x", "y"]})
+    data["fights"] = pd.concat([data["fights"], pd.DataFrame({"id": ["f9"], "event": ["e1"], "red_id": ["y"], "blue_id": ["x"]})])
+    assert check_integrity(data) == {"events": [], "fights": [], "fighters": []}
+
+
+def test_empty_and_partial_tables():
+    data = {"events": pd.DataFrame(columns=["id"]), "fights": pd.DataFrame({"id": ["f1"], "event": ["e1"], "red_id": [""], "blue_id": ["a"]})}
+    assert check_integrity(data) == {"events": ["e1"], "fights": [], "fighters": []}
+
+
+def test_confirmed_empty_events_are_not_missing():
+    missing = check_integrity(tables(), empty_events={"e3"})
+    assert missing["events"] == ["e4"]
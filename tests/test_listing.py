@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+from unittest.mock import Mock, patch
+from datasets import diff_fighter_listing
+from scrapers import UFCStatsScraper
+
+ROW = """<tr class="b-statistics__table-row">
+<td class="b-statistics__table-col"><a class="b-link" href="http://ufcstats.com/fighter-details/{id}">{first}</a></td>
+<td class="b-statistics__table-col"><a class="b-link" href="http://ufcstats.com/fighter-details/{id}">Last</a></td>
+<td class="b-statistics__table-col"><a class="b-link" href="http://ufcstats.com/fighter-details/{id}"></a></td>
+<td class="b-statistics__table-col">5' 11"</td>
+<td class="b-statistics__table-col">155 lbs.</td>
+<td class="b-statistics__table-col">{reach}</td>
+<td class="b-statistics__table-col">{stance}</td>
+<td class="b-statistics__table-col">10</td>
+<td class="b-statistics__table-col">2</td>
+<td class="b-statistics__table-col">0</td>
+<td class="b-statistics__table-col"></td>
+</tr>"""
+SPACER = '<tr class="b-statistics__table-row"><td class="b-statistics__table-col_type_clear" colspan="11"></td></tr>'
+
+
+def listed(**changes):
+    rows = pd.DataFrame({
+        "id": ["a", "b", "c", "d"],
+        "name": ["A", "B", "C", "D"],
+        "win": ["10", "5", "3", "1"],
+        "loss": ["2", "1", "0", "0"],
+        "draw": ["0", "0", "0", "0"],
+        "height": ["5' 11\"", "6' 0\"", "5' 8\"", "5' 6\""],
+        "weight": ["155 lbs.", "170 lbs.", "135 lbs.", "125 lbs."],
+        "reach": ["72.0\"", "--", "68.0\"", "66.0\""],
+        "stance": ["Orthodox", "", "Southpaw", "Orthodox"],
+    })
+    for column, values in changes.items():
+        rows[column] = values
+    return rows
+
+
+def stored():
+    # As read back from fighters.csv, for a, b and c
+    return pd.DataFrame({
+        "id": ["a", "b", "c"],
+        "name": ["A", "B", "C"],
+        "win": [10, 5, 3],
+        "loss": [2, 1, 0],
+        "draw": [0, 0, 0],
+        "no contest": [0, 0, 0],
+        "height": [71.0, 72.0, 68.0],
+        "weight": [155.0, 170.0, 135.0],
+        "reach": [72.0, np.nan, 68.0],
+        "stance": ["Orthodox", np.nan, "Southpaw"],
+        "slpm": [3.5, 0.0, np.nan],
+    })
+
+
+def test_new_and_incomplete_fighters_need_details():
+    # d is new; c was stored without career stats
+    assert diff_fighter_listing(listed(), stored()) == {"details": ["c", "d"], "listing": []}
+
+
+def test_changed_record_needs_details_and_bio_change_does_not():
+    plan = diff_fighter_listing(listed(win=["11", "5", "3", "1"], stance=["Orthodox", "Switch", "Southpaw", "Orthodox"]), stored())
+    assert plan == {"details": ["a", "c", "d"], "listing": ["b"]}
+
+
+def test_nothing_stored():
+    assert diff_fighter_listing(listed(), pd.DataFrame(columns=["id"])) == {"details": ["a", "b", "c", "d"], "listing": []}
+
+
+def test_listing_rows_are_parsed():
+    scraper = UFCStatsScraper(wait_time=1, ignore_errors=False)
+    response = Mock(headers={}, encoding="utf-8")
+    response.iter_content.return_value = [("<table>" + SPACER + ROW.format(id="a", first="Al", reach='72.0"', stance="Orthodox") + ROW.format(id="b", first="Bo", reach="--", stance="") + "</table>").encode()]
+    with patch.object(scraper.session, "get", return_value=response):
+        fighters = scraper.scrape_fighter_listing_rows("a", "all")
+    assert [fighter.to_dict() for fighter in fighters][1] == {
+        "id": "b", "name": "Bo Last", "win": "10", "loss": "2", "draw": "0", "no contest": "",
+        "height": "5' 11", "weight": "155 lbs.", "reach": "--", "stance": "",
+        "dob": "", "slpm": "", "str. acc.": "", "sapm": "", "str. def": "", "td avg.": "", "td acc.": "", "td def.": "", "sub. avg.": "",
+        "fights": [],
+    }
+    assert fighters[0].reach == "72.0" and fighters[0].stance == "Orthodox"
@@ -0,0 +1,68 @@
+import logging
+import pytest
+from logging_config import DeferredQueueHandler, RateLimitFilter, setup_logging, stop_logging
+
+
+def make_record(msg="Fetching URL: %s", args=("http://example.com",)):
+    return logging.LogRecord("scrapers.base", logging.DEBUG, __file__, 1, msg, args, None)
+
+
+def test_rate_limit_filter_window(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr("logging_config.time.monotonic", lambda: clock[0])
+    rate_limit = RateLimitFilter(burst=2, interval=60)
+
+    assert [rate_limit.filter(make_record()) for _ in range(4)] == [True, True, False, False]
+    assert rate_limit.filter(make_record(msg="other %s")) is True
+
+    clock[0] = 61.0
+    record = make_record()
+    assert rate_limit.filter(record) is True
+    assert record.getMessage() == "Fetching URL: http://example.com (2 similar messages suppressed)"
+
+
+def test_deferred_handler_does_not_format():
+    record = make_record()
+    handler = DeferredQueueHandler(None)
+    prepared = handler.prepare(record)
+    assert prepared is record
+    assert prepared.args == ("http://example.com",)
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    stop_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_queued_logging_writes_on_stop(tmp_path, restore_root_logger):
+    log_file = tmp_path / "scraper.log"
+    setup_logging(str(log_file), level=logging.DEBUG, queued=True, rate_limit=1)
+    logger = logging.getLogger("scrapers.base")
+    for _ in range(3):
+        logger.debug("Fetching URL: %s", "http://example.com")
+    stop_logging()
+
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 1
+    assert lines[0].endswith("DEBUG - scrapers.base - Fetching URL: http://example.com")
+
+
+def test_setup_again_stops_previous_listener(tmp_path, restore_root_logger, monkeypatch):
+    import atexit
+    import logging_config
+
+    registered = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    monkeypatch.setattr(logging_config, "_stop_registered", False)
+    setup_logging(str(tmp_path / "first.log"), queued=True)
+    first = logging_config._listener
+    setup_logging(str(tmp_path / "second.log"), queued=True)
+
+    assert first._thread is None
+    assert all(handler.stream is None for handler in first.handlers if isinstance(handler, logging.FileHandler))
+    assert registered == [stop_logging]
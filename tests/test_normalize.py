@@ -0,0 +1,63 @@
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+from datasets import Dataset
+from datasets.normalize import NORMALIZERS, to_date, to_fraction, to_inches, to_number, to_seconds
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_to_inches():
+    column = pd.Series(["5' 11", "6' 0", "--", None, "71.0"])
+    assert to_inches(column).tolist()[:2] == [71.0, 72.0]
+    assert to_inches(column).isna().tolist() == [False, False, True, True, False]
+    assert to_inches(column).iloc[4] == 71.0
+
+
+def test_to_number_strips_units():
+    column = pd.Series(["155 lbs.", '72"', "--", 3.29])
+    result = to_number(column)
+    assert result.iloc[0] == 155.0
+    assert result.iloc[1] == 72.0
+    assert np.isnan(result.iloc[2])
+    assert result.iloc[3] == 3.29
+
+
+def test_to_fraction():
+    result = to_fraction(pd.Series(["38%", "0%", "0.57", "--"]))
+    assert result.iloc[:3].tolist() == [0.38, 0.0, 0.57]
+    assert np.isnan(result.iloc[3])
+
+
+def test_to_seconds():
+    assert to_seconds(pd.Series(["2:37", "5:00", "157.0"])).tolist() == [157.0, 300.0, 157.0]
+
+
+def test_to_date_accepts_display_and_iso():
+    result = to_date(pd.Series(["August 23, 2025", "2025-08-16", "--"]), format="%B %d, %Y")
+    assert result.dt.strftime("%Y-%m-%d").tolist()[:2] == ["2025-08-23", "2025-08-16"]
+    assert pd.isna(result.iloc[2])
+
+
+def test_converters_keep_index():
+    column = pd.Series(["1:00", "2:00", "1:00"], index=[10, 11, 12])
+    assert to_seconds(column).to_dict() == {10: 60.0, 11: 120.0, 12: 60.0}
+
+
+@pytest.mark.parametrize("dataset,file", [("fighters", "fighters.csv"), ("fights", "Fights.csv"), ("events", "Events.csv")])
+def test_normalizers_are_idempotent(dataset, file, tmp_path):
+    normalized = NORMALIZERS[dataset](pd.read_csv(ROOT / file))
+    normalized.to_csv(tmp_path / "once.csv", index=False)
+    NORMALIZERS[dataset](pd.read_csv(tmp_path / "once.csv")).to_csv(tmp_path / "twice.csv", index=False)
+    assert (tmp_path / "once.csv").read_text() == (tmp_path / "twice.csv").read_text()
+
+
+def test_dataset_normalizes_on_direct_save(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dataset = Dataset("fights", update=False, normalizer=NORMALIZERS["fights"])
+    dataset.add_row({"id": "1", "round": "2", "time": "2:37"})
+    dataset.save(direct=True)
+    saved = pd.read_csv(tmp_path / "fights.csv")
+    assert saved.loc[0, "time"] == 157.0
+    assert saved.loc[0, "round"] == 2
@@ -0,0 +1,62 @@
+import os
+import pandas as pd
+import pytest
+from datasets import DataController
+from datasets.partition import Partitioning, event_dates, fight_dates
+from datasets.records import Fight
+
+
+@pytest.fixture
+def events():
+    return pd.DataFrame({
+        "id": ["e3", "e2", "e1"],
+        "date": ["August 23, 2025", "March 01, 2024", "--"],
+    })
+
+
+def test_write_and_read_round_trip(events, tmp_path):
+    partitioning = Partitioning(str(tmp_path / "events"), event_dates)
+    assert sorted(partitioning.write(events)) == ["2024", "2025", "unknown"]
+    assert partitioning.read()["id"].tolist() == ["e3", "e2", "e1"]
+
+
+def test_only_changed_partitions_are_written(events, tmp_path):
+    partitioning = Partitioning(str(tmp_path / "events"), event_dates)
+    partitioning.write(events)
+    modified = os.path.getmtime(partitioning.path("2024"))
+
+    new_event = pd.DataFrame({"id": ["e4"], "date": ["September 06, 2025"]})
+    assert partitioning.write(pd.concat([events, new_event], ignore_index=True)) == ["2025"]
+    assert os.path.getmtime(partitioning.path("2024")) == modified
+    assert pd.read_csv(partitioning.path("2025"))["id"].tolist() == ["e4", "e3"]
+
+
+def test_stale_partitions_are_removed(events, tmp_path):
+    partitioning = Partitioning(str(tmp_path / "events"), event_dates)
+    partitioning.write(events)
+    partitioning.write(events.iloc[:2])
+    assert not os.path.exists(partitioning.path("unknown"))
+
+
+def test_fight_dates_follow_events(events):
+    fights = pd.DataFrame({"id": ["f1", "f2"], "event": ["e2", "missing"]})
+    dates = fight_dates(fights, events)
+    assert dates.iloc[0] == pd.Timestamp("2024-03-01")
+    assert pd.isna(dates.iloc[1])
+
+
+def test_controller_saves_and_loads_partitions(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    controller = DataController(["events", "fights"], update=False, direct=False, partition_dir="data")
+    controller.insert("events", [{"id": "e1", "title": "UFC 1", "date": "November 12, 1993"}])
+    controller.insert("fights", [Fight(id="f1", event="e1", time="1:44")])
+    controller.save("events", True)
+    controller.save("fights", True)
+
+    assert os.listdir("data/events") == ["1993.csv"]
+    assert os.listdir("data/fights") == ["1993.csv"]
+    assert not os.path.exists("fights.csv")
+
+    reloaded = DataController(["events", "fights"], update=False, direct=False, partition_dir="data")
+    assert reloaded.table("fights")["time"].tolist() == [104.0]
+    assert reloaded.get_early_stopping("events")("e1")
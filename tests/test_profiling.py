@@ -0,0 +1,55 @@
+import os
+import pstats
+import time
+from profiling import StageProfiler
+
+
+def busy(seconds):
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+
+def test_stages_split_wait_and_cpu(tmp_path):
+    profiler = StageProfiler(str(tmp_path / "prof"))
+    with profiler.stage("fetch"):
+        time.sleep(0.2)
+    with profiler.stage("parse"):
+        busy(0.1)
+    with profiler.stage("fetch"):
+        time.sleep(0.1)
+    profiler.save()
+
+    assert profiler.wall["fetch"] >= 0.3
+    assert profiler.wall["fetch"] - profiler.cpu["fetch"] > 0.25
+    assert profiler.cpu["parse"] >= 0.1
+    assert sorted(os.listdir(tmp_path / "prof")) == ["fetch.prof", "parse.prof", "summary.txt"]
+    assert pstats.Stats(str(tmp_path / "prof" / "parse.prof")).total_calls > 0
+    assert "busy" in (tmp_path / "prof" / "summary.txt").read_text()
+
+
+def test_iterate_profiles_only_producing_items():
+    def pages():
+        for page in range(3):
+            busy(0.02)
+            yield page
+
+    profiler = StageProfiler("unused")
+    consumed = []
+    for page in profiler.iterate("listing", pages()):
+        with profiler.stage("scrape"):
+            consumed.append(page)
+    assert consumed == [0, 1, 2]
+    assert profiler.cpu["listing"] >= 0.06
+    assert profiler.cpu["scrape"] < 0.06
+
+
+def test_disabled_profiler_is_a_no_op(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    profiler = StageProfiler(None)
+    with profiler.stage("fetch"):
+        pass
+    assert list(profiler.iterate("listing", [1, 2])) == [1, 2]
+    profiler.save()
+    assert profiler.profiles == {}
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+from datasets import DataController, DataQuery
+from datasets.records import Fight, Fighter
+
+
+@pytest.fixture
+def controller(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame({
+        "id": ["f1", "f2", "f3"],
+        "event": ["e1", "e1", "e2"],
+        "red_id": ["a", "b", "c"],
+        "blue_id": ["b", "c", "a"],
+    }).to_csv("fights.csv", index=False)
+    pd.DataFrame({
+        "id": ["a", "b", "c"],
+        "name": ["Conor McGregor", "Jon Jones", "Demetrious Johnson"],
+    }).to_csv("fighters.csv", index=False)
+    return DataController(["fights", "fighters"], update=False, direct=False)
+
+
+def test_lookups(controller):
+    query = DataQuery(controller)
+    assert query.fights_for_fighter("a")["id"].tolist() == ["f1", "f3"]
+    assert query.fights_at_event("e1")["id"].tolist() == ["f1", "f2"]
+    assert query.fights_for_fighter("missing").empty
+
+
+def test_name_prefix_matches_any_word(controller):
+    query = DataQuery(controller)
+    assert query.fighters_by_name("Mc")["id"].tolist() == ["a"]
+    assert query.fighters_by_name("jo")["id"].tolist() == ["b", "c"]
+    assert query.fighters_by_name("jon jo")["id"].tolist() == ["b"]
+
+
+def test_indexes_follow_inserts(controller):
+    query = DataQuery(controller)
+    controller.insert("fights", [Fight(id="f4", event="e3", red_id="a", blue_id="d")])
+    assert query.fights_for_fighter("a")["id"].tolist() == ["f1", "f3", "f4"]
+    assert query.fights_at_event("e3")["id"].tolist() == ["f4"]
+
+    controller.insert("fighters", [Fighter(id="d", name="Michael McDonald")], prepend=True)
+    assert query.fighters_by_name("mc")["id"].tolist() == ["d", "a"]
+    assert query.fighter("b")["name"].tolist() == ["Jon Jones"]
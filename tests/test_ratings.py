@@ -0,0 +1,77 @@
+import pandas as pd
+import pytest
+from datasets.ratings import RatingEngine, fight_outcomes
+
+
+@pytest.fixture
+def events():
+    return pd.DataFrame({
+        "id": ["e2", "e1"],
+        "date": ["February 01, 2024", "January 01, 2024"],
+    })
+
+
+@pytest.fixture
+def fights():
+    # Newest first, as the scraper stores them
+    return pd.DataFrame({
+        "id": ["f3", "f2", "f1"],
+        "event": ["e2", "e2", "e1"],
+        "method": ["Decision - Unanimous", "KO/TKO", "Submission"],
+        "red_id": ["a", "c", "a"],
+        "blue_id": ["c", "b", "b"],
+        "red_result": ["loss", "win", "win"],
+    })
+
+
+def test_fight_outcomes_order_and_scores(fights, events):
+    outcomes = fight_outcomes(fights, events)
+    assert outcomes["id"].tolist() == ["f1", "f2", "f3"]
+    assert outcomes["score"].tolist() == [1.0, 1.0, 0.0]
+
+
+def test_fight_outcomes_from_fighter_fights(fights, events):
+    fighter_fights = pd.DataFrame({
+        "fight": ["f1", "f1", "f2"],
+        "fighter": ["a", "b", "c"],
+        "opponent": ["b", "a", "b"],
+        "result": ["win", "loss", "nc"],
+    })
+    outcomes = fight_outcomes(fights.drop(columns="red_result"), events, fighter_fights)
+    assert outcomes["id"].tolist() == ["f1"]
+
+
+def test_replay_aggregates(fights, events, tmp_path):
+    engine = RatingEngine(file=str(tmp_path / "ratings"))
+    assert engine.replay(fights, events) == 3
+
+    frame = engine.to_frame().set_index("id")
+    assert frame.loc["c", "wins"] == 2
+    assert frame.loc["c", "streak"] == 2
+    assert frame.loc["c", "finishes"] == 1
+    assert frame.loc["c", "finish_rate"] == 0.5
+    assert frame.loc["b", "streak"] == -2
+    assert frame.loc["a", "best_streak"] == 1
+    assert frame["rating"].idxmax() == "c"
+
+
+def test_incremental_update_matches_replay(fights, events, tmp_path):
+    file = str(tmp_path / "ratings")
+    engine = RatingEngine(file=file)
+    engine.update(fights[fights["event"] == "e1"], events)
+    engine.save()
+
+    resumed = RatingEngine(file=file)
+    assert resumed.update(fights, events) == 2
+    assert resumed.update(fights, events) == 0
+
+    replayed = RatingEngine(file=str(tmp_path / "other"))
+    replayed.replay(fights, events)
+    pd.testing.assert_frame_equal(resumed.to_frame(), replayed.to_frame())
+
+
+def test_older_fight_triggers_replay(fights, events, tmp_path):
+    engine = RatingEngine(file=str(tmp_path / "ratings"))
+    engine.update(fights[fights["event"] == "e2"], events)
+    assert engine.update(fights, events) == 3
+    assert engine.processed == {"f1", "f2", "f3"}
@@ -0,0 +1,52 @@
+import pytest
+import pandas as pd
+from datasets import Dataset
+from datasets.records import Event, Fight, Fighter, FighterFight, records_to_columns
+
+
+def test_to_dict_uses_dataset_columns():
+    fighter = Fighter(id="1", name="Tom Aaron", no_contest="0", str_acc="38%")
+    row = fighter.to_dict()
+    assert list(row) == list(Fighter.COLUMNS)
+    assert row["no contest"] == "0"
+    assert row["str. acc."] == "38%"
+
+
+def test_records_have_no_instance_dict():
+    with pytest.raises(AttributeError):
+        Fight(id="1").extra = "x"
+
+
+def test_from_bio_ignores_unknown_labels():
+    fighter = Fighter.from_bio({"height": "5' 11", "td def.": "77%", "nickname": "x"}, id="1")
+    assert fighter.height == "5' 11"
+    assert fighter.td_def == "77%"
+    assert not hasattr(fighter, "nickname")
+
+
+def test_records_to_columns_keeps_list_values():
+    events = [
+        Event(id="a", fights=["f1", "f2"], weights=["Lightweight", "Welterweight"]),
+        Event(id="b", fights=["f3", "f4"], weights=["Flyweight", "Bantamweight"]),
+    ]
+    columns = records_to_columns(events)
+    assert list(columns) == list(Event.COLUMNS)
+    assert columns["id"].shape == (2,)
+    assert columns["fights"][1] == ["f3", "f4"]
+
+
+def test_records_to_columns_rejects_mixed_types():
+    with pytest.raises(TypeError):
+        records_to_columns([Fight(id="1"), FighterFight("1", "2", "3", "win")])
+
+
+def test_dataset_add_rows_from_records(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dataset = Dataset("fights", update=False)
+    dataset.add_rows([Fight(id="2", method="KO/TKO")])
+    dataset.add_rows([Fight(id="1", method="Submission")], prepend=True)
+    dataset.add_row(Fight(id="3"))
+
+    assert dataset.data["id"].tolist() == ["1", "2", "3"]
+    assert list(dataset.data.columns) == list(Fight.COLUMNS)
+    assert dataset.does_id_exist("2")
@@ -0,0 +1,141 @@
+from unittest.mock import MagicMock
+import pandas as pd
+import pytest
+import main
+from datasets import DataController, Event, Fight, Fighter, RefreshScheduler
+from scrapers import ContentHashStore
+
+NOW = pd.Timestamp("2025-09-01")
+
+
+@pytest.fixture
+def tables():
+    events = pd.DataFrame({
+        "id": ["recent", "old"],
+        "date": ["August 23, 2025", "March 01, 2015"],
+    })
+    fights = pd.DataFrame({
+        "id": ["f1", "f2", "f3"],
+        "event": ["recent", "recent", "old"],
+        "red_id": ["active", "active2", "retired"],
+        "blue_id": ["x", "y", "z"],
+    })
+    fighters = pd.DataFrame({"id": ["active", "active2", "retired"]})
+    return events, fights, fighters
+
+
+def test_never_scraped_recent_entities_are_due(tables, tmp_path):
+    scheduler = RefreshScheduler(file=str(tmp_path / "state"))
+    priorities = scheduler.priorities(*tables, now=NOW).set_index("id")["priority"]
+    assert priorities["recent"] == float("inf")
+    assert priorities["old"] == 0.0
+    assert priorities["retired"] == float("inf")
+
+
+def test_priority_follows_interval(tables, tmp_path):
+    scheduler = RefreshScheduler(file=str(tmp_path / "state"))
+    scheduler.mark("fighters", ["active", "retired"], NOW - pd.Timedelta(days=14))
+    scheduler.mark("events", ["recent"], NOW - pd.Timedelta(hours=12))
+    priorities = scheduler.priorities(*tables, now=NOW).set_index("id")["priority"]
+    assert priorities["active"] == pytest.approx(2.0)
+    assert priorities["retired"] == pytest.approx(14 / 365)
+    assert priorities["recent"] == pytest.approx(0.5)
+
+
+def test_plan_respects_budget(tables, tmp_path):
+    scheduler = RefreshScheduler(file=str(tmp_path / "state"))
+    # The recent event costs 3 requests (page plus two fights)
+    assert scheduler.plan(*tables, budget=4, now=NOW) == {"events": ["recent"], "fighters": ["active"]}
+    assert scheduler.plan(*tables, budget=2, now=NOW) == {"events": [], "fighters": ["active", "active2"]}
+
+
+def test_fresh_tables_are_never_scraped(tmp_path):
+    scheduler = RefreshScheduler(file=str(tmp_path / "state"))
+    empty = pd.DataFrame()
+    assert scheduler.priorities(empty, empty, empty).empty
+    assert scheduler.plan(empty, empty, empty, budget=10) == {"events": [], "fighters": []}
+
+    priorities = scheduler.priorities(pd.DataFrame({"id": ["e1"]}), empty, pd.DataFrame({"id": ["a"]}))
+    assert priorities["priority"].tolist() == [float("inf"), float("inf")]
+
+
+def test_state_round_trip(tables, tmp_path):
+    file = str(tmp_path / "state")
+    scheduler = RefreshScheduler(file=file)
+    scheduler.mark("fighters", ["active"], NOW)
+    scheduler.save()
+    assert RefreshScheduler(file=file).last_scraped["fighters"] == {"active": NOW}
+
+
+def test_refresh_marks_only_fetched_fighters(tables, tmp_path):
+    events, fights, fighters = tables
+    controller = MagicMock()
+    controller.table.side_effect = {"events": events, "fights": fights, "fighters": fighters}.get
+    scheduler = RefreshScheduler(file=str(tmp_path / "state"))
+    scraper = MagicMock()
+    scraper.content_hashes = ContentHashStore(str(tmp_path / "hashes"))
+    scraper.run.side_effect = lambda func, parameters: func(**parameters)
+    scraper.scrape_events.return_value = []
+
+    def scrape_fighters(ids, early_stopping, history):
+        scraper.content_hashes.unchanged_keys.add("active2")
+        return [Fighter(id="active")]
+
+    scraper.scrape_fighters.side_effect = scrape_fighters
+    main.refresh_scraping(scraper, controller, scheduler, 10, ignore_errors=True)
+    assert set(scheduler.last_scraped["fighters"]) == {"active", "active2"}
+
+    # A failed batch leaves every fighter due
+    scheduler = RefreshScheduler(file=str(tmp_path / "state"))
+    scraper.content_hashes = ContentHashStore(str(tmp_path / "hashes"))
+    scraper.scrape_fighters.side_effect = ConnectionError("reset")
+    main.refresh_scraping(scraper, controller, scheduler, 10, ignore_errors=True)
+    assert scheduler.last_scraped.get("fighters", {}) == {}
+
+
+def test_refresh_rederives_fighter_fights(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame({"id": ["e1"], "date": ["2025-08-23"]}).to_csv("events.csv", index=False)
+    pd.DataFrame({"id": ["f0", "f1"], "event": ["e0", "e1"], "red_id": ["a", "a"], "blue_id": ["c", "b"]}).to_csv("fights.csv", index=False)
+    pd.DataFrame({
+        "fight": ["f0", "f0", "f1", "f1"], "fighter": ["a", "c", "a", "b"],
+        "opponent": ["c", "a", "b", "a"], "result": ["win", "loss", "win", "loss"],
+    }).to_csv("fighter_fights.csv", index=False)
+    controller = DataController(["events", "fights", "fighters", "fighter_fights"], True, True)
+
+    scheduler = MagicMock()
+    scheduler.plan.return_value = {"events": ["e1"], "fighters": []}
+    scraper = MagicMock()
+    scraper.content_hashes = None
+    scraper.run.side_effect = lambda func, parameters: func(**parameters)
+    scraper.scrape_events.return_value = [Event("e1", fights=["f1", "f2"])]
+    # f1 was overturned to a no contest, f2 was added to the card
+    scraper.scrape_fights.return_value = [
+        Fight("f1", event="e1", red_id="a", blue_id="b", red_result="nc", blue_result="nc"),
+        Fight("f2", event="e1", red_id="b", blue_id="c", red_result="win", blue_result="loss"),
+    ]
+    scraper.scrape_fighters.return_value = []
+    main.refresh_scraping(scraper, controller, scheduler, 10, ignore_errors=False)
+
+    rows = controller.table("fighter_fights").sort_values(["fight", "fighter"])
+    assert rows.values.tolist() == [
+        ["f0", "a", "c", "win"], ["f0", "c", "a", "loss"],
+        ["f1", "a", "b", "nc"], ["f1", "b", "a", "nc"],
+        ["f2", "b", "c", "win"], ["f2", "c", "b", "loss"],
+    ]
+
+
+def test_refresh_marks_only_events_with_scraped_fights(tables, tmp_path):
+    events, fights, fighters = tables
+    controller = MagicMock()
+    controller.table.side_effect = {"events": events, "fights": fights, "fighters": fighters}.get
+    scheduler = RefreshScheduler(file=str(tmp_path / "state"))
+    scraper = MagicMock()
+    scraper.content_hashes = None
+    scraper.run.side_effect = lambda func, parameters: func(**parameters)
+    scraper.scrape_events.return_value = [Event("recent", fights=["f1", "f2"]), Event("old", fights=["f3"])]
+    # f2 failed and was skipped
+    scraper.scrape_fights.side_effect = lambda ids, event_id, early_stopping: [Fight(id) for id in ids if id != "f2"]
+    scraper.scrape_fighters.return_value = []
+    main.refresh_scraping(scraper, controller, scheduler, 10, ignore_errors=True)
+    assert set(scheduler.last_scraped["events"]) == {"old"}
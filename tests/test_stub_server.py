@@ -0,0 +1,101 @@
+from unittest.mock import Mock
+import pandas as pd
+import pytest
+import requests
+import main
+from benchmarks.ufcstats_stub import SyntheticSite, StubServer
+from datasets import check_integrity
+
+
+@pytest.fixture
+def site():
+    return SyntheticSite(events=30, fights=240, fighters=80)
+
+
+def test_full_run_against_stub(site, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with StubServer(site) as stub:
+        assert main.main(["--base-url", stub.url, "-b", "-w", "5", "--profile", "profile"], log=False) == 0
+
+    tables = {name: pd.read_csv(f"{name}.csv") for name in ("events", "fights", "fighters", "fighter_fights")}
+    assert len(tables["events"]) == 30
+    assert len(tables["fights"]) == 240
+    assert len(tables["fighters"]) == 80
+    assert len(tables["fighter_fights"]) == 480
+    assert tables["events"]["id"].tolist() == site.ids("events")
+    assert check_integrity(tables) == {"events": [], "fights": [], "fighters": []}
+
+    wins = tables["fighter_fights"].query("result == 'win'").groupby("fighter").size()
+    fighters = tables["fighters"].set_index("id")
+    assert (wins.reindex(fighters.index, fill_value=0) == fighters["win"]).all()
+
+
+def test_profile_is_saved_when_a_run_fails(site, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "derive_fighter_fights", Mock(side_effect=RuntimeError("derive failed")))
+    with StubServer(site) as stub, pytest.raises(RuntimeError):
+        main.main(["--base-url", stub.url, "-b", "-w", "5", "--profile", "profile"], log=False)
+
+    assert (tmp_path / "profile" / "summary.txt").exists()
+    assert (tmp_path / "profile" / "events.prof").exists()
+
+
+def test_repair_scrapes_only_missing_entities(site, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with StubServer(site) as stub:
+        main.main(["--base-url", stub.url, "-b", "-w", "5"], log=False)
+        full = {name: pd.read_csv(f"{name}.csv") for name in ("events", "fights", "fighters")}
+        # One event (its fights stay), one fight from another event and one fighter
+        full["events"].drop(index=3).to_csv("events.csv", index=False)
+        full["fights"].drop(index=0).to_csv("fights.csv", index=False)
+        full["fighters"].drop(index=5).to_csv("fighters.csv", index=False)
+
+        before = stub.requests
+        main.main(["--base-url", stub.url, "-w", "5", "-u", "-e", "-f", "-fi", "--repair"], log=False)
+        requests_made = stub.requests - before
+
+    for name, table in full.items():
+        assert set(pd.read_csv(f"{name}.csv")["id"]) == set(table["id"])
+    # The event page, its eight fight pages, the fight page and the fighter page
+    assert requests_made == 1 + 8 + 1 + 1
+
+
+def test_repair_rescrapes_fighters_with_recorded_hashes(site, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with StubServer(site) as stub:
+        main.main(["--base-url", stub.url, "-b", "-w", "5", "-u"], log=False)
+        fighters = pd.read_csv("fighters.csv")
+        fighters.drop(index=5).to_csv("fighters.csv", index=False)
+        main.main(["--base-url", stub.url, "-w", "5", "-u", "-e", "-f", "-fi", "--repair"], log=False)
+
+    assert set(pd.read_csv("fighters.csv")["id"]) == set(fighters["id"])
+
+
+def test_injected_errors_and_missing_pages(site):
+    with StubServer(site, error_rate=1.0) as stub:
+        assert requests.get(stub.url + "event-details/" + site.id("events", 0)).status_code == 503
+    with StubServer(site) as stub:
+        assert requests.get(stub.url + "event-details/" + site.id("events", 30)).status_code == 404
+        assert requests.get(stub.url + "fight-details/" + site.id("fights", 239)).status_code == 200
+
+
+def test_listing_refresh_fetches_only_changed_fighters(site, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with StubServer(site) as stub:
+        main.main(["--base-url", stub.url, "-b", "-w", "5"], log=False)
+        stored = pd.read_csv("fighters.csv")
+
+        before = stub.requests
+        main.main(["--base-url", stub.url, "-w", "5", "-u", "-e", "-f", "-L"], log=False)
+        # One listing page per letter and no fighter pages
+        assert stub.requests - before == 26
+        pd.testing.assert_frame_equal(pd.read_csv("fighters.csv"), stored)
+
+        site.record[3] = [20, 1, 0]
+        before = stub.requests
+        main.main(["--base-url", stub.url, "-w", "5", "-u", "-e", "-f", "-L"], log=False)
+        assert stub.requests - before == 26 + 1
+
+    fighters = pd.read_csv("fighters.csv").set_index("id")
+    assert fighters.loc[site.id("fighters", 3), ["win", "loss", "draw"]].tolist() == [20, 1, 0]
+    assert len(pd.read_csv("fighter_fights.csv")) == 480
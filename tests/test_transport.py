@@ -0,0 +1,193 @@
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from unittest.mock import MagicMock, Mock, patch
+import pytest
+import requests
+import main
+from benchmarks.ufcstats_stub import SyntheticSite, StubServer
+from scrapers import RequestsTransport, HttpxTransport, ResponseTooLargeError, UFCStatsScraper
+
+
+@pytest.fixture(scope="module")
+def stub():
+    with StubServer(SyntheticSite(events=30, fights=240, fighters=80)) as stub:
+        yield stub
+
+
+def urls(stub, count):
+    return [stub.url + "fighter-details/" + stub.site.id("fighters", i % 80) for i in range(count)]
+
+
+def test_connections_are_kept_alive(stub):
+    transport = RequestsTransport(pool_size=1)
+    for url in urls(stub, 20):
+        assert "Record:" in transport.get(url, {})
+    assert (transport.stats.requests, transport.stats.connections, transport.stats.reused) == (20, 1, 19)
+
+
+def test_pool_matches_concurrency(stub):
+    transport = RequestsTransport(pool_size=8)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda url: transport.get(url, {}), urls(stub, 200)))
+    assert transport.stats.pages == 200
+    assert transport.stats.connections <= 8
+
+
+def test_gzip_is_negotiated_and_counted(stub):
+    transport = RequestsTransport()
+    body = transport.get(stub.url + "statistics/fighters?char=a&page=all", {})
+    assert body.startswith("<html>")
+    assert transport.stats.body_bytes == len(body.encode())
+    assert 0 < transport.stats.wire_bytes < transport.stats.body_bytes / 3
+
+
+def test_oversized_pages_fail(stub):
+    url = stub.url + "statistics/fighters?char=a&page=all"
+    compressed = RequestsTransport()
+    compressed.get(url, {})
+    # Small enough on the wire, too large once decompressed
+    with pytest.raises(ResponseTooLargeError):
+        RequestsTransport(max_bytes=compressed.stats.wire_bytes + 1).get(url, {})
+    with pytest.raises(ResponseTooLargeError):
+        RequestsTransport(max_bytes=compressed.stats.wire_bytes - 1).get(url, {})
+
+
+def test_timeouts_are_separate_from_wait():
+    scraper = UFCStatsScraper(wait_time=10, ignore_errors=False, transport=RequestsTransport(connect_timeout=2, read_timeout=30))
+    response = Mock(headers={}, encoding="utf-8")
+    response.iter_content.return_value = [b"<html></html>"]
+    with patch.object(scraper.session, "get", return_value=response) as get:
+        scraper.fetch_body("http://www.ufcstats.com/")
+    assert get.call_args.kwargs["timeout"] == (2, 30)
+    assert get.call_args.kwargs["stream"] is True
+
+
+def test_httpx_transport(stub):
+    pytest.importorskip("httpx")
+    transport = HttpxTransport(pool_size=1)
+    for url in urls(stub, 5):
+        assert "Record:" in transport.get(url, {})
+    assert (transport.stats.requests, transport.stats.connections) == (5, 1)
+    assert transport.stats.wire_bytes < transport.stats.body_bytes
+    transport.close()
+
+
+def test_main_closes_transport_on_error():
+    transport = MagicMock()
+    with patch.dict(main.TRANSPORTS, {"requests": lambda **options: transport}), patch("main.DataController", side_effect=RuntimeError("disk full")):
+        with pytest.raises(RuntimeError):
+            main.main([], log=False)
+    transport.close.assert_called_once()
+
+
+class Stream():
+    """Stands in for an httpcore network stream; one per connection."""
+
+
+def fake_httpx(responses):
+    """A minimal ``httpx`` module whose client answers with ``responses`` in order.
+
+    Each response is ``(status, body, stream)`` or an exception to raise.
+    """
+    httpx = types.ModuleType("httpx")
+
+    class HTTPError(Exception):
+        pass
+
+    class TransportError(HTTPError):
+        pass
+
+    class TimeoutException(TransportError):
+        pass
+
+    class HTTPStatusError(HTTPError):
+        pass
+
+    class Response():
+        def __init__(self, status, body, stream):
+            self.status_code = status
+            self.body = body
+            self.headers = {"Content-Length": str(len(body))}
+            self.extensions = {"network_stream": stream}
+            self.encoding = "utf-8"
+            self.num_bytes_downloaded = 0
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise HTTPStatusError(f"status {self.status_code}")
+
+        def iter_bytes(self, size):
+            self.num_bytes_downloaded = len(self.body) // 2
+            return [self.body[start:start + size] for start in range(0, len(self.body), size)]
+
+    class Client():
+        def __init__(self, **options):
+            self.options = options
+            self.queue = list(responses)
+
+        @contextmanager
+        def stream(self, method, url, headers=None):
+            item = self.queue.pop(0)
+            if isinstance(item, Exception):
+                raise item
+            yield Response(*item)
+
+        def close(self):
+            pass
+
+    httpx.HTTPError, httpx.TransportError, httpx.TimeoutException, httpx.HTTPStatusError = HTTPError, TransportError, TimeoutException, HTTPStatusError
+    httpx.Client = Client
+    httpx.Limits = lambda **limits: limits
+    httpx.Timeout = lambda read, connect: {"read": read, "connect": connect}
+    httpx.HTTPTransport = lambda retries: {"retries": retries}
+    return httpx
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr("scrapers.transport.time.sleep", lambda seconds: None)
+
+
+def httpx_transport(monkeypatch, responses, **options):
+    httpx = fake_httpx(responses)
+    monkeypatch.setitem(sys.modules, "httpx", httpx)
+    return HttpxTransport(**options), httpx
+
+
+def test_httpx_retries_and_counts_connections(monkeypatch, no_backoff):
+    first, second = Stream(), Stream()
+    transport, _ = httpx_transport(monkeypatch, [(503, b"", first), (200, b"<html>one</html>", first), (200, b"<html>two</html>", second)], pool_size=4, connect_timeout=2, read_timeout=30)
+    assert transport.session.options["timeout"] == {"read": 30, "connect": 2}
+    assert transport.session.options["limits"]["max_keepalive_connections"] == 4
+
+    assert transport.get("http://stub/1", {}) == "<html>one</html>"
+    assert transport.get("http://stub/2", {}) == "<html>two</html>"
+    stats = transport.stats
+    assert (stats.pages, stats.requests, stats.connections, stats.reused) == (2, 3, 2, 1)
+    assert (stats.wire_bytes, stats.body_bytes) == (16, 32)
+
+
+def test_httpx_errors_are_requests_errors(monkeypatch, no_backoff):
+    transport, httpx = httpx_transport(monkeypatch, [], retries=1)
+    transport.session.queue = [httpx.TimeoutException("read timed out")]
+    with pytest.raises(requests.Timeout):
+        transport.get("http://stub/1", {})
+    transport.session.queue = [httpx.TransportError("connection refused")]
+    with pytest.raises(requests.ConnectionError):
+        transport.get("http://stub/1", {})
+    # Retries exhausted: the last status is raised
+    transport.session.queue = [(503, b"", Stream()), (503, b"", Stream())]
+    with pytest.raises(requests.HTTPError):
+        transport.get("http://stub/1", {})
+    transport.session.queue = [(200, b"x" * 100, Stream())]
+    transport.max_bytes = 10
+    with pytest.raises(ResponseTooLargeError):
+        transport.get("http://stub/1", {})
+
+
+def test_httpx_missing(monkeypatch):
+    monkeypatch.setitem(sys.modules, "httpx", None)
+    with pytest.raises(ImportError, match="httpx package"):
+        HttpxTransport()